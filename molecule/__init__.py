@@ -21,4 +21,12 @@
 import pbr.version
 
 version_info = pbr.version.VersionInfo('molecule')  # noqa
-__version__ = version_info.release_string()
+
+# NOTE: Reading the installed package's metadata directly is much cheaper than
+# pbr's lookup, which imports pkg_resources and setuptools, and otherwise
+# dominates the CLI's startup time.  pbr is used for uninstalled trees.
+try:
+    import importlib.metadata
+    __version__ = importlib.metadata.version('molecule')
+except Exception:
+    __version__ = version_info.release_string()
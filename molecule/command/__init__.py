@@ -36,4 +36,6 @@ from molecule.command import side_effect  # noqa
 from molecule.command import syntax  # noqa
 from molecule.command import test  # noqa
 from molecule.command import verify  # noqa
+from molecule.command import watch  # noqa
+from molecule.command.cache import cache  # noqa
 from molecule.command.init import init  # noqa
@@ -18,19 +18,31 @@
 #  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 #  DEALINGS IN THE SOFTWARE.
 
+from __future__ import print_function
+
 import abc
 import collections
+import functools
 import glob
+import multiprocessing
 import os
+import sys
+import tempfile
+import traceback
 
 import molecule.command
 from molecule import config
 from molecule import logger
 from molecule import util
+from molecule.lint import cache
 
 LOG = logger.get_logger(__name__)
 MOLECULE_GLOB = 'molecule/*/molecule.yml'
 
+# NOTE: The driver semaphores, inherited by the worker processes of
+# `execute_parallel`.
+_semaphores = {}
+
 
 class Base(object):
     """
@@ -55,7 +67,7 @@ class Base(object):
     def prune(self):
         """
         Prune the ephemeral directory with the exception of safe files and
-        returns None.
+        the lint caches, and returns None.
 
         :return: None
         """
@@ -63,7 +75,9 @@ class Base(object):
             self._config.provisioner.config_file,
             self._config.provisioner.inventory_file,
             self._config.state.state_file,
-        ] + self._config.driver.safe_files
+        ] + self._config.driver.safe_files + glob.glob(
+            os.path.join(self._config.scenario.ephemeral_directory,
+                         cache.CACHE_FILE.format('*')))
 
         files = util.os_walk(self._config.scenario.ephemeral_directory, '*')
         for f in files:
@@ -96,42 +110,250 @@ def execute_subcommand(config, subcommand):
     command_module = getattr(molecule.command, subcommand)
     command = getattr(command_module, util.camelize(subcommand))
 
-    return command(config).execute()
+    with config.report.action(subcommand):
+        return command(config).execute()
+
+
+def execute_parallel(scenarios, func, processes, limit_by_driver=False):
+    """
+    Execute the given function against each scenario in a pool of worker
+    processes and returns None.  When limited by driver, no more scenarios
+    than their driver's `concurrency` execute at once.  A scenario waiting on
+    its driver holds a worker process, so the scenarios are interleaved by
+    driver, to keep the other drivers' scenarios from queueing behind it.
+
+    The output of each scenario is buffered, and printed prefixed with the
+    scenario's name once the scenario completes.  A summary is printed at the
+    conclusion of the run, and Molecule exits non-zero if any scenario failed.
+
+    :param scenarios: An iterable of scenario objects.
+    :param func: A module level function which accepts a scenario object.
+    :param processes: An int containing the number of worker processes.
+    :param limit_by_driver: An optional bool to limit the scenarios executed
+     at once per driver.
+    :return: None
+    """
+    scenarios = list(scenarios)
+    semaphores = {}
+    if limit_by_driver:
+        scenarios = _interleave_by_driver(scenarios)
+        semaphores = _get_driver_semaphores(scenarios)
+        func = functools.partial(_execute_limited, func)
+    pool = multiprocessing.Pool(
+        processes,
+        initializer=_semaphores.update,
+        initargs=(semaphores, ),
+        maxtasksperchild=1)
+    results = []
+    try:
+        for scenario_name, code, output in pool.imap_unordered(
+                functools.partial(_execute_buffered, func), scenarios):
+            for line in output.splitlines():
+                print('[{}] {}'.format(scenario_name, line))
+            results.append((scenario_name, code))
+        pool.close()
+    finally:
+        pool.terminate()
+        pool.join()
+
+    _summarize(results)
+
+
+def execute_serial(scenarios, func):
+    """
+    Execute the given function against each scenario in turn and returns
+    None.  A failed scenario does not stop the others from executing.  A
+    summary is printed at the conclusion of the run, and Molecule exits
+    non-zero if any scenario failed.
+
+    :param scenarios: An iterable of scenario objects.
+    :param func: A function which accepts a scenario object.
+    :return: None
+    """
+    results = []
+    for scenario in scenarios:
+        code = 0
+        try:
+            func(scenario)
+        except SystemExit as e:
+            code = _exit_code(e.code)
+        except Exception:
+            traceback.print_exc()
+            code = 1
+        results.append((scenario.name, code))
+
+    _summarize(results)
+
+
+def _summarize(results):
+    """
+    Print the outcome of each scenario, exit non-zero if any scenario failed,
+    and returns None.
+
+    :param results: A list of tuples containing a scenario name and its exit
+     code.
+    :return: None
+    """
+    msg = 'Summary'
+    LOG.info(msg)
+    for scenario_name, code in sorted(results):
+        if code == 0:
+            msg = "Scenario '{}' completed successfully.".format(scenario_name)
+            LOG.success(msg)
+        else:
+            msg = "Scenario '{}' failed with exit code {}.".format(
+                scenario_name, code)
+            LOG.error(msg)
+
+    if any(code != 0 for _, code in results):
+        util.sysexit()
+
+
+def _interleave_by_driver(scenarios):
+    """
+    Order the scenarios by taking one of each driver in turn, keeping their
+    order per driver, and returns a list.
+
+    :param scenarios: A list of scenario objects.
+    :return: list
+    """
+    by_driver = collections.OrderedDict()
+    for scenario in scenarios:
+        by_driver.setdefault(scenario.config.driver.name, []).append(scenario)
+
+    interleaved = []
+    while by_driver:
+        for name in list(by_driver):
+            interleaved.append(by_driver[name].pop(0))
+            if not by_driver[name]:
+                del by_driver[name]
+
+    return interleaved
+
+
+def _get_driver_semaphores(scenarios):
+    """
+    Create a semaphore per driver, admitting the smallest `concurrency` of
+    the scenarios using the driver, and returns a dict keyed by driver name.
+
+    :param scenarios: A list of scenario objects.
+    :return: dict
+    """
+    limits = {}
+    for scenario in scenarios:
+        driver = scenario.config.driver
+        limits[driver.name] = min(
+            limits.get(driver.name, driver.concurrency), driver.concurrency)
+
+    return {
+        name: multiprocessing.BoundedSemaphore(limit)
+        for name, limit in limits.items()
+    }
+
+
+def _execute_limited(func, scenario):
+    """
+    Execute the given function against the scenario once its driver's
+    semaphore is acquired and returns None.
+
+    :param func: A function which accepts a scenario object.
+    :param scenario: A scenario object.
+    :return: None
+    """
+    with _semaphores[scenario.config.driver.name]:
+        func(scenario)
 
 
-def get_configs(args, command_args, ansible_args=()):
+def _execute_buffered(func, scenario):
+    """
+    Execute the given function against the scenario with stdout and stderr
+    redirected to a temporary file and returns a tuple.
+
+    :param func: A function which accepts a scenario object.
+    :param scenario: A scenario object.
+    :return: tuple
+    """
+    fds = [sys.__stdout__.fileno(), sys.__stderr__.fileno()]
+    saved_fds = [os.dup(fd) for fd in fds]
+    with tempfile.TemporaryFile() as f:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        for fd in fds:
+            os.dup2(f.fileno(), fd)
+
+        code = 0
+        try:
+            func(scenario)
+        except SystemExit as e:
+            code = _exit_code(e.code)
+        except Exception:
+            traceback.print_exc()
+            code = 1
+        finally:
+            sys.stdout.flush()
+            sys.stderr.flush()
+            for fd, saved_fd in zip(fds, saved_fds):
+                os.dup2(saved_fd, fd)
+                os.close(saved_fd)
+
+        f.seek(0)
+        output = f.read().decode('utf-8', 'replace')
+
+    return scenario.name, code, output
+
+
+def _exit_code(code):
+    if code is None:
+        return 0
+    elif isinstance(code, int):
+        return code
+
+    return 1
+
+
+def get_configs(args, command_args, ansible_args=(), scenario_name=None):
     """
     Glob the current directory for Molecule config files, instantiate config
-    objects, and returns a list.
+    objects for the targeted scenarios, and returns a list.
+
+    The scenario names are indexed by reading each Molecule config file, and
+    only the targeted scenario's config objects are instantiated, since
+    building a config object merges and validates the whole file.
 
     :param args: A dict of options, arguments and commands from the CLI.
     :param command_args: A dict of options passed to the subcommand from
      the CLI.
     :param ansible_args: An optional tuple of arguments provided to the
      `ansible-playbook` command.
+    :param scenario_name: An optional string containing the name of the
+     scenario to target.  All scenarios are targeted when None.
     :return: list
     """
-    configs = [
+    scenarios = [(config.scenario_name(c), util.abs_path(c))
+                 for c in glob.glob(MOLECULE_GLOB)]
+    _verify_configs(scenarios)
+
+    return [
         config.Config(
-            molecule_file=util.abs_path(c),
+            molecule_file=molecule_file,
             args=args,
             command_args=command_args,
-            ansible_args=ansible_args, ) for c in glob.glob(MOLECULE_GLOB)
+            ansible_args=ansible_args, ) for name, molecule_file in scenarios
+        if scenario_name is None or name == scenario_name
     ]
-    _verify_configs(configs)
-
-    return configs
 
 
-def _verify_configs(configs):
+def _verify_configs(scenarios):
     """
-    Verify a Molecule config was found and returns None.
+    Verify a Molecule config was found, and the scenario names are unique, and
+    returns None.
 
-    :param configs: A list containing absolute paths to Molecule config files.
+    :param scenarios: A list of tuples containing a scenario name and the
+     absolute path to its Molecule config file.
     :return: None
     """
-    if configs:
-        scenario_names = [c.scenario.name for c in configs]
+    if scenarios:
+        scenario_names = [name for name, _ in scenarios]
         for scenario_name, n in collections.Counter(scenario_names).items():
             if n > 1:
                 msg = ("Duplicate scenario name '{}' found.  "
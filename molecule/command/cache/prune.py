@@ -0,0 +1,153 @@
+#  Copyright (c) 2015-2017 Cisco Systems, Inc.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to
+#  deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+#  sell copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+
+import collections
+import re
+
+import click
+import sh
+
+from molecule import logger
+from molecule import util
+
+LOG = logger.get_logger(__name__)
+
+CACHE_REPOSITORY = 'molecule_local/*'
+CACHE_TAG_REGEX = re.compile(r'^[0-9a-f]{40}$')
+
+
+class Prune(object):
+    """
+    Remove cached Docker images, keeping the most recently used image for each
+    platform image:
+
+    >>> molecule cache prune
+
+    Keep the three most recently used images for each platform image:
+
+    >>> molecule cache prune --keep 3
+
+    The docker driver's create playbook tags the images it builds with a hash
+    of the rendered Dockerfile and the base image, and re-tags the image each
+    time it is used.  Images are evicted in least recently used order.
+    """
+
+    def __init__(self, command_args):
+        self._command_args = command_args
+
+    def execute(self):
+        """
+        Execute the actions necessary to perform a `molecule cache prune` and
+        returns None.
+
+        :return: None
+        """
+        keep = self._command_args['keep']
+        msg = 'Pruning cached images...'
+        LOG.info(msg)
+
+        removed = 0
+        cached_images = self._cached_images()
+        for repository in sorted(cached_images):
+            images = sorted(
+                cached_images[repository],
+                key=lambda image: image['last_tag_time'],
+                reverse=True)
+            for image in images[keep:]:
+                self._remove(image['reference'])
+                removed += 1
+
+        msg = 'Pruned {} cached image(s).'.format(removed)
+        LOG.success(msg)
+
+    def _cached_images(self):
+        """
+        Discover the images built by the docker driver's create playbook and
+        returns a dict of images, keyed by repository.
+
+        :return: dict
+        """
+        references = []
+        for line in self._run('images', '--filter',
+                              'reference={}'.format(CACHE_REPOSITORY),
+                              '--format', '{{.Repository}}:{{.Tag}}'):
+            repository, _, tag = line.rpartition(':')
+            if CACHE_TAG_REGEX.match(tag):
+                references.append(line)
+
+        d = collections.defaultdict(list)
+        if not references:
+            return d
+
+        last_tag_times = self._run('image', 'inspect', '--format',
+                                   '{{.Metadata.LastTagTime.UnixNano}}',
+                                   *references)
+        for reference, last_tag_time in zip(references, last_tag_times):
+            repository, _, _ = reference.rpartition(':')
+            d[repository].append({
+                'reference': reference,
+                'last_tag_time': int(last_tag_time),
+            })
+
+        return d
+
+    def _remove(self, reference):
+        msg = 'Removing {}'.format(reference)
+        LOG.info(msg)
+        self._run('rmi', reference)
+
+    def _run(self, *args):
+        """
+        Execute `docker` with the given arguments and returns a list of the
+        non-empty lines it printed.
+
+        :param args: The arguments to pass to `docker`.
+        :return: list
+        """
+        try:
+            cmd = sh.docker.bake(*args)
+            output = util.run_command(cmd)
+        except sh.CommandNotFound:
+            msg = "Unable to find 'docker' executable."
+            util.sysexit_with_message(msg)
+        except sh.ErrorReturnCode as e:
+            util.sysexit_with_message(e.stderr.decode('utf-8'), e.exit_code)
+
+        return [
+            line for line in output.stdout.decode('utf-8').splitlines() if line
+        ]
+
+
+@click.command()
+@click.pass_context
+@click.option(
+    '--keep',
+    default=1,
+    type=click.IntRange(min=0),
+    help='Number of cached images to keep for each platform image. (1)')
+def prune(ctx, keep):  # pragma: no cover
+    """ Evict least recently used images from the image cache. """
+    command_args = {
+        'subcommand': __name__,
+        'keep': keep,
+    }
+
+    p = Prune(command_args)
+    p.execute()
@@ -71,7 +71,8 @@ def check(ctx, scenario_name):  # pragma: no cover
     }
 
     s = scenarios.Scenarios(
-        base.get_configs(args, command_args), scenario_name)
+        base.get_configs(args, command_args, scenario_name=scenario_name),
+        scenario_name)
     s.print_matrix()
     for scenario in s:
         for term in scenario.sequence:
@@ -44,6 +44,12 @@ class Converge(base.Base):
 
     >>> molecule converge -- -vvv -tags foo,bar
 
+    Converging is skipped when the instances are converged, and the role,
+    playbook, inventory and `ansible-playbook` options are unchanged since.
+    Force the converge:
+
+    >>> molecule converge --force
+
     Executing with `debug`:
 
     >>> molecule --debug converge
@@ -57,8 +63,36 @@ class Converge(base.Base):
         :return: None
         """
         self.print_info()
+        fingerprint = self._config.provisioner.fingerprint()
+        if self._unchanged(fingerprint):
+            msg = 'Skipping, instances converged and inputs unchanged.'
+            LOG.warn(msg)
+            return
+
         self._config.provisioner.converge()
-        self._config.state.change_state('converged', True)
+        self._config.state.remove_fact_cache()
+        with self._config.state.batch():
+            self._config.state.change_state('converged', True)
+            self._config.state.change_state('converge_fingerprint',
+                                            fingerprint)
+            self._config.state.change_state(
+                'converge_changed_tasks',
+                self._config.provisioner.changed_tasks())
+
+    def _unchanged(self, fingerprint):
+        """
+        Determine if the instances were converged with the same inputs, and
+        returns a bool.
+
+        :param fingerprint: A string containing the digest of the converge's
+         inputs.
+        :return: bool
+        """
+        if self._config.command_args.get('force'):
+            return False
+
+        return (self._config.state.converged
+                and self._config.state.converge_fingerprint == fingerprint)
 
 
 @click.command()
@@ -68,17 +102,24 @@ class Converge(base.Base):
     '-s',
     default='default',
     help='Name of the scenario to target. (default)')
+@click.option(
+    '--force/--no-force',
+    default=False,
+    help='Converge even if the inputs are unchanged. Default is False.')
 @click.argument('ansible_args', nargs=-1, type=click.UNPROCESSED)
-def converge(ctx, scenario_name, ansible_args):  # pragma: no cover
+def converge(ctx, scenario_name, force, ansible_args):  # pragma: no cover
     """ Use the provisioner to configure instances (create, converge). """
     args = ctx.obj.get('args')
     subcommand = base._get_subcommand(__name__)
     command_args = {
         'subcommand': subcommand,
+        'force': force,
     }
 
     s = scenarios.Scenarios(
-        base.get_configs(args, command_args, ansible_args), scenario_name)
+        base.get_configs(
+            args, command_args, ansible_args, scenario_name=scenario_name),
+        scenario_name)
     s.print_matrix()
     for scenario in s:
         for term in scenario.sequence:
@@ -34,6 +34,11 @@ class Create(base.Base):
 
     >>> molecule create
 
+    Target all scenarios, a failed scenario does not stop the others, and the
+    failures are summarized once every scenario completes:
+
+    >>> molecule create --all
+
     Targeting a specific scenario:
 
     >>> molecule create --scenario-name foo
@@ -45,6 +50,14 @@ class Create(base.Base):
     Executing with `debug`:
 
     >>> molecule --debug create
+
+    Create all scenarios, up to four scenarios concurrently.  No more
+    scenarios than the `concurrency` option of their driver are created at
+    once.  The output of each scenario is buffered and prefixed with the
+    scenario's name, and the failures are summarized once every scenario
+    completes:
+
+    >>> molecule create --all --parallel 4
     """
 
     def execute(self):
@@ -70,6 +83,24 @@ class Create(base.Base):
         self._config.provisioner.create()
         self._config.state.change_state('created', True)
 
+        if self._config.driver.snapshot:
+            self._snapshot()
+
+    def _snapshot(self):
+        """
+        Snapshot the newly created instances, so `molecule test` can restore
+        them rather than destroying and recreating them, and returns None.
+
+        :return: None
+        """
+        if not self._config.provisioner.playbooks.snapshot:
+            msg = 'Skipping snapshot, snapshot playbook not configured.'
+            LOG.warn(msg)
+            return
+
+        self._config.provisioner.snapshot()
+        self._config.state.change_state('snapshotted', True)
+
 
 @click.command()
 @click.pass_context
@@ -83,7 +114,18 @@ class Create(base.Base):
     '-d',
     type=click.Choice(config.molecule_drivers()),
     help='Name of driver to use. (docker)')
-def create(ctx, scenario_name, driver_name):  # pragma: no cover
+@click.option(
+    '--all/--no-all',
+    '__all',
+    default=False,
+    help='Start all scenarios. Default is False.')
+@click.option(
+    '--parallel',
+    type=click.IntRange(min=1),
+    default=1,
+    help='Number of scenarios to start concurrently. Default is 1.')
+def create(ctx, scenario_name, driver_name, __all,
+           parallel):  # pragma: no cover
     """ Start instances. """
     args = ctx.obj.get('args')
     subcommand = base._get_subcommand(__name__)
@@ -92,9 +134,29 @@ def create(ctx, scenario_name, driver_name):  # pragma: no cover
         'driver_name': driver_name,
     }
 
+    if __all:
+        scenario_name = None
+
     s = scenarios.Scenarios(
-        base.get_configs(args, command_args), scenario_name)
+        base.get_configs(args, command_args, scenario_name=scenario_name),
+        scenario_name)
     s.print_matrix()
-    for scenario in s:
-        for term in scenario.sequence:
-            base.execute_subcommand(scenario.config, term)
+    if parallel > 1:
+        base.execute_parallel(
+            s, _execute_sequence, parallel, limit_by_driver=True)
+    elif __all:
+        base.execute_serial(s, _execute_sequence)
+    else:
+        for scenario in s:
+            _execute_sequence(scenario)
+
+
+def _execute_sequence(scenario):
+    """
+    Execute the scenario's create sequence and returns None.
+
+    :param scenario: A scenario object.
+    :return: None
+    """
+    for term in scenario.sequence:
+        base.execute_subcommand(scenario.config, term)
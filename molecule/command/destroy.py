@@ -34,7 +34,8 @@ class Destroy(base.Base):
 
     >>> molecule destroy
 
-    Target all scenarios:
+    Target all scenarios, a failed scenario does not stop the others, and the
+    failures are summarized once every scenario completes:
 
     >>> molecule destroy --all
 
@@ -49,6 +50,14 @@ class Destroy(base.Base):
     Executing with `debug`:
 
     >>> molecule --debug destroy
+
+    Destroy all scenarios, up to four scenarios concurrently.  No more
+    scenarios than the `concurrency` option of their driver are destroyed at
+    once.  The output of each scenario is buffered and prefixed with the
+    scenario's name, and the failures are summarized once every scenario
+    completes:
+
+    >>> molecule destroy --all --parallel 4
     """
 
     def execute(self):
@@ -66,9 +75,30 @@ class Destroy(base.Base):
             LOG.warn(msg)
             return
 
+        if self._restorable():
+            msg = 'Restoring instances from snapshot.'
+            LOG.info(msg)
+            self._config.provisioner.restore()
+            self._config.state.change_state('converged', False)
+            self._config.state.remove_fact_cache()
+            return
+
         self._config.provisioner.destroy()
         self._config.state.reset()
 
+    def _restorable(self):
+        """
+        Determine if the instances can be restored from their snapshot, rather
+        than destroyed, and returns a bool.  Only `molecule test` restores
+        instances, an explicit `molecule destroy` always destroys them.
+
+        :return: bool
+        """
+        return (self._config.subcommand == 'test'
+                and self._config.driver.snapshot
+                and self._config.state.snapshotted
+                and bool(self._config.provisioner.playbooks.restore))
+
 
 @click.command()
 @click.pass_context
@@ -87,7 +117,13 @@ class Destroy(base.Base):
     '__all',
     default=False,
     help='Destroy all scenarios. Default is False.')
-def destroy(ctx, scenario_name, driver_name, __all):  # pragma: no cover
+@click.option(
+    '--parallel',
+    type=click.IntRange(min=1),
+    default=1,
+    help='Number of scenarios to destroy concurrently. Default is 1.')
+def destroy(ctx, scenario_name, driver_name, __all,
+            parallel):  # pragma: no cover
     """ Destroy instances. """
     args = ctx.obj.get('args')
     subcommand = base._get_subcommand(__name__)
@@ -100,8 +136,25 @@ def destroy(ctx, scenario_name, driver_name, __all):  # pragma: no cover
         scenario_name = None
 
     s = scenarios.Scenarios(
-        base.get_configs(args, command_args), scenario_name)
+        base.get_configs(args, command_args, scenario_name=scenario_name),
+        scenario_name)
     s.print_matrix()
-    for scenario in s:
-        for term in scenario.sequence:
-            base.execute_subcommand(scenario.config, term)
+    if parallel > 1:
+        base.execute_parallel(
+            s, _execute_sequence, parallel, limit_by_driver=True)
+    elif __all:
+        base.execute_serial(s, _execute_sequence)
+    else:
+        for scenario in s:
+            _execute_sequence(scenario)
+
+
+def _execute_sequence(scenario):
+    """
+    Execute the scenario's destroy sequence and returns None.
+
+    :param scenario: A scenario object.
+    :return: None
+    """
+    for term in scenario.sequence:
+        base.execute_subcommand(scenario.config, term)
@@ -18,8 +18,6 @@
 #  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 #  DEALINGS IN THE SOFTWARE.
 
-import re
-
 import click
 
 from molecule import logger
@@ -43,6 +41,11 @@ class Idempotence(base.Base):
     Executing with `debug`:
 
     >>> molecule --debug idempotence
+
+    The converge playbook is replayed in full unless the provisioner's
+    `idempotence` section enables check mode, starting at the first task
+    which changed during the last converge, or sharding by host group.  The
+    playbook is replayed in full when the last converge changed no task.
     """
 
     def execute(self):
@@ -57,61 +60,55 @@ class Idempotence(base.Base):
             msg = 'Instances not converged.  Please converge instances first.'
             util.sysexit_with_message(msg)
 
-        output = self._config.provisioner.converge(out=None, err=None)
-
-        idempotent = self._is_idempotent(output)
-        if idempotent:
+        options = self._config.config['provisioner']['idempotence']
+        start_at_task = None
+        changed_tasks = self._config.state.converge_changed_tasks
+        if options['start_at_changed'] and changed_tasks:
+            start_at_task = changed_tasks[0]
+            msg = ("Starting idempotence at '{}', the first task changed by "
+                   'the last converge.  This is a heuristic, the facts set or '
+                   'registered by the skipped tasks are not available to '
+                   'the later tasks.').format(start_at_task)
+            LOG.warn(msg)
+
+        self._config.provisioner.idempotence(
+            check_mode=options['check_mode'], start_at_task=start_at_task)
+
+        tasks = self._non_idempotent_tasks(self._config.provisioner.events())
+        if tasks is None:
+            msg = ('Idempotence test failed because no events were read from '
+                   'the `molecule_events` callback plugin.  Please ensure '
+                   'the callback plugin is not disabled.')
+            util.sysexit_with_message(msg)
+        elif not tasks:
             msg = 'Idempotence completed successfully.'
             LOG.success(msg)
         else:
             msg = ('Idempotence test failed because of the following tasks:\n'
-                   '{}').format('\n'.join(self._non_idempotent_tasks(output)))
+                   '{}').format('\n'.join(tasks))
             util.sysexit_with_message(msg)
 
-    def _is_idempotent(self, output):
-        """
-        Parses the output of the provisioning for changed and returns a bool.
-
-        :param output: A string containing the output of the ansible run.
-        :return: bool
-        """
-
-        # Remove blank lines to make regex matches easier
-        output = re.sub(r'\n\s*\n*', '\n', output)
-
-        # Look for any non-zero changed lines
-        changed = re.search(r'(changed=[1-9][0-9]*)', output)
-
-        if changed:
-            # Not idempotent
-            return False
-
-        return True
-
-    def _non_idempotent_tasks(self, output):
+    def _non_idempotent_tasks(self, events):
         """
-        Parses the output to identify the non idempotent tasks.
-
-        :param (str) output: A string containing the output of the ansible run.
-        :return: A list containing the names of the non idempotent tasks.
+        Parses the provisioner's events to identify the non idempotent tasks.
+        The events are consumed once, as they are read.
+
+        :param events: An iterable of dicts emitted by the `molecule_events`
+         callback plugin.
+        :return: A list containing the names of the non idempotent tasks, or
+         None when the events lack the run's stats, as the run's outcome is
+         then unknown.
         """
-        # Remove blank lines to make regex matches easier.
-        output = re.sub(r'\n\s*\n*', '\n', output)
-
-        # Remove ansi escape sequences.
-        output = util.strip_ansi_escape(output)
-
-        # Split the output into a list and go through it.
-        output_lines = output.split('\n')
         res = []
-        task_line = ''
-        for _, line in enumerate(output_lines):
-            if line.startswith('TASK'):
-                task_line = line
-            elif line.startswith('changed'):
-                host_name = re.search(r'\[(.*)\]', line).groups()[0]
-                task_name = re.search(r'\[(.*)\]', task_line).groups()[0]
-                res.append('* [{}] => {}'.format(host_name, task_name))
+        stats = False
+        for event in events:
+            if event.get('event') == 'stats':
+                stats = True
+            elif event.get('event') == 'ok' and event.get('changed'):
+                res.append('* [{}] => {}'.format(event['host'], event['task']))
+
+        if not stats:
+            return
 
         return res
 
@@ -135,7 +132,8 @@ def idempotence(ctx, scenario_name):  # pragma: no cover
     }
 
     s = scenarios.Scenarios(
-        base.get_configs(args, command_args), scenario_name)
+        base.get_configs(args, command_args, scenario_name=scenario_name),
+        scenario_name)
     s.print_matrix()
     for scenario in s:
         for term in scenario.sequence:
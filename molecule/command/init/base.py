@@ -21,9 +21,6 @@
 import abc
 import os
 
-import cookiecutter
-import cookiecutter.main
-
 from molecule import logger
 
 LOG = logger.get_logger(__name__)
@@ -51,6 +48,9 @@ class Base(object):
          templates.
         :return: None
         """
+        # Only `init` renders templates, so cookiecutter is loaded here.
+        import cookiecutter.main
+
         template_dir = self._resolve_template_dir(template_dir)
 
         cookiecutter.main.cookiecutter(
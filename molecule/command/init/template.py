@@ -21,8 +21,6 @@
 import os
 
 import click
-import cookiecutter
-import cookiecutter.main
 
 from molecule import logger
 from molecule import util
@@ -61,6 +59,8 @@ class Template(base.Base):
                    'Cannot create new role.').format(role_name)
             util.sysexit_with_message(msg)
 
+        import cookiecutter.main
+
         cookiecutter.main.cookiecutter(
             url,
             extra_context=self._command_args,
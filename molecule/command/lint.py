@@ -18,10 +18,16 @@
 #  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 #  DEALINGS IN THE SOFTWARE.
 
+from __future__ import print_function
+
+import multiprocessing
+import time
+
 import click
 
 from molecule import logger
 from molecule import scenarios
+from molecule import util
 from molecule.command import base
 
 LOG = logger.get_logger(__name__)
@@ -37,9 +43,20 @@ class Lint(base.Base):
 
     >>> molecule lint --scenario-name foo
 
+    Lint every file, rather than only the files changed since the last run:
+
+    >>> molecule lint --no-cache
+
     Executing with `debug`:
 
     >>> molecule --debug lint
+
+    The project, verifier and provisioner linters run concurrently, each in
+    its own worker process.  The output of each linter is buffered, and
+    printed prefixed with the linter's name once it completes, followed by a
+    summary of each linter's result and duration.  The linters run serially
+    when the scenario itself runs in a worker process, as with
+    `molecule test --parallel`.
     """
 
     def execute(self):
@@ -59,9 +76,70 @@ class Lint(base.Base):
             ] if l
         ]
 
+        # Scenarios run in parallel execute in daemonic pool workers, which
+        # may not start a pool of their own.
+        if len(linters) > 1 and not multiprocessing.current_process().daemon:
+            self._execute_concurrently(linters)
+            return
+
         for l in linters:
             l.execute()
 
+    def _execute_concurrently(self, linters):
+        """
+        Execute the linters in a pool of worker processes, print a summary,
+        and returns None.  Molecule exits non-zero if any linter failed.
+
+        :param linters: A list of linter objects.
+        :return: None
+        """
+        pool = multiprocessing.Pool(len(linters))
+        results = {}
+        try:
+            for name, code, output, duration in pool.imap_unordered(
+                    _execute_timed, linters):
+                for line in output.splitlines():
+                    print('[{}] {}'.format(name, line))
+                results[name] = (code, duration)
+            pool.close()
+        finally:
+            pool.terminate()
+            pool.join()
+
+        msg = 'Summary'
+        LOG.info(msg)
+        for linter in linters:
+            code, duration = results[linter.name]
+            if code == 0:
+                msg = "Linter '{}' completed successfully in {:.2f}s.".format(
+                    linter.name, duration)
+                LOG.success(msg)
+            else:
+                msg = "Linter '{}' failed with exit code {} in {:.2f}s."
+                msg = msg.format(linter.name, code, duration)
+                LOG.error(msg)
+
+        if any(code != 0 for code, _ in results.values()):
+            util.sysexit()
+
+
+def _execute_timed(linter):
+    """
+    Execute the linter with its output buffered, and returns a tuple of its
+    name, exit code, output and duration.
+
+    :param linter: A linter object.
+    :return: tuple
+    """
+    start = time.time()
+    name, code, output = base._execute_buffered(_execute_linter, linter)
+
+    return name, code, output, time.time() - start
+
+
+def _execute_linter(linter):
+    linter.execute()
+
 
 @click.command()
 @click.pass_context
@@ -70,16 +148,23 @@ class Lint(base.Base):
     '-s',
     default='default',
     help='Name of the scenario to target. (default)')
-def lint(ctx, scenario_name):  # pragma: no cover
+@click.option(
+    '--cache/--no-cache',
+    default=True,
+    help='Lint only the files changed since they last passed. Default is True.'
+)
+def lint(ctx, scenario_name, cache):  # pragma: no cover
     """ Lint the role. """
     args = ctx.obj.get('args')
     subcommand = base._get_subcommand(__name__)
     command_args = {
         'subcommand': subcommand,
+        'cache': cache,
     }
 
     s = scenarios.Scenarios(
-        base.get_configs(args, command_args), scenario_name)
+        base.get_configs(args, command_args, scenario_name=scenario_name),
+        scenario_name)
     s.print_matrix()
     for scenario in s:
         for term in scenario.sequence:
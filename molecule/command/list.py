@@ -21,7 +21,6 @@
 from __future__ import print_function
 
 import click
-import tabulate
 
 from molecule import logger
 from molecule import scenarios
@@ -52,6 +51,15 @@ class List(base.Base):
     >>> molecule --debug list
     """
 
+    def _setup(self):
+        """
+        Listing does not use the provisioner, so it is not prepared, and
+        returns None.
+
+        :return: None
+        """
+        pass
+
     def execute(self):
         """
         Execute the actions necessary to perform a `molecule list` and
@@ -81,7 +89,8 @@ def list(ctx, scenario_name, format):  # pragma: no cover
 
     statuses = []
     s = scenarios.Scenarios(
-        base.get_configs(args, command_args), scenario_name)
+        base.get_configs(args, command_args, scenario_name=scenario_name),
+        scenario_name)
     for scenario in s:
         statuses.extend(base.execute_subcommand(scenario.config, subcommand))
 
@@ -104,6 +113,8 @@ def _print_tabulate_data(headers, data, table_format):  # pragma: no cover
     :param data:  A list of tabular data to display.
     :returns: None
     """
+    import tabulate
+
     print(tabulate.tabulate(data, headers, tablefmt=table_format))
 
 
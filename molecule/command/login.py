@@ -26,7 +26,6 @@ import sys
 import termios
 
 import click
-import pexpect
 
 from molecule import logger
 from molecule import scenarios
@@ -59,6 +58,15 @@ class Login(base.Base):
         super(Login, self).__init__(c)
         self._pt = None
 
+    def _setup(self):
+        """
+        Logging in does not use the provisioner, so it is not prepared, and
+        returns None.
+
+        :return: None
+        """
+        pass
+
     def execute(self):
         """
         Execute the actions necessary to perform a `molecule login` and
@@ -109,6 +117,8 @@ class Login(base.Base):
         return match[0]
 
     def _get_login(self, hostname):  # pragma: no cover
+        import pexpect
+
         login_options = self._config.driver.login_options(hostname)
         login_cmd = self._config.driver.login_cmd_template.format(
             **login_options)
@@ -148,6 +158,7 @@ def login(ctx, host, scenario_name):  # pragma: no cover
     }
 
     s = scenarios.Scenarios(
-        base.get_configs(args, command_args), scenario_name)
+        base.get_configs(args, command_args, scenario_name=scenario_name),
+        scenario_name)
     for scenario in s.all:
         base.execute_subcommand(scenario.config, subcommand)
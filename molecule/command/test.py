@@ -18,6 +18,8 @@
 #  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 #  DEALINGS IN THE SOFTWARE.
 
+import functools
+
 import click
 
 from molecule import config
@@ -54,6 +56,12 @@ class Test(base.Base):
     Always destroy instances at the conclusion of a Molecule run:
 
     >>> molecule test --destroy=always
+
+    Test all scenarios, running up to four scenarios concurrently.  The
+    output of each scenario is buffered and prefixed with the scenario's
+    name, followed by a summary of the results:
+
+    >>> molecule test --all --parallel 4
     """
 
     def execute(self):
@@ -88,7 +96,13 @@ class Test(base.Base):
     default='never',
     help=('The destroy strategy used at the conclusion of a '
           'Molecule run (never).'))
-def test(ctx, scenario_name, driver_name, __all, destroy):  # pragma: no cover
+@click.option(
+    '--parallel',
+    type=click.IntRange(min=1),
+    default=1,
+    help='Number of scenarios to test concurrently. Default is 1.')
+def test(ctx, scenario_name, driver_name, __all, destroy,
+         parallel):  # pragma: no cover
     """ Test (destroy, create, converge, lint, verify, destroy). """
     args = ctx.obj.get('args')
     subcommand = base._get_subcommand(__name__)
@@ -101,17 +115,34 @@ def test(ctx, scenario_name, driver_name, __all, destroy):  # pragma: no cover
         scenario_name = None
 
     s = scenarios.Scenarios(
-        base.get_configs(args, command_args), scenario_name)
+        base.get_configs(args, command_args, scenario_name=scenario_name),
+        scenario_name)
     s.print_matrix()
-    for scenario in s:
-        try:
-            for term in scenario.sequence:
-                base.execute_subcommand(scenario.config, term)
-        except SystemExit:
-            if destroy == 'always':
-                msg = ('An error occured during the test sequence.  '
-                       'Cleaning up.')
-                LOG.warn(msg)
-                base.execute_subcommand(scenario.config, 'destroy')
-                util.sysexit()
-            raise
+    if parallel > 1:
+        func = functools.partial(_execute_sequence, destroy=destroy)
+        base.execute_parallel(s, func, parallel)
+    else:
+        for scenario in s:
+            _execute_sequence(scenario, destroy)
+
+
+def _execute_sequence(scenario, destroy):
+    """
+    Execute the scenario's test sequence, honoring the destroy strategy, and
+    returns None.
+
+    :param scenario: A scenario object.
+    :param destroy: A string containing the destroy strategy.
+    :return: None
+    """
+    try:
+        for term in scenario.sequence:
+            base.execute_subcommand(scenario.config, term)
+    except SystemExit:
+        if destroy == 'always':
+            msg = ('An error occured during the test sequence.  '
+                   'Cleaning up.')
+            LOG.warn(msg)
+            base.execute_subcommand(scenario.config, 'destroy')
+            util.sysexit()
+        raise
@@ -0,0 +1,222 @@
+#  Copyright (c) 2015-2017 Cisco Systems, Inc.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to
+#  deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+#  sell copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+
+import os
+import time
+
+import click
+
+from molecule import logger
+from molecule import scenarios
+from molecule.command import base
+
+LOG = logger.get_logger(__name__)
+
+LINT_EXTENSIONS = ('.py', '.yml', '.yaml')
+ROLE_DIRECTORIES = ('defaults', 'files', 'handlers', 'meta', 'tasks',
+                    'templates', 'vars')
+
+
+class Watch(base.Base):
+    """
+    Target the default scenario:
+
+    >>> molecule watch
+
+    Targeting a specific scenario:
+
+    >>> molecule watch --scenario-name foo
+
+    Converge the instances, then keep the scenario resident and poll the role
+    and the scenario for changes.  Once the changes settle, only the affected
+    actions of the scenario's `test_sequence` are executed.  Changes to the
+    verifier's tests execute verify, changes to the role's defaults, files,
+    handlers, meta, tasks, templates or vars, or to the scenario, execute
+    converge, and changes to YAML or Python files among them also execute
+    lint.  Other changes, such as docs or other scenarios, are ignored.
+    Changes to the `molecule.yml` reload the scenario.  Stop watching with
+    Ctrl-C.
+
+    The provisioner uses the `worker` executor, unless told otherwise:
+
+    >>> molecule watch --no-worker
+
+    Executing with `debug`:
+
+    >>> molecule --debug watch
+    """
+
+    def execute(self):
+        """
+        Execute the actions necessary to perform a `molecule watch` and
+        returns None once the `molecule.yml` changes.
+
+        :return: None
+        """
+        self.print_info()
+        self._execute_terms(self._config.scenario.converge_sequence)
+
+        snapshot = self._snapshot()
+        while True:
+            changed, snapshot = self._wait_for_changes(snapshot)
+            if self._config.molecule_file in changed:
+                msg = 'Reloading the scenario.'
+                LOG.warn(msg)
+                return
+
+            self._execute_terms(self._get_terms(changed))
+
+    def _snapshot(self):
+        """
+        Walk the project directory, skipping hidden files and directories and
+        Python caches, and returns a dict of each file's modification time
+        and size, keyed by path.
+
+        :return: dict
+        """
+        snapshot = {}
+        for root, dirs, files in os.walk(self._config.project_directory):
+            dirs[:] = [
+                d for d in dirs if not d.startswith('.') and d != '__pycache__'
+            ]
+            for f in files:
+                if f.startswith('.') or f.endswith(('~', '.pyc', '.retry')):
+                    continue
+                path = os.path.join(root, f)
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                snapshot[path] = (st.st_mtime, st.st_size)
+
+        return snapshot
+
+    def _wait_for_changes(self, snapshot):
+        """
+        Poll the project directory until files change, and no further
+        changes occur for one interval, and returns a tuple of the changed
+        paths and the latest snapshot.
+
+        :param snapshot: A dict as returned by `_snapshot`.
+        :return: tuple
+        """
+        interval = self._config.command_args.get('interval', 0.5)
+        changed = set()
+        while True:
+            time.sleep(interval)
+            latest = self._snapshot()
+            paths = set(snapshot) ^ set(latest)
+            paths.update(
+                p for p in set(snapshot) & set(latest)
+                if snapshot[p] != latest[p])
+            snapshot = latest
+            if paths:
+                changed.update(paths)
+            elif changed:
+                return changed, snapshot
+
+    def _get_terms(self, changed):
+        """
+        Determine the actions affected by the changed paths, and returns a
+        list of them in the order of the scenario's `test_sequence`.
+
+        :param changed: An iterable of changed paths.
+        :return: list
+        """
+        terms = set()
+        verifier_directory = os.path.join(self._config.verifier.directory, '')
+        converge_directories = tuple(
+            os.path.join(self._config.project_directory, d, '')
+            for d in ROLE_DIRECTORIES) + (os.path.join(
+                self._config.scenario.directory, ''), )
+        for path in changed:
+            if path.startswith(verifier_directory):
+                terms.add('verify')
+            elif path.startswith(converge_directories):
+                terms.add('converge')
+            else:
+                continue
+            if path.endswith(LINT_EXTENSIONS):
+                terms.add('lint')
+
+        return [t for t in self._config.scenario.test_sequence if t in terms]
+
+    def _execute_terms(self, terms):
+        """
+        Execute the given actions, stopping at the first failure without
+        exiting, and returns None.
+
+        :param terms: A list containing the actions.
+        :return: None
+        """
+        for term in terms:
+            try:
+                base.execute_subcommand(self._config, term)
+            except SystemExit as e:
+                msg = "Action '{}' failed with exit code {}.".format(
+                    term, base._exit_code(e.code))
+                LOG.error(msg)
+                break
+
+        msg = 'Watching for changes.'
+        LOG.info(msg)
+
+
+@click.command()
+@click.pass_context
+@click.option(
+    '--scenario-name',
+    '-s',
+    default='default',
+    help='Name of the scenario to target. (default)')
+@click.option(
+    '--interval',
+    type=float,
+    default=0.5,
+    help=('Seconds between polls for changes, and for the changes to settle. '
+          'Default is 0.5.'))
+@click.option(
+    '--worker/--no-worker',
+    default=True,
+    help='Execute playbooks in a warm Ansible worker. Default is True.')
+def watch(ctx, scenario_name, interval, worker):  # pragma: no cover
+    """
+    Converge, then re-execute converge, lint and verify on changes.
+    """
+    args = ctx.obj.get('args')
+    subcommand = base._get_subcommand(__name__)
+    command_args = {
+        'subcommand': subcommand,
+        'interval': interval,
+        'cache': True,
+    }
+    if worker:
+        command_args['executor'] = 'worker'
+
+    try:
+        while True:
+            s = scenarios.Scenarios(
+                base.get_configs(
+                    args, command_args, scenario_name=scenario_name),
+                scenario_name)
+            for scenario in s:
+                Watch(scenario.config).execute()
+    except KeyboardInterrupt:
+        pass
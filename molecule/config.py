@@ -18,6 +18,7 @@
 #  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 #  DEALINGS IN THE SOFTWARE.
 
+import functools
 import os
 
 import anyconfig
@@ -25,6 +26,7 @@ import anyconfig
 from molecule import interpolation
 from molecule import logger
 from molecule import platforms
+from molecule import report
 from molecule import scenario
 from molecule import state
 from molecule import util
@@ -49,6 +51,36 @@ LOG = logger.get_logger(__name__)
 MOLECULE_DIRECTORY = 'molecule'
 MOLECULE_FILE = 'molecule.yml'
 MERGE_STRATEGY = anyconfig.MS_DICTS
+# The cached references built from the state, keyed by the state key.  The
+# driver is resolved from the state, and the provisioner's inventory from the
+# driver's instance configs, which are written when the instances are
+# created.
+STATE_DEPENDENT_COMPONENTS = {
+    'created': ['driver', 'provisioner'],
+    'driver': ['driver', 'provisioner'],
+}
+
+
+def cache(func):
+    """
+    Memoize the component built by the decorated method in the config's
+    component registry.
+
+    :param func: A method which builds and returns a component.
+    :return: function
+    """
+
+    @functools.wraps(func)
+    def wrapper(self):
+        try:
+            return self._components[func.__name__]
+        except KeyError:
+            component = func(self)
+            self._components[func.__name__] = component
+
+            return component
+
+    return wrapper
 
 
 class Config(object):
@@ -63,7 +95,13 @@ class Config(object):
 
     The :class:`.Config` object has instantiated Dependency_, Driver_,
     :ref:`root_lint`, Platforms_, Provisioner_, Verifier_,
-    :ref:`root_scenario`, and State_ references.
+    :ref:`root_scenario`, Report_ and State_ references.
+
+    These references are built once, and cached for the lifetime of the
+    :class:`.Config` object.  Since the driver is resolved from the State_,
+    and the inventory from the instances the driver created, changes to the
+    State_'s `driver` or `created` keys invalidate the cached driver and
+    provisioner.
     """
 
     def __init__(self,
@@ -89,6 +127,7 @@ class Config(object):
         self.command_args = command_args
         self.ansible_args = ansible_args
         self.config = self._combine()
+        self._components = {}
 
     @property
     def debug(self):
@@ -111,6 +150,7 @@ class Config(object):
         return molecule_directory(self.project_directory)
 
     @property
+    @cache
     def dependency(self):
         dependency_name = self.config['dependency']['name']
         if dependency_name == 'galaxy':
@@ -121,6 +161,7 @@ class Config(object):
             util.exit_with_invalid_section('dependency', dependency_name)
 
     @property
+    @cache
     def driver(self):
         driver_name = self._get_driver_name()
         driver = None
@@ -157,21 +198,36 @@ class Config(object):
     @property
     def env(self):
         return {
-            'MOLECULE_DEBUG': str(self.debug),
-            'MOLECULE_FILE': self.molecule_file,
-            'MOLECULE_INVENTORY_FILE': self.provisioner.inventory_file,
-            'MOLECULE_EPHEMERAL_DIRECTORY': self.scenario.ephemeral_directory,
-            'MOLECULE_SCENARIO_DIRECTORY': self.scenario.directory,
-            'MOLECULE_INSTANCE_CONFIG': self.driver.instance_config,
-            'MOLECULE_DEPENDENCY_NAME': self.dependency.name,
-            'MOLECULE_DRIVER_NAME': self.driver.name,
-            'MOLECULE_LINT_NAME': self.lint.name,
-            'MOLECULE_PROVISIONER_NAME': self.provisioner.name,
-            'MOLECULE_SCENARIO_NAME': self.scenario.name,
-            'MOLECULE_VERIFIER_NAME': self.verifier.name,
+            'MOLECULE_DEBUG':
+            str(self.debug),
+            'MOLECULE_FILE':
+            self.molecule_file,
+            'MOLECULE_INVENTORY_FILE':
+            self.provisioner.inventory_file,
+            'MOLECULE_EPHEMERAL_DIRECTORY':
+            self.scenario.ephemeral_directory,
+            'MOLECULE_SCENARIO_DIRECTORY':
+            self.scenario.directory,
+            'MOLECULE_INSTANCE_CONFIG':
+            self.driver.instance_config,
+            'MOLECULE_FACT_CACHE_DIRECTORY':
+            self.provisioner.fact_cache_directory,
+            'MOLECULE_DEPENDENCY_NAME':
+            self.dependency.name,
+            'MOLECULE_DRIVER_NAME':
+            self.driver.name,
+            'MOLECULE_LINT_NAME':
+            self.lint.name,
+            'MOLECULE_PROVISIONER_NAME':
+            self.provisioner.name,
+            'MOLECULE_SCENARIO_NAME':
+            self.scenario.name,
+            'MOLECULE_VERIFIER_NAME':
+            self.verifier.name,
         }
 
     @property
+    @cache
     def lint(self):
         lint_name = self.config['lint']['name']
         if lint_name == 'yamllint':
@@ -184,6 +240,7 @@ class Config(object):
         return platforms.Platforms(self)
 
     @property
+    @cache
     def provisioner(self):
         provisioner_name = self.config['provisioner']['name']
         if provisioner_name == 'ansible':
@@ -192,14 +249,22 @@ class Config(object):
             util.exit_with_invalid_section('provisioner', provisioner_name)
 
     @property
+    @cache
+    def report(self):
+        return report.Report(self)
+
+    @property
+    @cache
     def scenario(self):
         return scenario.Scenario(self)
 
     @property
+    @cache
     def state(self):
         return state.State(self)
 
     @property
+    @cache
     def verifier(self):
         verifier_name = self.config['verifier']['name']
         if verifier_name == 'testinfra':
@@ -216,6 +281,18 @@ class Config(object):
     def merge_dicts(self, a, b):
         return merge_dicts(a, b)
 
+    def invalidate_cache(self, keys):
+        """
+        Discard the cached references built from the given State_ keys, and
+        returns None.
+
+        :param keys: An iterable of the State_ keys which changed.
+        :return: None
+        """
+        for key in keys:
+            for name in STATE_DEPENDENT_COMPONENTS.get(key, []):
+                self._components.pop(name, None)
+
     def _get_driver_name(self):
         driver_from_state_file = self.state.driver
         driver_from_cli = self.command_args.get('driver_name')
@@ -270,6 +347,7 @@ class Config(object):
                 },
                 'options': {
                     'managed': True,
+                    'snapshot': False,
                 },
                 'ssh_connection_options': [],
                 'safe_files': [],
@@ -293,11 +371,19 @@ class Config(object):
                     'links': {},
                 },
                 'children': {},
+                'executor': 'sh',
+                'idempotence': {
+                    'check_mode': False,
+                    'start_at_changed': False,
+                    'shard': False,
+                },
                 'playbooks': {
                     'create': 'create.yml',
                     'converge': 'playbook.yml',
                     'destroy': 'destroy.yml',
                     'side_effect': None,
+                    'snapshot': None,
+                    'restore': None,
                 },
                 'lint': {
                     'name': 'ansible-lint',
@@ -343,6 +429,7 @@ class Config(object):
                 'options': {},
                 'env': {},
                 'additional_files_or_dirs': [],
+                'parallel': False,
                 'lint': {
                     'name': 'flake8',
                     'enabled': True,
@@ -400,17 +487,33 @@ def molecule_file(path):
     return os.path.join(path, MOLECULE_FILE)
 
 
+def scenario_name(molecule_file):
+    """
+    Read the scenario name from the given Molecule config file, without
+    building a :class:`.Config`, and returns a string.
+
+    :param molecule_file: A string containing the path to the Molecule file.
+    :return: str
+    """
+    i = interpolation.Interpolator(interpolation.TemplateWithDefaults,
+                                   os.environ)
+    with util.open_file(molecule_file) as stream:
+        d = util.safe_load(i.interpolate(stream.read())) or {}
+
+    return (d.get('scenario') or {}).get('name', 'default')
+
+
 def molecule_drivers():
     return [
-        delegated.Delegated(None).name,
-        docker.Docker(None).name,
-        ec2.Ec2(None).name,
-        gce.Gce(None).name,
-        lxc.Lxc(None).name,
-        kvm.kvm(None).name,
-        lxd.Lxd(None).name,
-        openstack.Openstack(None).name,
-        vagrant.Vagrant(None).name,
+        'delegated',
+        'docker',
+        'ec2',
+        'gce',
+        'lxc',
+        'kvm',
+        'lxd',
+        'openstack',
+        'vagrant',
     ]
 
 
@@ -18,9 +18,13 @@
 #  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 #  DEALINGS IN THE SOFTWARE.
 
+import hashlib
 import os
+import shutil
+import tempfile
 
 import sh
+import yaml
 
 from molecule import logger
 from molecule import util
@@ -62,6 +66,18 @@ class AnsibleGalaxy(base.Base):
           env:
             FOO: bar
 
+    Roles are installed once into a user-level cache, and linked into each
+    scenario's roles path.  Each role is cached by its name, version and
+    source, so scenarios sharing the same requirements do not download them
+    again, and `ansible-galaxy` is not executed when every role is cached.
+    Roles missing from the cache are installed concurrently.  The cache is
+    stored in `$XDG_CACHE_HOME/molecule/roles`, which defaults to
+    `~/.cache/molecule/roles`.  Roles without a version are cached as they
+    were first installed, remove the cache to update them.
+
+    Requirements files including other files, or listing collections, are
+    passed to `ansible-galaxy` as is, without the cache.
+
     .. _`Ansible Galaxy`: http://docs.ansible.com/ansible/galaxy.html
     """
 
@@ -88,6 +104,14 @@ class AnsibleGalaxy(base.Base):
     def default_env(self):
         return self._config.merge_dicts(os.environ.copy(), self._config.env)
 
+    @property
+    def role_cache_directory(self):
+        cache_home = os.environ.get('XDG_CACHE_HOME',
+                                    os.path.join(
+                                        os.path.expanduser('~'), '.cache'))
+
+        return os.path.join(cache_home, 'molecule', 'roles')
+
     def bake(self):
         """
         Bake an `ansible-galaxy` command so it's ready to execute and returns
@@ -117,6 +141,17 @@ class AnsibleGalaxy(base.Base):
             LOG.warn(msg)
             return
 
+        roles = self._get_roles()
+        if roles is not None:
+            self._setup()
+            try:
+                self._install_cached_roles(roles)
+                msg = 'Dependency completed successfully.'
+                LOG.success(msg)
+            except sh.ErrorReturnCode as e:
+                util.sysexit(e.exit_code)
+            return
+
         if self._ansible_galaxy_command is None:
             self.bake()
 
@@ -129,6 +164,156 @@ class AnsibleGalaxy(base.Base):
         except sh.ErrorReturnCode as e:
             util.sysexit(e.exit_code)
 
+    def _install_cached_roles(self, roles):
+        """
+        Install the roles missing from the role cache concurrently, link the
+        roles into the scenario's roles path, and returns None.
+
+        :param roles: A list of dicts describing the roles.
+        :return: None
+        """
+        entries = [self._get_role_cache_entry(role) for role in roles]
+        running = []
+        for role, entry in zip(roles, entries):
+            if os.path.isdir(entry):
+                continue
+            # Avoid installing the same role twice, when listed twice.
+            if entry in [e for e, _, _ in running]:
+                continue
+
+            if not os.path.isdir(self.role_cache_directory):
+                os.makedirs(self.role_cache_directory)
+            directory = tempfile.mkdtemp(dir=self.role_cache_directory)
+            cmd = util.run_command(
+                self._bake_role(role, directory), debug=self._config.debug)
+            running.append((entry, directory, cmd))
+
+        error = None
+        for entry, directory, cmd in running:
+            try:
+                cmd.wait()
+            except sh.ErrorReturnCode as e:
+                error = error or e
+                shutil.rmtree(directory)
+                continue
+
+            try:
+                os.rename(directory, entry)
+            except OSError:
+                # Another process cached the role first.
+                shutil.rmtree(directory)
+        if error:
+            raise error
+
+        self._link_roles(entries)
+
+    def _bake_role(self, role, directory):
+        """
+        Bake an `ansible-galaxy` command installing the role into the given
+        directory in the background, and returns a `sh.Command` object.
+
+        :param role: A dict describing the role.
+        :param directory: A string containing the path to install into.
+        :return: sh.Command
+        """
+        role_file = os.path.join(directory, 'requirements.yml')
+        util.write_file(role_file, util.safe_dump([role]))
+
+        options = self.options
+        options.update({
+            'force': True,
+            'role-file': role_file,
+            'roles-path': os.path.join(directory, 'roles'),
+        })
+        verbose_flag = util.verbose_flag(options)
+
+        return sh.ansible_galaxy.bake(
+            'install',
+            options,
+            *verbose_flag,
+            _env=self.env,
+            _out=LOG.out,
+            _err=LOG.error,
+            _bg=True)
+
+    def _link_roles(self, entries):
+        """
+        Link the roles installed in the role cache entries into the
+        scenario's roles path, remove the links to cached roles which are no
+        longer required, and returns None.
+
+        :param entries: A list of paths to role cache entries.
+        :return: None
+        """
+        roles_path = os.path.join(self._config.scenario.directory,
+                                  self.options['roles-path'])
+        sources = {}
+        for entry in entries:
+            roles_directory = os.path.join(entry, 'roles')
+            for name in os.listdir(roles_directory):
+                sources[name] = os.path.join(roles_directory, name)
+
+        for name in os.listdir(roles_path):
+            link = os.path.join(roles_path, name)
+            if (name not in sources
+                    and os.path.islink(link) and os.readlink(link).startswith(
+                        self.role_cache_directory + os.sep)):
+                os.remove(link)
+
+        for name, source in sources.items():
+            link = os.path.join(roles_path, name)
+            if os.path.islink(link):
+                if os.readlink(link) == source:
+                    continue
+                os.remove(link)
+            elif os.path.isdir(link):
+                shutil.rmtree(link)
+            os.symlink(source, link)
+
+    def _get_role_cache_entry(self, role):
+        """
+        Compute the path to the role cache entry of the role, keyed on its
+        name, version and source, and returns a string.
+
+        :param role: A dict describing the role.
+        :return: str
+        """
+        key = util.safe_dump(
+            {k: role.get(k)
+             for k in ['name', 'scm', 'src', 'version']})
+
+        return os.path.join(self.role_cache_directory,
+                            hashlib.sha1(key.encode('utf-8')).hexdigest())
+
+    def _get_roles(self):
+        """
+        Read the roles from the requirements file and returns a list, or None
+        when the file cannot be installed through the role cache.
+
+        :return: list
+        """
+        try:
+            data = util.safe_load_file(self.options['role-file'])
+        except (IOError, yaml.YAMLError):
+            return
+
+        if isinstance(data, dict):
+            if list(data.keys()) != ['roles']:
+                return
+            data = data['roles']
+        if not isinstance(data, list):
+            return
+
+        roles = []
+        for role in data:
+            if not isinstance(role, dict):
+                role = {'src': role}
+            if 'include' in role or not (role.get('src') or role.get('name')):
+                return
+            roles.append(role)
+
+        return roles
+
     def _setup(self):
         """
         Prepare the system for using `ansible-galaxy` and returns None.
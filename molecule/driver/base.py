@@ -22,6 +22,7 @@ import abc
 import os
 
 from molecule import status
+from molecule import util
 
 Status = status.get_status()
 
@@ -37,6 +38,8 @@ class Base(object):
         :returns: None
         """
         self._config = config
+        self._instance_configs = None
+        self._instance_configs_stat = None
 
     @property
     @abc.abstractmethod
@@ -128,6 +131,41 @@ class Base(object):
         return os.path.join(self._config.scenario.ephemeral_directory,
                             'instance_config.yml')
 
+    @property
+    def instance_configs(self):
+        """
+        The instance config file indexed by instance name, and returns a dict.
+        The file is parsed once, and again only when it changes on disk.
+
+        :return: dict
+        """
+        try:
+            st = os.stat(self.instance_config)
+            stat = (st.st_ino, st.st_size, st.st_mtime)
+        except OSError:
+            stat = None
+
+        if stat is None or stat != self._instance_configs_stat:
+            instance_config_dict = util.safe_load_file(self.instance_config)
+            self._instance_configs = {
+                item['instance']: item
+                for item in instance_config_dict
+            }
+            self._instance_configs_stat = stat
+
+        return self._instance_configs
+
+    @property
+    def ssh_control_persist(self):
+        """
+        The seconds an idle SSH master connection persists, a minute per
+        action of the scenario's test sequence, so the connection outlives
+        the gaps between the actions, and returns an int.
+
+        :return: int
+        """
+        return 60 * len(self._config.scenario.test_sequence)
+
     @property
     def ssh_connection_options(self):
         if self._config.config['driver']['ssh_connection_options']:
@@ -148,6 +186,26 @@ class Base(object):
         """
         return self.name == 'delegated'
 
+    @property
+    def default_concurrency(self):
+        """
+        The default of the most scenarios using the driver to create or
+        destroy concurrently, and returns an int.
+
+        :returns: int
+        """
+        return 4
+
+    @property
+    def concurrency(self):
+        """
+        The most scenarios using the driver to create or destroy concurrently,
+        as set by the driver's `concurrency` option, and returns an int.
+
+        :returns: int
+        """
+        return self.options.get('concurrency', self.default_concurrency)
+
     @property
     def managed(self):
         """
@@ -157,6 +215,16 @@ class Base(object):
         """
         return self.options['managed']
 
+    @property
+    def snapshot(self):
+        """
+        Is the driver resetting instances from a snapshot, instead of
+        destroying and recreating them, and returns a bool.
+
+        :returns: bool
+        """
+        return self.options['snapshot']
+
     def status(self):
         """
         Collects the instances state and returns a list.
@@ -193,7 +261,7 @@ class Base(object):
         return [
             '-o UserKnownHostsFile=/dev/null',
             '-o ControlMaster=auto',
-            '-o ControlPersist=60s',
+            '-o ControlPersist={}s'.format(self.ssh_control_persist),
             '-o IdentitiesOnly=yes',
             '-o StrictHostKeyChecking=no',
         ]
@@ -80,6 +80,17 @@ class Delegated(base.Base):
         platforms:
           - name: instance-vagrant
 
+    Scenarios created or destroyed with `--parallel` share the delegated
+    infrastructure, four at a time by default.  Lower `concurrency` when it
+    cannot take as many.
+
+    .. code-block:: yaml
+
+        driver:
+          name: delegated
+          options:
+            concurrency: 2
+
     Provide the files Molecule will preserve upon each subcommand execution.
 
     .. code-block:: yaml
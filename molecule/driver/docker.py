@@ -45,7 +45,7 @@ class Docker(base.Base):
         platforms:
           - name: instance
             hostname: "{{ item.name }}"
-            image: "molecule_local/{{ item.image }}"
+            image: "molecule_local/{{ item.image | regex_replace(':', '_') }}:<hash>"
             command: "{{ item.command | default('sleep infinity') }}"
             privileged: "{{ item.privileged | default(omit) }}"
             volumes: "{{ item.volumes | default(omit) }}"
@@ -55,6 +55,69 @@ class Docker(base.Base):
 
         $ sudo pip install docker-py
 
+    The create playbook caches the images it builds.  Each image is tagged with
+    a hash of the Dockerfile it is built from, either the rendered template or
+    the platform's `dockerfile`, and of the base image.  The build is skipped
+    when an image with a matching tag exists, and the instances are started
+    from that tag, rather than a shared alias, so concurrent scenarios cannot
+    start from each other's images.  Set `force` on a platform to always
+    rebuild.  Old images are evicted with `molecule cache prune`.  The base
+    image is only pulled when missing, so an updated base image is not picked
+    up unless `pull` is set on the platform.
+
+    .. code-block:: yaml
+
+        platforms:
+          - name: instance
+            image: centos:7
+            force: True
+            pull: True
+
+    Reset instances from a snapshot during `molecule test`, rather than
+    destroying and recreating them.  The snapshot playbook commits each
+    container to a `molecule_snapshot/<instance>` image after create, and the
+    restore playbook recreates the containers from those images.
+
+    .. code-block:: yaml
+
+        driver:
+          name: docker
+          options:
+            snapshot: True
+        provisioner:
+          name: ansible
+          playbooks:
+            snapshot: snapshot.yml
+            restore: restore.yml
+
+    Keep a pool of idle, pre-started containers, rather than starting each
+    instance cold.  Containers are pooled by image cache key and instance
+    settings.  The create playbook leases a matching idle container, and the
+    destroy playbook returns an unchanged instance to the pool, or destroys a
+    changed instance and starts a fresh replacement in the background, from
+    the hash tagged image recorded on the instance.  Up to `pool_size` idle
+    containers are kept per key, and idle containers are evicted after
+    `pool_ttl` seconds.  Pooling is disabled when `pool_size` is 0, which is
+    the default.
+
+    .. code-block:: yaml
+
+        driver:
+          name: docker
+          options:
+            pool_size: 1
+            pool_ttl: 3600
+
+    `molecule create --parallel` and `molecule destroy --parallel` run up to
+    `concurrency` Docker scenarios at once, 4 by default.
+
+    .. code-block:: yaml
+
+        driver:
+          name: docker
+          options:
+            concurrency: 8
+
     Provide the files Molecule will preserve upon each subcommand execution.
 
     .. code-block:: yaml
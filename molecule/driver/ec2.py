@@ -21,8 +21,6 @@
 from molecule import logger
 from molecule.driver import base
 
-from molecule import util
-
 LOG = logger.get_logger(__name__)
 
 
@@ -70,6 +68,17 @@ class Ec2(base.Base):
         Molecule does not merge lists, when overriding the developer must
         provide all options.
 
+    EC2 calls are bound by the API rather than the host, so up to 8
+    scenarios are created or destroyed at once with `--parallel`.  Lower
+    `concurrency` to stay within the account's API rate limits.
+
+    .. code-block:: yaml
+
+        driver:
+          name: ec2
+          options:
+            concurrency: 4
+
     Provide the files Molecule will preserve upon each subcommand execution.
 
     .. code-block:: yaml
@@ -105,6 +114,10 @@ class Ec2(base.Base):
                 '-i {{identity_file}} '
                 '{}').format(connection_options)
 
+    @property
+    def default_concurrency(self):
+        return 8
+
     @property
     def default_safe_files(self):
         return [
@@ -134,7 +147,7 @@ class Ec2(base.Base):
                 'ansible_ssh_common_args':
                 ' '.join(self.ssh_connection_options),
             }
-        except StopIteration:
+        except KeyError:
             return {}
         except IOError:
             # Instance has yet to be provisioned , therefore the
@@ -142,8 +155,4 @@ class Ec2(base.Base):
             return {}
 
     def _get_instance_config(self, instance_name):
-        instance_config_dict = util.safe_load_file(
-            self._config.driver.instance_config)
-
-        return next(item for item in instance_config_dict
-                    if item['instance'] == instance_name)
+        return self.instance_configs[instance_name]
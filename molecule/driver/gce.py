@@ -21,8 +21,6 @@
 from molecule import logger
 from molecule.driver import base
 
-from molecule import util
-
 LOG = logger.get_logger(__name__)
 
 
@@ -72,6 +70,16 @@ class Gce(base.Base):
         Molecule does not merge lists, when overriding the developer must
         provide all options.
 
+    Up to 8 GCE scenarios are created or destroyed at once with
+    `--parallel`.  Set `concurrency` to match the project's quota.
+
+    .. code-block:: yaml
+
+        driver:
+          name: gce
+          options:
+            concurrency: 4
+
     Provide the files Molecule will preserve upon each subcommand execution.
 
     .. code-block:: yaml
@@ -107,6 +115,10 @@ class Gce(base.Base):
                 '-i {{identity_file}} '
                 '{}').format(connection_options)
 
+    @property
+    def default_concurrency(self):
+        return 8
+
     @property
     def default_safe_files(self):
         return [
@@ -136,7 +148,7 @@ class Gce(base.Base):
                 'ansible_ssh_common_args':
                 ' '.join(self.ssh_connection_options),
             }
-        except StopIteration:
+        except KeyError:
             return {}
         except IOError:
             # Instance has yet to be provisioned , therefore the
@@ -144,8 +156,4 @@ class Gce(base.Base):
             return {}
 
     def _get_instance_config(self, instance_name):
-        instance_config_dict = util.safe_load_file(
-            self._config.driver.instance_config)
-
-        return next(item for item in instance_config_dict
-                    if item['instance'] == instance_name)
+        return self.instance_configs[instance_name]
@@ -21,8 +21,6 @@
 from molecule import logger
 from molecule.driver import base
 
-from molecule import util
-
 LOG = logger.get_logger(__name__)
 
 
@@ -54,6 +52,34 @@ class kvm(base.Base):
         Molecule does not merge lists, when overriding the developer must
         provide all options.
 
+    Reset instances from a snapshot during `molecule test`, rather than
+    destroying and recreating them.  The snapshot playbook takes an internal
+    qcow2 snapshot of each domain after create, and the restore playbook
+    reverts the domains to it.
+
+    .. code-block:: yaml
+
+        driver:
+          name: kvm
+          options:
+            snapshot: True
+        provisioner:
+          name: ansible
+          playbooks:
+            snapshot: snapshot.yml
+            restore: restore.yml
+
+    Domains are bound by the host's CPU and disk, so no more than 2 KVM
+    scenarios are created or destroyed at once with `--parallel`, unless
+    `concurrency` is raised.
+
+    .. code-block:: yaml
+
+        driver:
+          name: kvm
+          options:
+            concurrency: 4
+
     Provide the files Molecule will preserve upon each subcommand execution.
 
     .. code-block:: yaml
@@ -88,6 +114,10 @@ class kvm(base.Base):
                 '-p {{port}} '
                 '{}').format(connection_options)
 
+    @property
+    def default_concurrency(self):
+        return 2
+
     @property
     def default_safe_files(self):
         return [
@@ -116,7 +146,7 @@ class kvm(base.Base):
                 'ansible_ssh_common_args':
                 ' '.join(self.ssh_connection_options),
             }
-        except StopIteration:
+        except KeyError:
             return {}
         except IOError:
             # Instance has yet to be provisioned , therefore the
@@ -124,9 +154,4 @@ class kvm(base.Base):
             return {}
 
     def _get_instance_config(self, instance_name):
-        instance_config_dict = util.safe_load_file(
-            self._config.driver.instance_config)
-        
-
-        return next(item for item in instance_config_dict
-                    if item['instance'] == instance_name)
+        return self.instance_configs[instance_name]
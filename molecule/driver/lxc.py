@@ -43,6 +43,16 @@ class Lxc(base.Base):
 
         $ sudo pip install lxc-python2
 
+    No more than `concurrency` LXC scenarios, 4 by default, are created or
+    destroyed at once with `--parallel`.
+
+    .. code-block:: yaml
+
+        driver:
+          name: lxc
+          options:
+            concurrency: 2
+
     Provide the files Molecule will preserve upon each subcommand execution.
 
     .. code-block:: yaml
@@ -39,6 +39,33 @@ class Lxd(base.Base):
         driver:
           name: lxd
 
+    Reset instances from a snapshot during `molecule test`, rather than
+    destroying and recreating them.  The snapshot playbook takes an LXD
+    snapshot of each container after create, and the restore playbook rolls
+    the containers back to it.
+
+    .. code-block:: yaml
+
+        driver:
+          name: lxd
+          options:
+            snapshot: True
+        provisioner:
+          name: ansible
+          playbooks:
+            snapshot: snapshot.yml
+            restore: restore.yml
+
+    `concurrency` bounds the LXD scenarios created or destroyed at once with
+    `--parallel`, and defaults to 4.
+
+    .. code-block:: yaml
+
+        driver:
+          name: lxd
+          options:
+            concurrency: 8
+
     Provide the files Molecule will preserve upon each subcommand execution.
 
     .. code-block:: yaml
@@ -21,8 +21,6 @@
 from molecule import logger
 from molecule.driver import base
 
-from molecule import util
-
 LOG = logger.get_logger(__name__)
 
 
@@ -67,6 +65,16 @@ class Openstack(base.Base):
         Molecule does not merge lists, when overriding the developer must
         provide all options.
 
+    With `--parallel`, up to 8 OpenStack scenarios are created or destroyed
+    at once.  Tune `concurrency` to the cloud's quota.
+
+    .. code-block:: yaml
+
+        driver:
+          name: openstack
+          options:
+            concurrency: 4
+
     Provide the files Molecule will preserve upon each subcommand execution.
 
     .. code-block:: yaml
@@ -102,6 +110,10 @@ class Openstack(base.Base):
                 '-i {{identity_file}} '
                 '{}').format(connection_options)
 
+    @property
+    def default_concurrency(self):
+        return 8
+
     @property
     def default_safe_files(self):
         return [
@@ -131,7 +143,7 @@ class Openstack(base.Base):
                 'ansible_ssh_common_args':
                 ' '.join(self.ssh_connection_options),
             }
-        except StopIteration:
+        except KeyError:
             return {}
         except IOError:
             # Instance has yet to be provisioned , therefore the
@@ -139,8 +151,4 @@ class Openstack(base.Base):
             return {}
 
     def _get_instance_config(self, instance_name):
-        instance_config_dict = util.safe_load_file(
-            self._config.driver.instance_config)
-
-        return next(item for item in instance_config_dict
-                    if item['instance'] == instance_name)
+        return self.instance_configs[instance_name]
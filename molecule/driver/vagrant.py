@@ -21,7 +21,6 @@
 import os
 
 from molecule import logger
-from molecule import util
 from molecule.driver import base
 
 LOG = logger.get_logger(__name__)
@@ -100,6 +99,17 @@ class Vagrant(base.Base):
         Molecule does not merge lists, when overriding the developer must
         provide all options.
 
+    Vagrant boots its machines on the local host, which limits `--parallel`
+    to 2 scenarios at once by default.  Raise `concurrency` on a larger
+    host.
+
+    .. code-block:: yaml
+
+        driver:
+          name: vagrant
+          options:
+            concurrency: 4
+
     Provide the files Molecule will preserve upon each subcommand execution.
 
     .. code-block:: yaml
@@ -142,6 +152,10 @@ class Vagrant(base.Base):
                 '-i {{identity_file}} '
                 '{}').format(connection_options)
 
+    @property
+    def default_concurrency(self):
+        return 2
+
     @property
     def default_safe_files(self):
         return [
@@ -175,7 +189,7 @@ class Vagrant(base.Base):
                 'ansible_ssh_common_args':
                 ' '.join(self.ssh_connection_options),
             }
-        except StopIteration:
+        except KeyError:
             return {}
         except IOError:
             # Instance has yet to be provisioned , therefore the
@@ -193,8 +207,4 @@ class Vagrant(base.Base):
                             'vagrant.yml')
 
     def _get_instance_config(self, instance_name):
-        instance_config_dict = util.safe_load_file(
-            self._config.driver.instance_config)
-
-        return next(item for item in instance_config_dict
-                    if item['instance'] == instance_name)
+        return self.instance_configs[instance_name]
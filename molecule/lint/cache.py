@@ -0,0 +1,162 @@
+#  Copyright (c) 2015-2017 Cisco Systems, Inc.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to
+#  deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+#  sell copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+
+import hashlib
+import json
+import os
+
+import sh
+
+from molecule import logger
+from molecule import util
+
+LOG = logger.get_logger(__name__)
+CACHE_FILE = 'lint_{}_cache.json'
+
+
+class Cache(object):
+    """
+    A cache of the files which passed a linter, stored in the ephemeral
+    directory.
+
+    Each file is keyed on a digest of its contents, the linter's executable,
+    options and config files, so only files which changed, or previously
+    failed, are linted again.  A file is considered to have failed when it is
+    mentioned in the linter's output.
+
+    The cache can be bypassed with `molecule lint --no-cache`.
+    """
+
+    def __init__(self, config, name, options={}, config_files=[]):
+        """
+        Sets up the requirements to cache a linter's results and returns None.
+
+        :param config: An instance of a Molecule config.
+        :param name: A string containing the name of the linter's executable.
+        :param options: An optional dict of options passed to the linter.
+        :param config_files: An optional list of files configuring the
+         linter.
+        :return: None
+        """
+        self._config = config
+        self._name = name
+        self._options = options
+        self._config_files = config_files
+        self._digests = {}
+        self._output = []
+
+    @property
+    def enabled(self):
+        return self._config.command_args.get('cache', True)
+
+    @property
+    def cache_file(self):
+        return os.path.join(self._config.scenario.ephemeral_directory,
+                            CACHE_FILE.format(self._name))
+
+    def stale(self, filenames, digest=None):
+        """
+        Filter the files whose results are not cached and returns a list.
+
+        :param filenames: A list of files to lint.
+        :param digest: An optional function returning a digest of the inputs
+         linted with the given file.  Defaults to a digest of the file.
+        :return: list
+        """
+        salt = self._salt()
+        self._digests = {}
+        for filename in filenames:
+            d = digest(filename) if digest else util.fingerprint([filename])
+            self._digests[filename] = hashlib.sha1(
+                (salt + d).encode('utf-8')).hexdigest()
+        cached = self._load()
+
+        return [
+            filename for filename in filenames
+            if cached.get(filename) != self._digests[filename]
+        ]
+
+    def capture(self, callback):
+        """
+        Wrap an output callback to record the linter's output and returns a
+        function.
+
+        :param callback: A function called with each line of output.
+        :return: function
+        """
+
+        def _capture(line):
+            self._output.append(line)
+            callback(line)
+
+        return _capture
+
+    def update(self, filenames):
+        """
+        Cache the files not mentioned in the captured output, forget the
+        others, write the cache to disk, and returns None.
+
+        :param filenames: A list of the linted files.
+        :return: None
+        """
+        output = ''.join(self._output)
+        cached = self._load()
+        for filename in filenames:
+            relpath = os.path.relpath(filename, self._config.project_directory)
+            if filename in output or relpath in output:
+                cached.pop(filename, None)
+            else:
+                cached[filename] = self._digests[filename]
+
+        directory = os.path.dirname(self.cache_file)
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+        with open(self.cache_file, 'w') as stream:
+            json.dump(cached, stream, indent=2, sort_keys=True)
+
+    def _load(self):
+        if not os.path.isfile(self.cache_file):
+            return {}
+
+        with open(self.cache_file) as stream:
+            try:
+                return json.load(stream)
+            except ValueError:
+                msg = 'Ignoring the corrupt lint cache {}.'.format(
+                    self.cache_file)
+                LOG.warn(msg)
+                return {}
+
+    def _salt(self):
+        """
+        Compute a digest of the linter's executable, options and config files
+        and returns a string.  The executable is identified by its path and
+        modification time, which changes when the linter is upgraded.
+
+        :return: str
+        """
+        executable = sh.which(self._name)
+        if executable and os.path.exists(executable):
+            executable = '{}:{}'.format(executable,
+                                        os.path.getmtime(executable))
+
+        return '{}{}{}'.format(executable,
+                               util.safe_dump(self._options),
+                               util.fingerprint(self._config_files))
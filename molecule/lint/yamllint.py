@@ -25,6 +25,7 @@ import sh
 from molecule import logger
 from molecule import util
 from molecule.lint import base
+from molecule.lint import cache
 
 LOG = logger.get_logger(__name__)
 
@@ -64,6 +65,10 @@ class Yamllint(base.Base):
           env:
             FOO: bar
 
+    Only the files which changed, or failed, since the last run are linted.
+    Files which passed are cached in the ephemeral directory, and the cache
+    is bypassed with `molecule lint --no-cache`.
+
     .. _`Yamllint`: https://github.com/adrienverge/yamllint
     """
 
@@ -77,6 +82,13 @@ class Yamllint(base.Base):
         super(Yamllint, self).__init__(config)
         self._yamllint_command = None
         self._files = self._get_files()
+        self._cache = cache.Cache(
+            config,
+            'yamllint',
+            options=self.options,
+            config_files=[
+                os.path.join(config.project_directory, '.yamllint'),
+            ])
 
     @property
     def default_options(self):
@@ -96,8 +108,8 @@ class Yamllint(base.Base):
             self.options,
             self._files,
             _env=self.env,
-            _out=LOG.out,
-            _err=LOG.error)
+            _out=self._cache.capture(LOG.out),
+            _err=self._cache.capture(LOG.error))
 
     def execute(self):
         if not self.enabled:
@@ -105,6 +117,13 @@ class Yamllint(base.Base):
             LOG.warn(msg)
             return
 
+        if self._cache.enabled:
+            self._files = self._cache.stale(self._files)
+            if not self._files:
+                msg = 'Skipping, no files changed since the last lint.'
+                LOG.warn(msg)
+                return
+
         if self._yamllint_command is None:
             self.bake()
 
@@ -118,6 +137,9 @@ class Yamllint(base.Base):
             LOG.success(msg)
         except sh.ErrorReturnCode as e:
             util.sysexit(e.exit_code)
+        finally:
+            if self._cache.enabled:
+                self._cache.update(self._files)
 
     def _get_files(self):
         """
@@ -131,9 +153,12 @@ class Yamllint(base.Base):
             '.vagrant',
             '.molecule',
         ]
-        generators = [
-            util.os_walk(self._config.project_directory, '*.yml', excludes),
-            util.os_walk(self._config.project_directory, '*.yaml', excludes),
-        ]
-
-        return [f for g in generators for f in g]
+        files = []
+        for root, dirs, basenames in os.walk(
+                self._config.project_directory, topdown=True):
+            dirs[:] = [d for d in dirs if d not in excludes]
+            files.extend(
+                os.path.join(root, basename) for basename in basenames
+                if basename.endswith(('.yml', '.yaml')))
+
+        return files
@@ -44,6 +44,16 @@ class DriverSchema(base.Base):
     ssh_connection_options = marshmallow.fields.List(marshmallow.fields.Str())
     safe_files = marshmallow.fields.List(marshmallow.fields.Str())
 
+    @marshmallow.validates('options')
+    def validate_options(self, options):
+        concurrency = options.get('concurrency')
+        if concurrency is None:
+            return
+        if (isinstance(concurrency, bool) or not isinstance(concurrency, int)
+                or concurrency < 1):
+            raise marshmallow.ValidationError(
+                'Concurrency must be a positive integer.', 'options')
+
 
 class LintSchema(base.Base):
     name = marshmallow.fields.Str()
@@ -111,6 +121,8 @@ class PlaybooksSchema(base.Base):
     converge = marshmallow.fields.Str()
     destroy = marshmallow.fields.Str()
     side_effect = marshmallow.fields.Str(allow_none=True)
+    snapshot = marshmallow.fields.Str(allow_none=True)
+    restore = marshmallow.fields.Str(allow_none=True)
 
 
 class ProvisionerPlaybooksSchema(PlaybooksSchema):
@@ -123,6 +135,12 @@ class ProvisionerPlaybooksSchema(PlaybooksSchema):
     vagrant = marshmallow.fields.Nested(PlaybooksSchema())
 
 
+class ProvisionerIdempotenceSchema(base.Base):
+    check_mode = marshmallow.fields.Bool()
+    start_at_changed = marshmallow.fields.Bool()
+    shard = marshmallow.fields.Bool()
+
+
 class ProvisionerSchema(base.Base):
     name = marshmallow.fields.Str()
     config_options = marshmallow.fields.Dict()
@@ -131,6 +149,9 @@ class ProvisionerSchema(base.Base):
     env = marshmallow.fields.Dict()
     inventory = marshmallow.fields.Nested(ProvisionerInventorySchema())
     children = marshmallow.fields.Dict()
+    executor = marshmallow.fields.Str(validate=marshmallow.validate.OneOf(
+        ['sh', 'worker']))
+    idempotence = marshmallow.fields.Nested(ProvisionerIdempotenceSchema())
     playbooks = marshmallow.fields.Nested(ProvisionerPlaybooksSchema())
     lint = marshmallow.fields.Nested(LintSchema())
 
@@ -151,6 +172,7 @@ class VerifierSchema(base.Base):
     env = marshmallow.fields.Dict()
     additional_files_or_dirs = marshmallow.fields.List(
         marshmallow.fields.Str())
+    parallel = marshmallow.fields.Bool()
     lint = marshmallow.fields.Nested(LintSchema())
 
 
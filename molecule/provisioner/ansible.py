@@ -20,14 +20,16 @@
 
 from __future__ import absolute_import
 
-import copy
-import collections
+import hashlib
+import json
+import multiprocessing
 import os
 import shutil
 
-import ansible.constants
+import sh
 
 from molecule import logger
+from molecule import scenario
 from molecule import util
 from molecule.provisioner import base
 from molecule.provisioner import ansible_playbook
@@ -35,6 +37,10 @@ from molecule.provisioner import ansible_playbooks
 
 LOG = logger.get_logger(__name__)
 
+# NOTE: A socket's path is limited to 104 bytes on some platforms, and ssh
+# appends a 40 byte hash, and a 17 byte suffix while creating the socket.
+MAX_CONTROL_PATH_DIR_LENGTH = 104 - 1 - 40 - 17
+
 
 class Ansible(base.Base):
     """
@@ -125,6 +131,63 @@ class Ansible(base.Base):
 
         This is feature should be considered experimental.
 
+    The snapshot and restore playbooks are used by drivers which enable the
+    `snapshot` option.  The snapshot playbook runs right after the instances
+    are created, and `molecule test` runs the restore playbook in place of
+    destroying the instances.  They are not configured by default.
+
+    .. code-block:: yaml
+
+        provisioner:
+          name: ansible
+          playbooks:
+            snapshot: snapshot.yml
+            restore: restore.yml
+
+    The idempotence action replays the converge playbook by default.  Roles
+    which support Ansible's check mode may run the replay with ``--check`` and
+    ``--diff`` instead, so no changes are applied.  The replay may also start
+    at the first task which changed during the last converge, with
+    ``--start-at-task``, skipping the tasks which were already idempotent.
+    This is a heuristic: the facts set or registered by the skipped tasks are
+    missing, which may fail or hide the later tasks' changes.  The replay is
+    in full when the converge changed no task.
+
+    .. code-block:: yaml
+
+        provisioner:
+          name: ansible
+          idempotence:
+            check_mode: True
+            start_at_changed: True
+
+    The idempotence replay sizes `ansible-playbook`'s forks to the number of
+    hosts and CPUs, unless `forks` is set in the provisioner's options.
+    Multi-node scenarios may also shard the replay into an `ansible-playbook`
+    per host group, run concurrently with ``--limit``.  Hosts are sharded by
+    their first group.
+
+    .. code-block:: yaml
+
+        provisioner:
+          name: ansible
+          idempotence:
+            shard: True
+
+    Each `ansible-playbook` is executed as a new process by default, which
+    imports Ansible afresh.  The `worker` executor imports Ansible once in a
+    long-lived process, and forks it to execute each playbook of the
+    scenario's sequence.  The worker uses the Python interpreter running
+    Molecule, which must be able to import Ansible.  A new process is still
+    used when `ansible-playbook` is not a script of that interpreter, such as
+    a wrapper, and for sharded replays, whose output is prefixed.
+
+    .. code-block:: yaml
+
+        provisioner:
+          name: ansible
+          executor: worker
+
     Environment variables.  Molecule does it's best to handle common Ansible
     paths.  The defaults are as follows.
 
@@ -136,6 +199,8 @@ class Ansible(base.Base):
           $project_root/library/:$ephemeral_directory/library/
         ANSIBLE_FILTER_PLUGINS:
           $project_root/filter/plugins/:$ephemeral_directory/plugins/filters/
+        ANSIBLE_CALLBACK_PLUGINS:
+          $project_root/plugins/callbacks/:$ephemeral_directory/plugins/callbacks/
 
     Environment variables can be passed to the provisioner.  Variables in this
     section which match the names above will be appened to the above defaults,
@@ -166,6 +231,40 @@ class Ansible(base.Base):
             ssh_connection:
               scp_if_ssh: True
 
+    Facts are gathered once, and cached in a file per instance in the
+    `facts` directory of the ephemeral directory, so the actions of a
+    sequence reuse them.  The cache is cleared when the instances are
+    created, restored or destroyed, and after each converge, so the actions
+    following a converge gather the facts it changed.  Its path is exported
+    as `MOLECULE_FACT_CACHE_DIRECTORY`, and Testinfra's Ansible backend
+    shares Molecule's ansible.cfg.  Restore Ansible's defaults to gather the
+    facts on every play.
+
+    .. code-block:: yaml
+
+        provisioner:
+          name: ansible
+          config_options:
+            defaults:
+              gathering: implicit
+              fact_caching: memory
+
+    Molecule tunes ansible.cfg for the drivers connecting over SSH.  It
+    enables pipelining, which requires `requiretty` to be disabled in the
+    instances' sudoers, and persists the SSH master connections for a minute
+    per action of the `test_sequence`.  The control sockets are kept in the
+    ephemeral directory, unless its path is too long for a socket, in which
+    case Ansible's default directory is used.  Each of
+    these may be overridden in the `config_options`.
+
+    .. code-block:: yaml
+
+        provisioner:
+          name: ansible
+          config_options:
+            ssh_connection:
+              pipelining: False
+
     Import options defined in an existing ansible.cfg into Molecule's
     ansible.cfg.
 
@@ -243,6 +342,7 @@ class Ansible(base.Base):
         """
         super(Ansible, self).__init__(config)
         self._ansible_playbooks = ansible_playbooks.AnsiblePlaybooks(config)
+        self._inventory = None
 
     @property
     def ansible_config_options(self):
@@ -266,10 +366,17 @@ class Ansible(base.Base):
     def default_config_options(self):
         """
         Default options provided to construct ansible.cfg and returns a dict.
+        The forks are sized to the instances, and facts are gathered once and
+        cached per instance in the ephemeral directory.  Drivers connecting
+        over SSH also enable pipelining, persist the master connections for
+        the duration of the test sequence, and name their sockets by a hash
+        of the connection, in the ephemeral directory when the path is short
+        enough for a socket.
 
         :return: dict
         """
-        return {
+        hosts = [p['name'] for p in self._config.platforms.instances]
+        d = {
             'defaults': {
                 'ansible_managed':
                 'Ansible managed: Do NOT edit this file manually!',
@@ -279,6 +386,14 @@ class Ansible(base.Base):
                 False,
                 'nocows':
                 1,
+                'forks':
+                max(5, self._get_forks(hosts)),
+                'gathering':
+                'smart',
+                'fact_caching':
+                'jsonfile',
+                'fact_caching_connection':
+                self.fact_cache_directory,
             },
             'ssh_connection': {
                 'scp_if_ssh': True,
@@ -286,6 +401,21 @@ class Ansible(base.Base):
             },
         }
 
+        # Only the drivers connecting over SSH provide SSH connection options.
+        if self._config.driver.default_ssh_connection_options:
+            ssh_connection = d['ssh_connection']
+            ssh_connection['pipelining'] = True
+            ssh_connection['ssh_args'] = (
+                '-C -o ControlMaster=auto -o ControlPersist={}s'
+            ).format(self._config.driver.ssh_control_persist)
+            ssh_connection['control_path'] = '%(directory)s/%%C'
+            control_path_dir = os.path.join(
+                self._config.scenario.ephemeral_directory, 'cp')
+            if len(control_path_dir) <= MAX_CONTROL_PATH_DIR_LENGTH:
+                ssh_connection['control_path_dir'] = control_path_dir
+
+        return d
+
     @property
     def default_options(self):
         d = {}
@@ -329,6 +459,18 @@ class Ansible(base.Base):
                     os.path.join(self._config.scenario.ephemeral_directory,
                                  'plugins', 'filters')),
             ]),
+            'ANSIBLE_CALLBACK_PLUGINS':
+            ':'.join([
+                self._get_callback_plugin_directory(),
+                util.abs_path(
+                    os.path.join(self._config.project_directory, 'plugins',
+                                 'callbacks')),
+                util.abs_path(
+                    os.path.join(self._config.scenario.ephemeral_directory,
+                                 'plugins', 'callbacks')),
+            ]),
+            'MOLECULE_EVENTS_FILE':
+            self.events_file,
         })
         env = self._config.merge_dicts(env, self._config.env)
 
@@ -338,6 +480,11 @@ class Ansible(base.Base):
     def name(self):
         return self._config.config['provisioner']['name']
 
+    @property
+    def executor(self):
+        return self._config.command_args.get(
+            'executor', self._config.config['provisioner']['executor'])
+
     @property
     def config_options(self):
         return self._config.merge_dicts(
@@ -359,6 +506,7 @@ class Ansible(base.Base):
         roles_path = default_env['ANSIBLE_ROLES_PATH']
         library_path = default_env['ANSIBLE_LIBRARY']
         filter_plugins_path = default_env['ANSIBLE_FILTER_PLUGINS']
+        callback_plugins_path = default_env['ANSIBLE_CALLBACK_PLUGINS']
 
         try:
             path = self.get_abs_path(env['ANSIBLE_ROLES_PATH'])
@@ -378,9 +526,16 @@ class Ansible(base.Base):
         except KeyError:
             pass
 
+        try:
+            path = self.get_abs_path(env['ANSIBLE_CALLBACK_PLUGINS'])
+            callback_plugins_path = '{}:{}'.format(callback_plugins_path, path)
+        except KeyError:
+            pass
+
         env['ANSIBLE_ROLES_PATH'] = roles_path
         env['ANSIBLE_LIBRARY'] = library_path
         env['ANSIBLE_FILTER_PLUGINS'] = filter_plugins_path
+        env['ANSIBLE_CALLBACK_PLUGINS'] = callback_plugins_path
 
         return self._config.merge_dicts(default_env, env)
 
@@ -422,21 +577,10 @@ class Ansible(base.Base):
 
         :return: str
         """
-        dd = self._vivify()
-        for platform in self._config.platforms.instances:
-            for group in platform.get('groups', ['ungrouped']):
-                instance_name = platform['name']
-                connection_options = self.connection_options(instance_name)
-                dd['all']['hosts'][instance_name] = connection_options
-                dd[group]['hosts'][instance_name] = connection_options
-                # Ungrouped
-                dd['ungrouped']['vars'] = {}
-                # Children
-                for child_group in platform.get('children', []):
-                    dd[group]['children'][child_group]['hosts'][
-                        instance_name] = connection_options
+        if self._inventory is None:
+            self._inventory = self._build_inventory()
 
-        return self._default_to_regular(dd)
+        return self._inventory
 
     @property
     def inventory_file(self):
@@ -448,6 +592,15 @@ class Ansible(base.Base):
         return os.path.join(self._config.scenario.ephemeral_directory,
                             'ansible.cfg')
 
+    @property
+    def fact_cache_directory(self):
+        return os.path.join(self._config.scenario.ephemeral_directory, 'facts')
+
+    @property
+    def events_file(self):
+        return os.path.join(self._config.scenario.ephemeral_directory,
+                            'ansible_events.json')
+
     @property
     def playbooks(self):
         return self._ansible_playbooks
@@ -469,6 +622,59 @@ class Ansible(base.Base):
         pb.add_cli_arg('check', True)
         pb.execute()
 
+    def idempotence(self, check_mode=False, start_at_task=None):
+        """
+        Executes `ansible-playbook` against the converge playbook, optionally
+        with the ``--check`` and ``--diff`` flags, or starting at the given
+        task, and returns None.  The forks are sized to the hosts and CPUs,
+        unless set in the provisioner's options.  When sharding is enabled,
+        an `ansible-playbook` runs concurrently per host group, and their
+        events are merged into the events file.
+
+        :param check_mode: An optional bool to run in check mode.
+        :param start_at_task: An optional string containing the name of the
+         task to start at.
+        :return: None
+        """
+        shards = self._get_idempotence_shards()
+        if len(shards) < 2:
+            hosts = [p['name'] for p in self._config.platforms.instances]
+            pb = self._get_ansible_playbook(self.playbooks.converge)
+            self._add_idempotence_args(pb, hosts, check_mode, start_at_task)
+            pb.execute()
+            return
+
+        running = []
+        for name, hosts in shards:
+            events_file = '{}.{}'.format(self.events_file, name)
+            pb = self._get_ansible_playbook(
+                self.playbooks.converge,
+                out=_prefix_output(name, LOG.out),
+                err=_prefix_output(name, LOG.error))
+            self._add_idempotence_args(pb, hosts, check_mode, start_at_task)
+            pb.add_cli_arg('limit', ','.join(hosts))
+            pb.add_env_arg('MOLECULE_EVENTS_FILE', events_file)
+            running.append((name, events_file, pb.start()))
+
+        failed = []
+        with open(self.events_file, 'w') as events:
+            for name, events_file, cmd in running:
+                try:
+                    cmd.wait()
+                except sh.ErrorReturnCode as e:
+                    failed.append((name, e.exit_code))
+
+                if os.path.isfile(events_file):
+                    with open(events_file) as stream:
+                        shutil.copyfileobj(stream, events)
+                    os.remove(events_file)
+
+        if failed:
+            msg = 'Idempotence shard(s) failed:\n{}'.format(
+                '\n'.join("* '{}' exited with code {}".format(name, code)
+                          for name, code in failed))
+            util.sysexit_with_message(msg, failed[0][1])
+
     def converge(self, playbook=None, **kwargs):
         """
         Executes `ansible-playbook` against the converge playbook unless
@@ -516,6 +722,26 @@ class Ansible(base.Base):
         pb = self._get_ansible_playbook(self.playbooks.create)
         pb.execute()
 
+    def snapshot(self):
+        """
+        Executes `ansible-playbook` against the snapshot playbook and returns
+        None.
+
+        :return: None
+        """
+        pb = self._get_ansible_playbook(self.playbooks.snapshot)
+        pb.execute()
+
+    def restore(self):
+        """
+        Executes `ansible-playbook` against the restore playbook and returns
+        None.
+
+        :return: None
+        """
+        pb = self._get_ansible_playbook(self.playbooks.restore)
+        pb.execute()
+
     def syntax(self):
         """
         Executes `ansible-playbook` against the converge playbook with the
@@ -527,6 +753,91 @@ class Ansible(base.Base):
         pb.add_cli_arg('syntax-check', True)
         pb.execute()
 
+    def events(self):
+        """
+        Reads the events emitted by the bundled `molecule_events` callback
+        plugin during the last `ansible-playbook` run, and yields a dict per
+        event.  The file is read a line at a time, so the run's output is
+        never held in memory.
+
+        :return: generator
+        """
+        if not os.path.isfile(self.events_file):
+            return
+
+        with open(self.events_file) as stream:
+            for line in stream:
+                line = line.strip()
+                if line:
+                    yield json.loads(line)
+
+    def changed_tasks(self):
+        """
+        Parses the events of the last `ansible-playbook` run, and returns a
+        list containing the names of the tasks which changed on any host, in
+        the order they ran.  Handlers are omitted.  Returns None when the
+        run's events are incomplete, as the changed tasks are then unknown.
+
+        :return: list
+        """
+        handlers = set()
+        tasks = []
+        stats = False
+        for event in self.events():
+            if event.get('event') == 'stats':
+                stats = True
+            elif event.get('event') == 'task_start' and event.get('handler'):
+                handlers.add(event['task'])
+            elif (event.get('event') == 'ok' and event.get('changed')
+                  and event['task'] not in handlers
+                  and event['task'] not in tasks):
+                tasks.append(event['task'])
+
+        if not stats:
+            return
+
+        return tasks
+
+    def fingerprint(self):
+        """
+        Compute a digest of the converge's inputs and returns a string.  The
+        inputs are the role, excluding the verifier's tests, the converge
+        playbook, the generated inventory, host and group vars and config
+        file, the roles installed by the dependency manager, and the
+        `ansible-playbook` options and arguments.  The ephemeral directories
+        of every scenario are skipped, so other scenarios' runs do not
+        change the digest.
+
+        :return: str
+        """
+        ephemeral_directory = self._config.scenario.ephemeral_directory
+        paths = [
+            self._config.project_directory,
+            self.playbooks.converge,
+            self.inventory_file,
+            self.config_file,
+            os.path.join(ephemeral_directory, 'host_vars'),
+            os.path.join(ephemeral_directory, 'group_vars'),
+            os.path.join(ephemeral_directory, 'roles'),
+        ]
+        excludes = [
+            scenario.MOLECULE_EPHEMERAL_DIRECTORY,
+            self._config.verifier.directory,
+            '.git',
+            '.tox',
+            '.vagrant',
+            '__pycache__',
+        ]
+        options = util.safe_dump({
+            'options':
+            self.options,
+            'ansible_args':
+            list(self._config.ansible_args),
+        })
+        digest = util.fingerprint(paths, excludes) + options
+
+        return hashlib.sha1(digest.encode('utf-8')).hexdigest()
+
     def write_config(self):
         """
         Writes the provisioner's config file to disk and returns None.
@@ -558,37 +869,41 @@ class Ansible(base.Base):
 
     def _add_or_update_vars(self):
         """
-        Creates host and/or group vars and returns None.
+        Creates host and/or group vars and returns None.  Files whose content
+        is unchanged are not written.
 
         :returns: None
         """
-        for target in ['host_vars', 'group_vars']:
-            if target == 'host_vars':
-                vars_target = copy.deepcopy(self.host_vars)
-                for instance_name, _ in self.host_vars.items():
-                    if instance_name == 'localhost':
-                        instance_key = instance_name
-                    else:
-                        instance_key = instance_name
-
-                    vars_target[instance_key] = vars_target.pop(instance_name)
-
-            elif target == 'group_vars':
-                vars_target = self.group_vars
+        ephemeral_directory = self._config.scenario.ephemeral_directory
+        for target, vars_files in self._get_vars_files().items():
+            target_vars_directory = util.abs_path(
+                os.path.join(ephemeral_directory, target))
+            if not os.path.isdir(target_vars_directory):
+                os.mkdir(target_vars_directory)
+
+            for name, content in vars_files.items():
+                path = os.path.join(target_vars_directory, name)
+                util.write_file(path, content)
+
+    def _get_vars_files(self):
+        """
+        Computes the content of the host and/or group vars files, keyed on
+        the vars directory and the file name, and returns a dict.
 
+        :returns: dict
+        """
+        d = {}
+        for target, vars_target in [
+            ('host_vars', self.host_vars),
+            ('group_vars', self.group_vars),
+        ]:
             if vars_target:
-                ephemeral_directory = self._config.scenario.ephemeral_directory
-                target_vars_directory = os.path.join(ephemeral_directory,
-                                                     target)
+                d[target] = {
+                    name: util.safe_dump(content)
+                    for name, content in vars_target.items()
+                }
 
-                if not os.path.isdir(util.abs_path(target_vars_directory)):
-                    os.mkdir(util.abs_path(target_vars_directory))
-
-                for target in vars_target.keys():
-                    target_var_content = vars_target[target]
-                    path = os.path.join(
-                        util.abs_path(target_vars_directory), target)
-                    util.write_file(path, util.safe_dump(target_var_content))
+        return d
 
     def _write_inventory(self):
         """
@@ -602,23 +917,33 @@ class Ansible(base.Base):
 
     def _remove_vars(self):
         """
-        Remove host and/or group vars and returns None.
+        Remove the host and/or group vars which are no longer configured,
+        and returns None.  Vars files and links which are still configured
+        are kept, so they are not needlessly recreated.
 
         :returns: None
         """
-        dirs = [
-            os.path.join(self._config.scenario.ephemeral_directory,
-                         'group_vars'),
-            os.path.join(self._config.scenario.ephemeral_directory,
-                         'host_vars'),
-        ]
-
-        for d in dirs:
+        ephemeral_directory = self._config.scenario.ephemeral_directory
+        vars_files = {} if self.links else self._get_vars_files()
+        for target in ['group_vars', 'host_vars']:
+            d = os.path.join(ephemeral_directory, target)
             if os.path.islink(d):
-                os.unlink(d)
-            else:
-                if os.path.exists(d):
+                source = self.links.get(target)
+                if not source or os.readlink(d) != os.path.join(
+                        ephemeral_directory, source):
+                    os.unlink(d)
+            elif os.path.isdir(d):
+                if target not in vars_files:
                     shutil.rmtree(d)
+                    continue
+
+                for name in os.listdir(d):
+                    if name not in vars_files[target]:
+                        path = os.path.join(d, name)
+                        if os.path.isdir(path):
+                            shutil.rmtree(path)
+                        else:
+                            os.remove(path)
 
     def _link_or_update_vars(self):
         """
@@ -634,6 +959,8 @@ class Ansible(base.Base):
             if not os.path.exists(source):
                 msg = "The source path '{}' does not exist.".format(source)
                 util.sysexit_with_message(msg)
+            if os.path.islink(target) and os.readlink(target) == source:
+                continue
             msg = "Inventory {} linked to {}".format(source, target)
             LOG.info(msg)
             os.symlink(source, target)
@@ -650,6 +977,52 @@ class Ansible(base.Base):
         return ansible_playbook.AnsiblePlaybook(playbook, self._config,
                                                 **kwargs)
 
+    def _add_idempotence_args(self, pb, hosts, check_mode, start_at_task):
+        """
+        Adds the idempotence arguments to the given `ansible-playbook` and
+        returns None.
+
+        :param pb: An instance of AnsiblePlaybook.
+        :param hosts: A list containing the names of the targeted hosts.
+        :param check_mode: A bool to run in check mode.
+        :param start_at_task: A string containing the name of the task to
+         start at, or None.
+        :return: None
+        """
+        if check_mode:
+            pb.add_cli_arg('check', True)
+            pb.add_cli_arg('diff', True)
+        pb.add_cli_arg('start-at-task', start_at_task)
+        if 'forks' not in self.options:
+            pb.add_cli_arg('forks', self._get_forks(hosts))
+
+    def _get_forks(self, hosts):
+        """
+        Size the forks to the given hosts, capped at the larger of Ansible's
+        default and the CPU count, and returns an int.
+
+        :param hosts: A list containing the names of the targeted hosts.
+        :return: int
+        """
+        return min(len(hosts), max(5, multiprocessing.cpu_count()))
+
+    def _get_idempotence_shards(self):
+        """
+        Partition the hosts by their first group, when sharding is enabled,
+        and returns a sorted list of (group, hosts) tuples.
+
+        :return: list
+        """
+        if not self._config.config['provisioner']['idempotence']['shard']:
+            return []
+
+        shards = {}
+        for platform in self._config.platforms.instances:
+            group = (platform.get('groups') or ['ungrouped'])[0]
+            shards.setdefault(group, []).append(platform['name'])
+
+        return sorted(shards.items())
+
     def _verify_inventory(self):
         """
         Verify the inventory is valid and returns None.
@@ -676,19 +1049,32 @@ class Ansible(base.Base):
 {% endfor -%}
 """.strip()
 
-    def _vivify(self):
+    def _build_inventory(self):
         """
-        Returns an autovivification default dict.
+        Build the inventory in a single pass over the platforms, computing
+        each instance's connection options once, and returns a dict.
 
         :return: dict
         """
-        return collections.defaultdict(self._vivify)
-
-    def _default_to_regular(self, d):
-        if isinstance(d, collections.defaultdict):
-            d = {k: self._default_to_regular(v) for k, v in d.items()}
+        inventory = {}
+        for platform in self._config.platforms.instances:
+            instance_name = platform['name']
+            connection_options = self.connection_options(instance_name)
+            inventory.setdefault('all', {}).setdefault(
+                'hosts', {})[instance_name] = connection_options
+            # Ungrouped
+            inventory.setdefault('ungrouped', {})['vars'] = {}
+            for group in platform.get('groups', ['ungrouped']):
+                group_dict = inventory.setdefault(group, {})
+                group_dict.setdefault('hosts',
+                                      {})[instance_name] = connection_options
+                # Children
+                for child_group in platform.get('children', []):
+                    children = group_dict.setdefault('children', {})
+                    children.setdefault(child_group, {}).setdefault(
+                        'hosts', {})[instance_name] = connection_options
 
-        return d
+        return inventory
 
     def _get_plugin_directory(self):
         return os.path.join(
@@ -703,8 +1089,32 @@ class Ansible(base.Base):
         return util.abs_path(
             os.path.join(self._get_plugin_directory(), 'filters'))
 
+    def _get_callback_plugin_directory(self):
+        return util.abs_path(
+            os.path.join(self._get_plugin_directory(), 'callbacks'))
+
     def _ansible_config_to_dict(self, cfg):
         return {s: dict(cfg.items(s)) for s in cfg.sections()}
 
     def _load_ansible_config_file(self):
+        # NOTE: Imported on use, since loading Ansible's constants parses its
+        # configuration, and dominates the CLI's startup time.
+        import ansible.constants
+
         return ansible.constants.load_config_file()
+
+
+def _prefix_output(name, func):
+    """
+    Wrap the given output function to prefix each line with the name, and
+    returns a function.
+
+    :param name: A string to prefix the lines with.
+    :param func: A function to process the prefixed lines.
+    :return: function
+    """
+
+    def wrapper(line):
+        func('[{}] {}'.format(name, line))
+
+    return wrapper
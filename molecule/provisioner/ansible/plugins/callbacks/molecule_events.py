@@ -0,0 +1,103 @@
+#  Copyright (c) 2015-2017 Cisco Systems, Inc.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to
+#  deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+#  sell copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+
+from __future__ import absolute_import
+
+import json
+import os
+import time
+
+from ansible.plugins.callback import CallbackBase
+
+
+class CallbackModule(CallbackBase):
+    """
+    Streams task and host events as JSON documents, one per line, to the file
+    named by the `MOLECULE_EVENTS_FILE` environment variable.  The callback
+    does nothing when the variable is not set.
+
+    .. code-block:: json
+
+        {"event": "task_start", "task": "Install foo", "time": 1500000000.0}
+        {"event": "ok", "task": "Install foo", "host": "instance",
+         "changed": true, "duration": 1.5}
+    """
+    CALLBACK_VERSION = 2.0
+    CALLBACK_TYPE = 'notification'
+    CALLBACK_NAME = 'molecule_events'
+    CALLBACK_NEEDS_WHITELIST = False
+
+    def __init__(self, *args, **kwargs):
+        super(CallbackModule, self).__init__(*args, **kwargs)
+        self._task_start = {}
+        self._stream = None
+
+        events_file = os.environ.get('MOLECULE_EVENTS_FILE')
+        if events_file:
+            self._stream = open(events_file, 'w')
+
+    def v2_playbook_on_task_start(self, task, is_conditional):
+        self._task_start[task._uuid] = time.time()
+        self._emit('task_start', task=task.get_name())
+
+    def v2_playbook_on_handler_task_start(self, task):
+        self._task_start[task._uuid] = time.time()
+        self._emit('task_start', task=task.get_name(), handler=True)
+
+    def v2_runner_on_ok(self, result):
+        self._emit_result('ok', result)
+
+    def v2_runner_on_failed(self, result, ignore_errors=False):
+        self._emit_result('failed', result, ignore_errors=ignore_errors)
+
+    def v2_runner_on_skipped(self, result):
+        self._emit_result('skipped', result)
+
+    def v2_runner_on_unreachable(self, result):
+        self._emit_result('unreachable', result)
+
+    def v2_playbook_on_stats(self, stats):
+        hosts = sorted(stats.processed.keys())
+        self._emit('stats', hosts={h: stats.summarize(h) for h in hosts})
+
+        if self._stream:
+            self._stream.close()
+            self._stream = None
+
+    def _emit_result(self, event, result, **kwargs):
+        task = result._task
+        start = self._task_start.get(task._uuid, time.time())
+
+        self._emit(
+            event,
+            task=task.get_name(),
+            host=result._host.get_name(),
+            changed=bool(result._result.get('changed', False)),
+            duration=time.time() - start,
+            **kwargs)
+
+    def _emit(self, event, **kwargs):
+        if not self._stream:
+            return
+
+        kwargs['event'] = event
+        kwargs['time'] = time.time()
+        self._stream.write(json.dumps(kwargs) + '\n')
+        self._stream.flush()
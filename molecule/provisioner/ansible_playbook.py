@@ -18,10 +18,13 @@
 #  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 #  DEALINGS IN THE SOFTWARE.
 
+import os
+
 import sh
 
 from molecule import logger
 from molecule import util
+from molecule.provisioner import ansible_worker
 
 LOG = logger.get_logger(__name__)
 
@@ -85,6 +88,13 @@ class AnsiblePlaybook(object):
         if self._ansible_command is None:
             self.bake()
 
+        self._remove_events_file()
+        if (self._config.provisioner.executor == 'worker'
+                and self._out == LOG.out and self._err == LOG.error):
+            worker = self._get_worker()
+            if worker:
+                return self._execute_in_worker(worker)
+
         try:
             cmd = util.run_command(
                 self._ansible_command, debug=self._config.debug)
@@ -93,6 +103,92 @@ class AnsiblePlaybook(object):
             out = e.stdout.decode('utf-8')
             util.sysexit_with_message(str(out), e.exit_code)
 
+    def start(self):
+        """
+        Starts `ansible-playbook` in the background and returns a ``sh``
+        object, to be waited on by the caller.
+
+        :return: ``sh`` object
+        """
+        if self._ansible_command is None:
+            self.bake()
+
+        self._remove_events_file()
+        return util.run_command(
+            self._ansible_command.bake(_bg=True), debug=self._config.debug)
+
+    def _remove_events_file(self):
+        """
+        Remove the events file left by a previous run, so a run which emits
+        no events is not mistaken for it, and returns None.
+
+        :return: None
+        """
+        events_file = self._env.get('MOLECULE_EVENTS_FILE')
+        if events_file and os.path.isfile(events_file):
+            os.remove(events_file)
+
+    def _get_worker(self):
+        """
+        Get the worker serving the baked command's environment and working
+        directory, and returns an AnsibleWorker, or None when the worker
+        cannot run the command.
+
+        :return: object
+        """
+        # WARN: Uses internal ``sh`` data structures to dig the executable,
+        # environment and working directory out of the ``sh.command`` object.
+        try:
+            executable = _decode(self._ansible_command._path)
+            call_args = self._ansible_command._partial_call_args
+            env = call_args['env']
+            cwd = call_args['cwd']
+        except (AttributeError, KeyError):
+            msg = ('Unable to inspect the `ansible-playbook` command, '
+                   'executing it without the worker.')
+            LOG.warn(msg)
+            return
+
+        if not ansible_worker.runs_under_interpreter(executable):
+            msg = ('`ansible-playbook` is not a script of the Python '
+                   'interpreter running Molecule, executing it without the '
+                   'worker.')
+            LOG.warn(msg)
+            return
+
+        worker = ansible_worker.get_worker(executable, env, cwd)
+        if not worker:
+            msg = ('Unable to import Ansible, executing `ansible-playbook` '
+                   'without the worker.')
+            LOG.warn(msg)
+
+        return worker
+
+    def _execute_in_worker(self, worker):
+        """
+        Executes `ansible-playbook` in the given worker and returns a string.
+        The output is written straight to STDOUT and STDERR, so the string is
+        empty, as when the output is processed by the default functions.  The
+        worker is only used with those functions.
+
+        :param worker: An instance of AnsibleWorker.
+        :return: str
+        """
+        if self._config.debug:
+            util.print_environment_vars(
+                self._ansible_command._partial_call_args['env'])
+            util.print_debug('COMMAND', str(self._ansible_command))
+
+        args = [
+            _decode(arg) for arg in self._ansible_command._partial_baked_args
+        ]
+        exit_code = worker.run(args)
+        if exit_code:
+            msg = '`ansible-playbook` exited with code {}.'.format(exit_code)
+            util.sysexit_with_message(msg, exit_code)
+
+        return ''
+
     def add_cli_arg(self, name, value):
         """
         Adds argument to CLI passed to ansible-playbook and returns None.
@@ -114,3 +210,10 @@ class AnsiblePlaybook(object):
         :return: None
         """
         self._env[name] = value
+
+
+def _decode(value):
+    if isinstance(value, bytes):
+        return value.decode('utf-8')
+
+    return value
@@ -56,6 +56,14 @@ class AnsiblePlaybooks(object):
     def side_effect(self):
         return self._get_ansible_playbook('side_effect')
 
+    @property
+    def snapshot(self):
+        return self._get_ansible_playbook('snapshot')
+
+    @property
+    def restore(self):
+        return self._get_ansible_playbook('restore')
+
     def _get_ansible_playbook(self, section):
         c = self._config.config
         driver_dict = c['provisioner']['playbooks'].get(
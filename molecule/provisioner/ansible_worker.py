@@ -0,0 +1,288 @@
+#  Copyright (c) 2015-2017 Cisco Systems, Inc.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to
+#  deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+#  sell copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+
+import atexit
+import json
+import os
+import runpy
+import sys
+
+from molecule import logger
+
+LOG = logger.get_logger(__name__)
+
+_workers = {}
+
+
+class AnsibleWorker(object):
+    """
+    A long-lived process which imports Ansible once, and forks a child to
+    run each `ansible-playbook`, so the runs skip Ansible's cold start.
+
+    Ansible reads its configuration from the environment when it is
+    imported, so a worker only serves the runs with the environment and the
+    working directory it was started with.  The runs write to Molecule's
+    STDOUT and STDERR.
+    """
+
+    def __init__(self, executable, env, cwd):
+        """
+        Starts the worker and returns None.
+
+        :param executable: A string containing the path to the
+         `ansible-playbook` executable.
+        :param env: A dict containing the environment of the runs.
+        :param cwd: A string containing the working directory of the runs.
+        :return: None
+        """
+        self._executable = executable
+        self._env = dict(env)
+        self._cwd = cwd
+
+        request_r, request_w = os.pipe()
+        response_r, response_w = os.pipe()
+        _flush()
+        self._pid = os.fork()
+        if self._pid == 0:  # pragma: no cover
+            os.close(request_w)
+            os.close(response_r)
+            try:
+                _serve(executable, env, cwd, request_r, response_w)
+            finally:
+                os._exit(0)
+
+        os.close(request_r)
+        os.close(response_w)
+        self._requests = os.fdopen(request_w, 'w')
+        self._responses = os.fdopen(response_r)
+        self.ready = self._responses.readline().strip() == '0'
+
+    def serves(self, executable, env, cwd):
+        """
+        Determine if the worker serves runs of the given executable,
+        environment and working directory, and returns a bool.
+
+        :param executable: A string containing the path to the
+         `ansible-playbook` executable.
+        :param env: A dict containing the environment of the run.
+        :param cwd: A string containing the working directory of the run.
+        :return: bool
+        """
+        return (self.ready and self._executable == executable
+                and self._env == env and self._cwd == cwd)
+
+    def run(self, args):
+        """
+        Runs `ansible-playbook` with the given arguments in a child of the
+        worker, and returns its exit code.
+
+        :param args: A list containing the arguments.
+        :return: int
+        """
+        _flush()
+        self._requests.write(json.dumps(args) + '\n')
+        self._requests.flush()
+        response = self._responses.readline()
+        if not response:
+            self.ready = False
+            return 1
+
+        return int(response)
+
+    def stop(self):
+        """
+        Stops the worker and returns None.
+
+        :return: None
+        """
+        self.ready = False
+        self._requests.close()
+        self._responses.close()
+        os.waitpid(self._pid, 0)
+
+
+def get_worker(executable, env, cwd):
+    """
+    Get the worker of this process serving the given executable, environment
+    and working directory, starting it if need be, and returns an
+    AnsibleWorker, or None if the worker could not import Ansible.
+
+    :param executable: A string containing the path to the `ansible-playbook`
+     executable.
+    :param env: A dict containing the environment of the run.
+    :param cwd: A string containing the working directory of the run.
+    :return: object
+    """
+    worker = _workers.get(os.getpid())
+    if worker and worker.serves(executable, env, cwd):
+        return worker
+
+    stop_worker()
+    worker = AnsibleWorker(executable, env, cwd)
+    if not worker.ready:
+        worker.stop()
+        return
+
+    _workers[os.getpid()] = worker
+
+    return worker
+
+
+def runs_under_interpreter(executable):
+    """
+    Determine if the executable is a Python script of the interpreter
+    running Molecule, which the worker can run, and returns a bool.  Wrapper
+    scripts and scripts of other interpreters are not.
+
+    :param executable: A string containing the path to the executable.
+    :return: bool
+    """
+    try:
+        with open(executable, 'rb') as stream:
+            shebang = stream.readline().decode('utf-8', 'replace')
+    except (IOError, OSError):
+        return False
+
+    args = shebang[2:].split() if shebang.startswith('#!') else []
+    if not args:
+        return False
+
+    interpreter = args[0]
+    if os.path.basename(interpreter) == 'env' and len(args) > 1:
+        interpreter = _which(args[1])
+        if not interpreter:
+            return False
+
+    # Interpreters in the same directory, which resolve to the same binary,
+    # belong to the same installation or virtualenv.
+    return (
+        os.path.normpath(interpreter) == os.path.normpath(sys.executable)
+        or (os.path.dirname(interpreter) == os.path.dirname(sys.executable) and
+            os.path.realpath(interpreter) == os.path.realpath(sys.executable)))
+
+
+@atexit.register
+def stop_worker():
+    """
+    Stops the worker of this process, if any, and returns None.
+
+    :return: None
+    """
+    worker = _workers.pop(os.getpid(), None)
+    if worker:
+        worker.stop()
+
+
+def _serve(executable, env, cwd, requests, responses):  # pragma: no cover
+    """
+    Imports Ansible afresh, then forks a child per request to run
+    `ansible-playbook` until the requests are closed, and returns None.
+
+    :param executable: A string containing the path to the `ansible-playbook`
+     executable.
+    :param env: A dict containing the environment of the runs.
+    :param cwd: A string containing the working directory of the runs.
+    :param requests: An int containing the file descriptor to read the
+     requests from.
+    :param responses: An int containing the file descriptor to write the
+     responses to.
+    :return: None
+    """
+    os.environ.clear()
+    os.environ.update(env)
+    os.chdir(cwd)
+    _purge_ansible()
+    responses = os.fdopen(responses, 'w')
+    try:
+        import ansible.cli.playbook  # noqa
+        responses.write('0\n')
+    except (Exception, SystemExit):
+        responses.write('1\n')
+        return
+    finally:
+        responses.flush()
+
+    requests = os.fdopen(requests)
+    for request in iter(requests.readline, ''):
+        pid = os.fork()
+        if pid == 0:
+            os._exit(_run(executable, json.loads(request)))
+
+        _, status = os.waitpid(pid, 0)
+        if os.WIFEXITED(status):
+            exit_code = os.WEXITSTATUS(status)
+        else:
+            exit_code = 1
+        responses.write('{}\n'.format(exit_code))
+        responses.flush()
+
+
+def _purge_ansible():
+    """
+    Removes the Ansible modules imported by Molecule from the worker's
+    module cache, so Ansible reads its configuration from the runs'
+    environment when imported again, and returns None.
+
+    :return: None
+    """
+    for name in list(sys.modules):
+        if name.split('.')[0] in ('ansible', 'ansible_collections'):
+            del sys.modules[name]
+
+
+def _run(executable, args):  # pragma: no cover
+    """
+    Runs the `ansible-playbook` executable as the main module, and returns
+    its exit code.
+
+    :param executable: A string containing the path to the `ansible-playbook`
+     executable.
+    :param args: A list containing the arguments.
+    :return: int
+    """
+    sys.argv = [executable] + args
+    exit_code = 0
+    try:
+        runpy.run_path(executable, run_name='__main__')
+    except SystemExit as e:
+        if isinstance(e.code, int):
+            exit_code = e.code
+        elif e.code is not None:
+            sys.stderr.write('{}\n'.format(e.code))
+            exit_code = 1
+    except Exception as e:
+        sys.stderr.write('{}\n'.format(e))
+        exit_code = 1
+    finally:
+        _flush()
+
+    return exit_code
+
+
+def _flush():
+    sys.stdout.flush()
+    sys.stderr.flush()
+
+
+def _which(name):
+    for directory in os.environ.get('PATH', '').split(os.pathsep):
+        path = os.path.join(directory, name)
+        if os.path.isfile(path) and os.access(path, os.X_OK):
+            return path
@@ -23,7 +23,9 @@ import os
 import sh
 
 from molecule import logger
+from molecule import scenario
 from molecule import util
+from molecule.lint import cache
 from molecule.provisioner.lint import base
 
 LOG = logger.get_logger(__name__)
@@ -72,6 +74,10 @@ class AnsibleLint(base.Base):
             env:
               FOO: bar
 
+    The playbook is not linted again when neither it, nor the role, changed
+    since it last passed.  The result is cached in the ephemeral directory,
+    and the cache is bypassed with `molecule lint --no-cache`.
+
     .. _`Ansible Lint`: https://github.com/willthames/ansible-lint
     """
 
@@ -84,6 +90,13 @@ class AnsibleLint(base.Base):
         """
         super(AnsibleLint, self).__init__(config)
         self._ansible_lint_command = None
+        self._cache = cache.Cache(
+            config,
+            'ansible-lint',
+            options=self.options,
+            config_files=[
+                os.path.join(config.project_directory, '.ansible-lint'),
+            ])
 
     @property
     def default_options(self):
@@ -115,8 +128,8 @@ class AnsibleLint(base.Base):
             exclude_args,
             self._config.provisioner.playbooks.converge,
             _env=self.env,
-            _out=LOG.out,
-            _err=LOG.error)
+            _out=self._cache.capture(LOG.out),
+            _err=self._cache.capture(LOG.error))
 
     def execute(self):
         if not self.enabled:
@@ -124,6 +137,13 @@ class AnsibleLint(base.Base):
             LOG.warn(msg)
             return
 
+        playbook = self._config.provisioner.playbooks.converge
+        if self._cache.enabled and not self._cache.stale([playbook],
+                                                         self._get_digest):
+            msg = 'Skipping, the role has not changed since the last lint.'
+            LOG.warn(msg)
+            return
+
         if self._ansible_lint_command is None:
             self.bake()
 
@@ -136,5 +156,30 @@ class AnsibleLint(base.Base):
                 self._ansible_lint_command, debug=self._config.debug)
             msg = 'Lint completed successfully.'
             LOG.success(msg)
+            if self._cache.enabled:
+                self._cache.update([playbook])
         except sh.ErrorReturnCode as e:
             util.sysexit(e.exit_code)
+
+    def _get_digest(self, playbook):
+        """
+        Compute a digest of the role and the playbook, which `ansible-lint`
+        follows, and returns a string.  The ephemeral directories of every
+        scenario are skipped.
+
+        :param playbook: A string containing the path to the playbook.
+        :return: str
+        """
+        paths = [
+            self._config.project_directory,
+            playbook,
+        ]
+        excludes = [
+            scenario.MOLECULE_EPHEMERAL_DIRECTORY,
+            '.git',
+            '.tox',
+            '.vagrant',
+            '__pycache__',
+        ]
+
+        return util.fingerprint(paths, excludes)
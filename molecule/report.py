@@ -0,0 +1,206 @@
+#  Copyright (c) 2015-2017 Cisco Systems, Inc.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to
+#  deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+#  sell copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+
+import contextlib
+import json
+import os
+import resource
+import time
+import zlib
+
+from molecule import logger
+
+LOG = logger.get_logger(__name__)
+
+
+def init_trace_file(trace_file):
+    """
+    Truncate the trace file and open its JSON array, and returns None.
+    Phases are appended to the array as they complete, by each scenario's
+    Report_, so the array is never closed.  Trace viewers accept unterminated
+    arrays.
+
+    :param trace_file: A string containing the path to the trace file.
+    :return: None
+    """
+    with open(trace_file, 'w') as stream:
+        stream.write('[\n')
+
+
+class Report(object):
+    """
+    A class which records how long each action of a scenario's sequence takes,
+    and writes a JSON run report to the scenario's ephemeral directory.
+
+    Each action records its wall time, the CPU time used by the child
+    processes it ran, such as `ansible-playbook`, the peak resident set size
+    of those child processes, and its exit code.
+
+    .. code-block:: json
+
+        {
+          "scenario": "default",
+          "driver": "docker",
+          "actions": [
+            {
+              "action": "create",
+              "start": 1500000000.0,
+              "wall_time": 12.5,
+              "cpu_time": {"user": 4.2, "system": 0.9},
+              "max_rss": 81234,
+              "exit_code": 0
+            }
+          ]
+        }
+
+    The peak resident set size is in kilobytes, and is the highest of any
+    child process run so far, as reported by the OS.
+
+    When `--trace-file` is passed to Molecule, each action is also appended
+    to the file as a Chrome trace event, so the runs of a test matrix can be
+    opened in a trace viewer such as `chrome://tracing`.
+
+    .. code-block:: bash
+
+        $ molecule --trace-file trace.json test --all
+    """
+
+    def __init__(self, config):
+        """
+        Initialize a new report class and returns None.
+
+        :param config: An instance of a Molecule config.
+        :returns: None
+        """
+        self._config = config
+        self._actions = []
+        self._trace_started = False
+
+    @property
+    def report_file(self):
+        return os.path.join(self._config.scenario.ephemeral_directory,
+                            'run_report.json')
+
+    @property
+    def trace_file(self):
+        return self._config.args.get('trace_file')
+
+    @property
+    def actions(self):
+        return self._actions
+
+    @contextlib.contextmanager
+    def action(self, name):
+        """
+        Time the action executed within the context, and record it in the
+        report once it completes or exits.
+
+        :param name: A string containing the name of the action.
+        :return: None
+        """
+        start = time.time()
+        before = resource.getrusage(resource.RUSAGE_CHILDREN)
+        exit_code = 0
+        try:
+            yield
+        except SystemExit as e:
+            exit_code = e.code if isinstance(e.code, int) else int(
+                e.code is not None)
+            raise
+        except Exception:
+            exit_code = 1
+            raise
+        finally:
+            wall_time = time.time() - start
+            after = resource.getrusage(resource.RUSAGE_CHILDREN)
+            self.record({
+                'action': name,
+                'start': start,
+                'wall_time': wall_time,
+                'cpu_time': {
+                    'user': after.ru_utime - before.ru_utime,
+                    'system': after.ru_stime - before.ru_stime,
+                },
+                'max_rss': after.ru_maxrss,
+                'exit_code': exit_code,
+            })
+
+    def record(self, action):
+        """
+        Add the action to the report, write the report and trace event to
+        disk, and returns None.
+
+        :param action: A dict describing the action.
+        :return: None
+        """
+        self._actions.append(action)
+        self._write_report_file()
+        if self.trace_file:
+            self._write_trace_events(action)
+
+    def _write_report_file(self):
+        directory = os.path.dirname(self.report_file)
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+
+        data = {
+            'scenario': self._config.scenario.name,
+            'driver': self._config.driver.name,
+            'actions': self._actions,
+        }
+        with open(self.report_file, 'w') as stream:
+            json.dump(data, stream, indent=2, sort_keys=True)
+
+    def _write_trace_events(self, action):
+        pid = os.getpid()
+        tid = zlib.crc32(self._config.scenario.name.encode('utf-8'))
+        events = []
+        if not self._trace_started:
+            events.append({
+                'name': 'thread_name',
+                'ph': 'M',
+                'pid': pid,
+                'tid': tid,
+                'args': {
+                    'name': self._config.scenario.name
+                },
+            })
+            self._trace_started = True
+
+        events.append({
+            'name': action['action'],
+            'cat': 'molecule',
+            'ph': 'X',
+            'ts': int(action['start'] * 1e6),
+            'dur': int(action['wall_time'] * 1e6),
+            'pid': pid,
+            'tid': tid,
+            'args': {
+                'cpu_time': action['cpu_time'],
+                'max_rss': action['max_rss'],
+                'exit_code': action['exit_code'],
+            },
+        })
+
+        # NOTE: A single write per action, to an append-mode file, keeps the
+        # events of concurrently running scenarios intact.
+        lines = ''.join(json.dumps(event) + ',\n' for event in events)
+        with open(self.trace_file, 'a') as stream:
+            stream.write(lines)
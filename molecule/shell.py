@@ -18,37 +18,50 @@
 #  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 #  DEALINGS IN THE SOFTWARE.
 
-import distutils
-import distutils.version
+import os
 
-import ansible
 import click
-import click_completion
 
 import molecule
 from molecule import command
+from molecule import report
 from molecule import util
 
-click_completion.init()
+# NOTE: Shell completion is only initialized when the shell asks for it, as
+# it accounts for a large part of the CLI's startup time.
+if '_MOLECULE_COMPLETE' in os.environ:  # pragma: no cover
+    import click_completion
 
+    click_completion.init()
+
+
+def _allowed(ctx, param, value):  # pragma: no cover
+    import distutils.version
+
+    import ansible
 
-def _allowed():  # pragma: no cover
     if distutils.version.LooseVersion(
             ansible.__version__) <= distutils.version.LooseVersion('2.2'):
         msg = ("Ansible version '{}' not supported.  Molecule only supports "
                'versions >= 2.2.').format(ansible.__version__)
         util.sysexit_with_message(msg)
 
+    return value
+
 
 @click.group()
 @click.option(
     '--debug/--no-debug',
     default=False,
-    callback=_allowed(),
+    callback=_allowed,
     help='Enable or disable debug mode. Default is disabled.')
+@click.option(
+    '--trace-file',
+    type=click.Path(dir_okay=False, writable=True),
+    help='Write the timing of each action as Chrome trace events to a file.')
 @click.version_option(version=molecule.__version__)
 @click.pass_context
-def main(ctx, debug):  # pragma: no cover
+def main(ctx, debug, trace_file):  # pragma: no cover
     """
     \b
      _____     _             _
@@ -65,8 +78,12 @@ def main(ctx, debug):  # pragma: no cover
     ctx.obj = {}
     ctx.obj['args'] = {}
     ctx.obj['args']['debug'] = debug
+    ctx.obj['args']['trace_file'] = trace_file
+    if trace_file:
+        report.init_trace_file(trace_file)
 
 
+main.add_command(command.cache.cache)
 main.add_command(command.check.check)
 main.add_command(command.converge.converge)
 main.add_command(command.create.create)
@@ -81,3 +98,4 @@ main.add_command(command.side_effect.side_effect)
 main.add_command(command.syntax.syntax)
 main.add_command(command.test.test)
 main.add_command(command.verify.verify)
+main.add_command(command.watch.watch)
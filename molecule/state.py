@@ -18,7 +18,11 @@
 #  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 #  DEALINGS IN THE SOFTWARE.
 
+import contextlib
+import fcntl
 import os
+import shutil
+import tempfile
 
 from molecule import logger
 from molecule import util
@@ -27,7 +31,10 @@ LOG = logger.get_logger(__name__)
 VALID_KEYS = [
     'created',
     'converged',
+    'converge_fingerprint',
+    'converge_changed_tasks',
     'driver',
+    'snapshotted',
 ]
 
 
@@ -44,7 +51,13 @@ class State(object):
     throughout a given Molecule config.  The initial state is serialized to
     disk if the file does not exist, otherwise is deserialized from the
     existing state file.  Changes made to the object are immediately
-    serialized.
+    serialized, unless made within a :meth:`.batch`, which serializes its
+    changes once.
+
+    The state file is replaced atomically, and changes are made while holding
+    an exclusive lock on `state.yml.lock`.  The state file is read again under
+    the lock before a change is applied, so concurrent Molecule processes on
+    the same scenario do not lose each other's changes.
 
     State is not a top level option in Molecule's config.  It's purpose is for
     bookkeeping, and each Config_ object has a reference to a State_ object.
@@ -64,13 +77,18 @@ class State(object):
         """
         self._config = config
         self._state_file = self._get_state_file()
+        self._batch_depth = 0
         self._data = self._get_data()
-        self._write_state_file()
+        if not os.path.isfile(self.state_file):
+            self._write_state_file()
 
     def marshal(func):
         def wrapper(self, *args, **kwargs):
-            func(self, *args, **kwargs)
-            self._write_state_file()
+            data = dict(self._data)
+            with self.batch():
+                func(self, *args, **kwargs)
+            self._config.invalidate_cache(
+                k for k in VALID_KEYS if data.get(k) != self._data.get(k))
 
         return wrapper
 
@@ -78,10 +96,55 @@ class State(object):
     def state_file(self):
         return self._state_file
 
+    @property
+    def lock_file(self):
+        return '{}.lock'.format(self.state_file)
+
+    @contextlib.contextmanager
+    def batch(self):
+        """
+        Lock the state file, apply the changes made within the context to
+        the latest state, write the state file once, and returns None.
+
+        .. code-block:: python
+
+            with config.state.batch():
+                config.state.change_state('converged', True)
+                config.state.change_state('converge_fingerprint', digest)
+
+        :return: None
+        """
+        if self._batch_depth:
+            self._batch_depth += 1
+            try:
+                yield
+            finally:
+                self._batch_depth -= 1
+            return
+
+        with open(self.lock_file, 'a') as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            self._batch_depth += 1
+            try:
+                self._data = self._get_data()
+                yield
+                self._write_state_file()
+            finally:
+                self._batch_depth -= 1
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
     @property
     def converged(self):
         return self._data.get('converged')
 
+    @property
+    def converge_fingerprint(self):
+        return self._data.get('converge_fingerprint')
+
+    @property
+    def converge_changed_tasks(self):
+        return self._data.get('converge_changed_tasks')
+
     @property
     def created(self):
         return self._data.get('created')
@@ -90,9 +153,14 @@ class State(object):
     def driver(self):
         return self._data.get('driver')
 
+    @property
+    def snapshotted(self):
+        return self._data.get('snapshotted')
+
     @marshal
     def reset(self):
         self._data = self._default_data()
+        self.remove_fact_cache()
 
     @marshal
     def change_state(self, key, value):
@@ -108,8 +176,22 @@ class State(object):
         """
         if key not in VALID_KEYS:
             raise InvalidState
+        if key == 'created':
+            self.remove_fact_cache()
         self._data[key] = value
 
+    def remove_fact_cache(self):
+        """
+        Remove the facts cached for the instances, which are stale once the
+        instances are created, converged, restored or destroyed, and returns
+        None.
+
+        :return: None
+        """
+        fact_cache_directory = self._config.provisioner.fact_cache_directory
+        if os.path.isdir(fact_cache_directory):
+            shutil.rmtree(fact_cache_directory)
+
     def _get_data(self):
         if os.path.isfile(self.state_file):
             return self._load_file()
@@ -118,15 +200,35 @@ class State(object):
     def _default_data(self):
         return {
             'converged': False,
+            'converge_fingerprint': None,
+            'converge_changed_tasks': None,
             'created': False,
             'driver': None,
+            'snapshotted': False,
         }
 
     def _load_file(self):
         return util.safe_load_file(self.state_file)
 
     def _write_state_file(self):
-        util.write_file(self.state_file, util.safe_dump(self._data))
+        """
+        Write the state to a temporary file, and rename it over the state
+        file, so readers never see a partially written state file, and
+        returns None.
+
+        :return: None
+        """
+        content = util.molecule_prepender(util.safe_dump(self._data))
+        fd, filename = tempfile.mkstemp(
+            dir=os.path.dirname(self.state_file), prefix='.state.yml.')
+        try:
+            with os.fdopen(fd, 'w') as stream:
+                stream.write(content)
+            os.chmod(filename, 0o644)
+            os.rename(filename, self.state_file)
+        except Exception:
+            os.remove(filename)
+            raise
 
     def _get_state_file(self):
         return os.path.join(self._config.scenario.ephemeral_directory,
@@ -21,6 +21,7 @@ from __future__ import print_function
 
 import contextlib
 import fnmatch
+import hashlib
 import jinja2
 import os
 import re
@@ -104,6 +105,49 @@ def os_walk(directory, pattern, excludes=[]):
                 yield filename
 
 
+def fingerprint(paths, excludes=[]):
+    """
+    Compute a digest of the contents of the given files and directories and
+    returns a string.
+
+    :param paths: A list of files and directories to digest.  Paths which do
+     not exist are digested as missing.
+    :param excludes: An optional list of directory names, or absolute paths,
+     to skip when walking directories.  Symlinked directories are digested by
+     their target, rather than walked.
+    :return: str
+    """
+    sha = hashlib.sha1()
+    for path in paths:
+        sha.update(path.encode('utf-8'))
+        if os.path.isfile(path):
+            _fingerprint_file(sha, path)
+            continue
+
+        for root, dirs, files in os.walk(path, topdown=True):
+            dirs[:] = sorted(
+                d for d in dirs
+                if d not in excludes and os.path.join(root, d) not in excludes)
+            for d in dirs:
+                dirname = os.path.join(root, d)
+                if os.path.islink(dirname):
+                    sha.update(os.path.relpath(dirname, path).encode('utf-8'))
+                    sha.update(os.readlink(dirname).encode('utf-8'))
+            for basename in sorted(files):
+                filename = os.path.join(root, basename)
+                if os.path.isfile(filename):
+                    sha.update(os.path.relpath(filename, path).encode('utf-8'))
+                    _fingerprint_file(sha, filename)
+
+    return sha.hexdigest()
+
+
+def _fingerprint_file(sha, filename):
+    with open(filename, 'rb') as stream:
+        for chunk in iter(lambda: stream.read(65536), b''):
+            sha.update(chunk)
+
+
 def render_template(template, **kwargs):
     t = jinja2.Environment()
     t = t.from_string(template)
@@ -113,36 +157,28 @@ def render_template(template, **kwargs):
 
 def write_file(filename, content):
     """
-    Writes a file with the given filename and content and returns None.
+    Writes a file with the given filename and content, prefixed with an
+    informational header, and returns None.  The file is not written when
+    it already contains the same data, so its modification time is kept.
 
     :param filename: A string containing the target filename.
     :param content: A string containing the data to be written.
     :return: None
     """
+    content = molecule_prepender(content)
+    if os.path.isfile(filename):
+        with open_file(filename) as f:
+            if f.read() == content:
+                return
+
     with open_file(filename, 'w') as f:
         f.write(content)
 
-    file_prepender(filename)
-
 
 def molecule_prepender(content):
     return '# Molecule managed\n\n' + content
 
 
-def file_prepender(filename):
-    """
-    Prepend an informational header on files managed by Molecule and returns
-    None.
-
-    :param filename: A string containing the target filename.
-    :return: None
-    """
-    with open_file(filename, 'r+') as f:
-        content = f.read()
-        f.seek(0, 0)
-        f.write(molecule_prepender(content))
-
-
 def safe_dump(data):
     """
     Dump the provided data to a YAML document and returns a string.
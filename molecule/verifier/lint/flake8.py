@@ -24,6 +24,7 @@ import sh
 
 from molecule import logger
 from molecule import util
+from molecule.lint import cache
 from molecule.verifier.lint import base
 
 LOG = logger.get_logger(__name__)
@@ -68,6 +69,10 @@ class Flake8(base.Base):
             env:
               FOO: bar
 
+    Only the tests which changed, or failed, since the last run are linted.
+    Tests which passed are cached in the ephemeral directory, and the cache
+    is bypassed with `molecule lint --no-cache`.
+
     .. _`Flake8`: http://flake8.pycqa.org/en/latest/
     """
 
@@ -82,6 +87,14 @@ class Flake8(base.Base):
         self._flake8_command = None
         if config:
             self._tests = self._get_tests()
+            self._cache = cache.Cache(
+                config,
+                'flake8',
+                options=self.options,
+                config_files=[
+                    os.path.join(config.project_directory, f)
+                    for f in ['setup.cfg', 'tox.ini', '.flake8']
+                ])
 
     @property
     def default_options(self):
@@ -101,8 +114,8 @@ class Flake8(base.Base):
             self.options,
             self._tests,
             _env=self.env,
-            _out=LOG.out,
-            _err=LOG.error)
+            _out=self._cache.capture(LOG.out),
+            _err=self._cache.capture(LOG.error))
 
     def execute(self):
         if not self.enabled:
@@ -115,6 +128,13 @@ class Flake8(base.Base):
             LOG.warn(msg)
             return
 
+        if self._cache.enabled:
+            self._tests = self._cache.stale(self._tests)
+            if not self._tests:
+                msg = 'Skipping, no tests changed since the last lint.'
+                LOG.warn(msg)
+                return
+
         if self._flake8_command is None:
             self.bake()
 
@@ -128,6 +148,9 @@ class Flake8(base.Base):
             LOG.success(msg)
         except sh.ErrorReturnCode as e:
             util.sysexit(e.exit_code)
+        finally:
+            if self._cache.enabled:
+                self._cache.update(self._tests)
 
     def _get_tests(self):
         """
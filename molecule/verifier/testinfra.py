@@ -80,7 +80,26 @@ class Testinfra(base.Base):
             - ../path/to/test_2
             - ../path/to/directory/
 
+    Tests can be distributed across workers, one per host in the inventory,
+    with `pytest-xdist`_.  Each test file is run against each host in
+    parallel, and the results are merged into a single summary and a JUnit
+    XML report in the ephemeral directory.  The number of workers can be
+    changed through the `n` option.  The run is skipped when the inventory has
+    no hosts.  `pytest-xdist`_ is an optional dependency, installed with the
+    `parallel` extra.
+
+    .. code-block:: bash
+
+        $ pip install molecule[parallel]
+
+    .. code-block:: yaml
+
+        verifier:
+          name: testinfra
+          parallel: True
+
     .. _`Testinfra`: http://testinfra.readthedocs.io
+    .. _`pytest-xdist`: https://github.com/pytest-dev/pytest-xdist
     """
 
     def __init__(self, config):
@@ -106,6 +125,11 @@ class Testinfra(base.Base):
             d['debug'] = True
         if self._config.args.get('sudo'):
             d['sudo'] = True
+        if self.parallel:
+            hosts = self._get_hosts()
+            d['hosts'] = ','.join(hosts)
+            d['n'] = max(len(hosts), 1)
+            d['junit-xml'] = self.junit_xml_file
 
         return d
 
@@ -116,6 +140,15 @@ class Testinfra(base.Base):
 
         return env
 
+    @property
+    def parallel(self):
+        return self._config.config['verifier']['parallel']
+
+    @property
+    def junit_xml_file(self):
+        return os.path.join(self._config.scenario.ephemeral_directory,
+                            'testinfra.xml')
+
     @property
     def additional_files_or_dirs(self):
         return self._config.config['verifier']['additional_files_or_dirs']
@@ -150,6 +183,17 @@ class Testinfra(base.Base):
             LOG.warn(msg)
             return
 
+        if self.parallel:
+            if not self._get_hosts():
+                msg = 'Skipping, no hosts found in the inventory.'
+                LOG.warn(msg)
+                return
+            if not _has_xdist():
+                msg = ("The verifier's `parallel` option requires "
+                       'pytest-xdist.  Please install it with '
+                       '`pip install molecule[parallel]`.')
+                util.sysexit_with_message(msg)
+
         if self._testinfra_command is None:
             self.bake()
 
@@ -165,6 +209,16 @@ class Testinfra(base.Base):
         except sh.ErrorReturnCode as e:
             util.sysexit(e.exit_code)
 
+    def _get_hosts(self):
+        """
+        Partition the tests by the hosts in the inventory and returns a list.
+
+        :return: list
+        """
+        inventory = self._config.provisioner.inventory
+
+        return sorted(inventory.get('all', {}).get('hosts', {}).keys())
+
     def _get_tests(self):
         """
         Walk the verifier's directory for tests and returns a list.
@@ -174,3 +228,12 @@ class Testinfra(base.Base):
         return [
             filename for filename in util.os_walk(self.directory, 'test_*.py')
         ]
+
+
+def _has_xdist():
+    try:
+        import xdist  # noqa
+    except ImportError:
+        return False
+
+    return True
@@ -0,0 +1,132 @@
+#  Copyright (c) 2015-2017 Cisco Systems, Inc.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to
+#  deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+#  sell copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+
+import pytest
+import sh
+
+from molecule.command.cache import prune
+
+HASH_1 = '1' * 40
+HASH_2 = '2' * 40
+HASH_3 = '3' * 40
+
+
+@pytest.fixture
+def command_args():
+    return {
+        'subcommand': __name__,
+        'keep': 1,
+    }
+
+
+@pytest.fixture
+def prune_instance(command_args):
+    return prune.Prune(command_args)
+
+
+@pytest.fixture
+def patched_run(mocker):
+    def _run(*args):
+        if args[0] == 'images':
+            return [
+                'molecule_local/centos_7:{}'.format(HASH_1),
+                'molecule_local/centos_7:{}'.format(HASH_2),
+                'molecule_local/centos_7:latest',
+                'molecule_local/centos:7',
+                'molecule_local/ubuntu:{}'.format(HASH_3),
+            ]
+        elif args[0] == 'image':
+            return ['100', '200', '300']
+
+        return []
+
+    return mocker.patch(
+        'molecule.command.cache.prune.Prune._run', side_effect=_run)
+
+
+def test_execute(mocker, patched_run, patched_logger_info,
+                 patched_logger_success, prune_instance):
+    prune_instance.execute()
+
+    x = [
+        mocker.call('images', '--filter', 'reference=molecule_local/*',
+                    '--format', '{{.Repository}}:{{.Tag}}'),
+        mocker.call('image', 'inspect', '--format',
+                    '{{.Metadata.LastTagTime.UnixNano}}',
+                    'molecule_local/centos_7:{}'.format(HASH_1),
+                    'molecule_local/centos_7:{}'.format(HASH_2),
+                    'molecule_local/ubuntu:{}'.format(HASH_3)),
+        mocker.call('rmi', 'molecule_local/centos_7:{}'.format(HASH_1)),
+    ]
+    assert x == patched_run.mock_calls
+
+    x = [
+        mocker.call('Pruning cached images...'),
+        mocker.call('Removing molecule_local/centos_7:{}'.format(HASH_1)),
+    ]
+    assert x == patched_logger_info.mock_calls
+
+    msg = 'Pruned 1 cached image(s).'
+    patched_logger_success.assert_called_once_with(msg)
+
+
+def test_execute_keeps_none(mocker, patched_run, patched_logger_success,
+                            prune_instance):
+    prune_instance._command_args['keep'] = 0
+    prune_instance.execute()
+
+    x = [
+        mocker.call('rmi', 'molecule_local/centos_7:{}'.format(HASH_2)),
+        mocker.call('rmi', 'molecule_local/centos_7:{}'.format(HASH_1)),
+        mocker.call('rmi', 'molecule_local/ubuntu:{}'.format(HASH_3)),
+    ]
+    assert x == patched_run.mock_calls[2:]
+
+    msg = 'Pruned 3 cached image(s).'
+    patched_logger_success.assert_called_once_with(msg)
+
+
+def test_cached_images_without_cached_images(mocker, prune_instance):
+    m = mocker.patch('molecule.command.cache.prune.Prune._run')
+    m.return_value = ['molecule_local/centos:7']
+
+    assert {} == prune_instance._cached_images()
+    assert 1 == m.call_count
+
+
+def test_run(mocker, patched_run_command, prune_instance):
+    patched_run_command.return_value.stdout = b'foo\n\nbar\n'
+    mocker.patch('sh.docker', create=True)
+
+    assert ['foo', 'bar'] == prune_instance._run('images')
+
+
+def test_run_exits_when_command_fails(mocker, patched_run_command,
+                                      patched_logger_critical, prune_instance):
+    patched_run_command.side_effect = sh.ErrorReturnCode_1(
+        'docker images', b'', b'err')
+    mocker.patch('sh.docker', create=True)
+
+    with pytest.raises(SystemExit) as e:
+        prune_instance._run('images')
+
+    assert 1 == e.value.code
+
+    patched_logger_critical.assert_called_once_with('err')
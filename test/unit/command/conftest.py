@@ -47,15 +47,46 @@ def patched_ansible_create(mocker):
     return mocker.patch('molecule.provisioner.ansible.Ansible.create')
 
 
+@pytest.fixture
+def patched_ansible_snapshot(mocker):
+    return mocker.patch('molecule.provisioner.ansible.Ansible.snapshot')
+
+
+@pytest.fixture
+def patched_ansible_restore(mocker):
+    return mocker.patch('molecule.provisioner.ansible.Ansible.restore')
+
+
+@pytest.fixture
+def molecule_driver_snapshot_section_data():
+    return {
+        'driver': {
+            'name': 'docker',
+            'options': {
+                'snapshot': True,
+            },
+        },
+        'provisioner': {
+            'name': 'ansible',
+            'playbooks': {
+                'snapshot': 'snapshot.yml',
+                'restore': 'restore.yml',
+            },
+        },
+    }
+
+
 @pytest.fixture
 def patched_ansible_syntax(mocker):
     return mocker.patch('molecule.provisioner.ansible.Ansible.syntax')
 
 
 @pytest.fixture
-def patched_is_idempotent(mocker):
-    return mocker.patch(
-        'molecule.command.idempotence.Idempotence._is_idempotent')
+def patched_ansible_events(mocker):
+    m = mocker.patch('molecule.provisioner.ansible.Ansible.events')
+    m.return_value = [{'event': 'stats', 'hosts': {}}]
+
+    return m
 
 
 @pytest.fixture
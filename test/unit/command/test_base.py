@@ -18,13 +18,17 @@
 #  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 #  DEALINGS IN THE SOFTWARE.
 
+import copy
+import fcntl
 import os
+import time
 
 import pytest
 
 from molecule import config
 from molecule import util
 from molecule.command import base
+from molecule.lint import cache
 
 
 class ExtendedBase(base.Base):
@@ -74,6 +78,20 @@ def test_prune(base_instance):
     assert not os.path.isdir(baz_directory)
 
 
+def test_prune_keeps_lint_cache(temp_dir, base_instance):
+    lint_file = os.path.join(temp_dir.strpath, 'foo.yml')
+    util.write_file(lint_file, '---\n')
+    c = cache.Cache(base_instance._config, 'yamllint')
+    c.stale([lint_file])
+    c.update([lint_file])
+
+    base_instance.prune()
+
+    assert os.path.isfile(c.cache_file)
+    assert [] == cache.Cache(base_instance._config,
+                             'yamllint').stale([lint_file])
+
+
 def test_print_info(mocker, patched_logger_info, base_instance):
     base_instance.print_info()
     x = [
@@ -98,6 +116,149 @@ def test_execute_subcommand(config_instance):
     assert base.execute_subcommand(config_instance, 'list')
 
 
+def test_execute_subcommand_records_action(config_instance):
+    base.execute_subcommand(config_instance, 'list')
+
+    assert 'list' == config_instance.report.actions[0]['action']
+
+
+def _execute_passes(scenario):
+    msg = 'executed {}\n'.format(scenario.name)
+    os.write(1, msg.encode('utf-8'))
+
+
+def _execute_fails(scenario):
+    _execute_passes(scenario)
+    if scenario.name == 'foo':
+        util.sysexit(2)
+
+
+@pytest.fixture
+def parallel_scenarios(config_instance):
+    config_instance_1 = copy.deepcopy(config_instance)
+
+    config_instance_2 = copy.deepcopy(config_instance)
+    config_instance_2.config['scenario']['name'] = 'foo'
+
+    return [config_instance_1.scenario, config_instance_2.scenario]
+
+
+def test_execute_parallel(capsys, patched_logger_info, patched_logger_success,
+                          parallel_scenarios):
+    base.execute_parallel(parallel_scenarios, _execute_passes, 2)
+    out, _ = capsys.readouterr()
+
+    assert '[default] executed default' in out
+    assert '[foo] executed foo' in out
+
+    patched_logger_info.assert_called_once_with('Summary')
+    assert 2 == patched_logger_success.call_count
+
+
+def test_execute_parallel_exits_when_scenario_fails(
+        capsys, patched_logger_error, patched_logger_success,
+        parallel_scenarios):
+    with pytest.raises(SystemExit) as e:
+        base.execute_parallel(parallel_scenarios, _execute_fails, 2)
+
+    assert 1 == e.value.code
+
+    out, _ = capsys.readouterr()
+    assert '[default] executed default' in out
+    assert '[foo] executed foo' in out
+
+    msg = "Scenario 'default' completed successfully."
+    patched_logger_success.assert_called_once_with(msg)
+    msg = "Scenario 'foo' failed with exit code 2."
+    patched_logger_error.assert_called_once_with(msg)
+
+
+def test_execute_serial(patched_logger_info, patched_logger_success,
+                        parallel_scenarios):
+    base.execute_serial(parallel_scenarios, _execute_passes)
+
+    patched_logger_info.assert_called_once_with('Summary')
+    assert 2 == patched_logger_success.call_count
+
+
+def test_execute_serial_executes_every_scenario_when_first_fails(
+        patched_logger_error, patched_logger_success, parallel_scenarios):
+    executed = []
+
+    def _execute(scenario):
+        executed.append(scenario.name)
+        if scenario.name == 'default':
+            util.sysexit(2)
+
+    with pytest.raises(SystemExit) as e:
+        base.execute_serial(parallel_scenarios, _execute)
+
+    assert 1 == e.value.code
+    assert ['default', 'foo'] == executed
+
+    msg = "Scenario 'default' failed with exit code 2."
+    patched_logger_error.assert_called_once_with(msg)
+    msg = "Scenario 'foo' completed successfully."
+    patched_logger_success.assert_called_once_with(msg)
+
+
+def _execute_exclusively(scenario):
+    # Fails unless no other scenario is executing.
+    with open(os.path.join(os.getcwd(), 'exclusive.lock'), 'a') as f:
+        try:
+            fcntl.flock(f, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except IOError:
+            util.sysexit(3)
+        time.sleep(0.2)
+
+
+def test_execute_parallel_limited_by_driver(
+        patched_logger_info, patched_logger_success, parallel_scenarios):
+    for scenario in parallel_scenarios:
+        scenario.config.config['driver']['options']['concurrency'] = 1
+    base.execute_parallel(
+        parallel_scenarios, _execute_exclusively, 2, limit_by_driver=True)
+
+    assert 2 == patched_logger_success.call_count
+
+
+def test_interleave_by_driver(mocker):
+    def scenario(name, driver_name):
+        m = mocker.Mock()
+        m.name = name
+        m.config.driver.name = driver_name
+
+        return m
+
+    scenarios = [
+        scenario('a', 'docker'),
+        scenario('b', 'docker'),
+        scenario('c', 'docker'),
+        scenario('d', 'vagrant'),
+        scenario('e', 'ec2'),
+    ]
+    x = ['a', 'd', 'e', 'b', 'c']
+
+    assert x == [s.name for s in base._interleave_by_driver(scenarios)]
+
+
+def test_get_driver_semaphores(parallel_scenarios):
+    parallel_scenarios[0].config.config['driver']['options']['concurrency'] = 3
+    parallel_scenarios[1].config.config['driver']['options']['concurrency'] = 2
+    semaphores = base._get_driver_semaphores(parallel_scenarios)
+
+    assert ['docker'] == list(semaphores.keys())
+    assert semaphores['docker'].acquire(False)
+    assert semaphores['docker'].acquire(False)
+    assert not semaphores['docker'].acquire(False)
+
+
+def test_execute_buffered(parallel_scenarios):
+    result = base._execute_buffered(_execute_fails, parallel_scenarios[1])
+
+    assert ('foo', 2, 'executed foo\n') == result
+
+
 def test_get_configs(config_instance):
     molecule_file = config_instance.molecule_file
     data = config_instance.config
@@ -109,16 +270,25 @@ def test_get_configs(config_instance):
     assert isinstance(result[0], config.Config)
 
 
+def test_get_configs_only_builds_targeted_scenario(config_instance):
+    molecule_file = config_instance.molecule_file
+    data = config_instance.config
+    util.write_file(molecule_file, util.safe_dump(data))
+
+    assert 1 == len(base.get_configs({}, {}, scenario_name='default'))
+    assert [] == base.get_configs({}, {}, scenario_name='invalid')
+
+
 def test_get_configs_calls_verify_configs(patched_verify_configs):
     base.get_configs({}, {})
 
     patched_verify_configs.assert_called_once_with([])
 
 
-def test_verify_configs(config_instance):
-    configs = [config_instance]
+def test_verify_configs():
+    scenarios = [('default', '/foo/molecule.yml')]
 
-    assert base._verify_configs(configs) is None
+    assert base._verify_configs(scenarios) is None
 
 
 def test_verify_configs_raises_with_no_configs(patched_logger_critical):
@@ -131,11 +301,13 @@ def test_verify_configs_raises_with_no_configs(patched_logger_critical):
     patched_logger_critical.assert_called_once_with(msg)
 
 
-def test_verify_configs_raises_with_duplicate_configs(patched_logger_critical,
-                                                      config_instance):
+def test_verify_configs_raises_with_duplicate_configs(patched_logger_critical):
     with pytest.raises(SystemExit) as e:
-        configs = [config_instance, config_instance]
-        base._verify_configs(configs)
+        scenarios = [
+            ('default', '/foo/molecule.yml'),
+            ('default', '/bar/molecule.yml'),
+        ]
+        base._verify_configs(scenarios)
 
     assert 1 == e.value.code
 
@@ -18,6 +18,8 @@
 #  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 #  DEALINGS IN THE SOFTWARE.
 
+import os
+
 from molecule.command import converge
 
 
@@ -36,3 +38,77 @@ def test_execute(mocker, patched_logger_info, patched_ansible_converge,
     patched_ansible_converge.assert_called_once_with()
 
     assert config_instance.state.converged
+
+
+def test_execute_removes_fact_cache(patched_ansible_converge, config_instance):
+    fact_cache_directory = config_instance.provisioner.fact_cache_directory
+    os.makedirs(fact_cache_directory)
+    c = converge.Converge(config_instance)
+    c.execute()
+
+    assert not os.path.exists(fact_cache_directory)
+
+
+def test_execute_records_fingerprint(mocker, patched_ansible_converge,
+                                     config_instance):
+    m = mocker.patch('molecule.provisioner.ansible.Ansible.fingerprint')
+    m.return_value = 'patched-fingerprint'
+    c = converge.Converge(config_instance)
+    c.execute()
+
+    assert 'patched-fingerprint' == config_instance.state.converge_fingerprint
+
+
+def test_execute_records_changed_tasks(mocker, patched_ansible_converge,
+                                       config_instance):
+    m = mocker.patch('molecule.provisioner.ansible.Ansible.changed_tasks')
+    m.return_value = ['foo', 'bar']
+    c = converge.Converge(config_instance)
+    c.execute()
+
+    assert ['foo', 'bar'] == config_instance.state.converge_changed_tasks
+
+
+def test_execute_skips_when_inputs_unchanged(mocker, patched_logger_warn,
+                                             patched_ansible_converge,
+                                             config_instance):
+    m = mocker.patch('molecule.provisioner.ansible.Ansible.fingerprint')
+    m.return_value = 'patched-fingerprint'
+    config_instance.state.change_state('converged', True)
+    config_instance.state.change_state('converge_fingerprint',
+                                       'patched-fingerprint')
+    c = converge.Converge(config_instance)
+    c.execute()
+
+    msg = 'Skipping, instances converged and inputs unchanged.'
+    patched_logger_warn.assert_called_once_with(msg)
+
+    assert not patched_ansible_converge.called
+
+
+def test_execute_converges_when_inputs_changed(
+        mocker, patched_ansible_converge, config_instance):
+    m = mocker.patch('molecule.provisioner.ansible.Ansible.fingerprint')
+    m.return_value = 'patched-fingerprint'
+    config_instance.state.change_state('converged', True)
+    config_instance.state.change_state('converge_fingerprint', 'stale')
+    c = converge.Converge(config_instance)
+    c.execute()
+
+    patched_ansible_converge.assert_called_once_with()
+
+    assert 'patched-fingerprint' == config_instance.state.converge_fingerprint
+
+
+def test_execute_converges_when_forced(mocker, patched_ansible_converge,
+                                       config_instance):
+    m = mocker.patch('molecule.provisioner.ansible.Ansible.fingerprint')
+    m.return_value = 'patched-fingerprint'
+    config_instance.command_args = {'subcommand': 'converge', 'force': True}
+    config_instance.state.change_state('converged', True)
+    config_instance.state.change_state('converge_fingerprint',
+                                       'patched-fingerprint')
+    c = converge.Converge(config_instance)
+    c.execute()
+
+    patched_ansible_converge.assert_called_once_with()
@@ -64,3 +64,44 @@ def test_execute_skips_when_instances_already_created(
     patched_logger_warn.assert_called_once_with(msg)
 
     assert not patched_ansible_create.called
+
+
+def test_execute_snapshots_instances(
+        patched_create_setup, molecule_driver_snapshot_section_data,
+        patched_ansible_create, patched_ansible_snapshot, config_instance):
+    config_instance.merge_dicts(config_instance.config,
+                                molecule_driver_snapshot_section_data)
+    c = create.Create(config_instance)
+    c.execute()
+
+    patched_ansible_snapshot.assert_called_once_with()
+
+    assert config_instance.state.snapshotted
+
+
+def test_execute_does_not_snapshot_instances_by_default(
+        patched_create_setup, patched_ansible_create, patched_ansible_snapshot,
+        config_instance):
+    c = create.Create(config_instance)
+    c.execute()
+
+    assert not patched_ansible_snapshot.called
+    assert not config_instance.state.snapshotted
+
+
+def test_execute_skips_snapshot_when_playbook_not_configured(
+        patched_create_setup, molecule_driver_snapshot_section_data,
+        patched_logger_warn, patched_ansible_create, patched_ansible_snapshot,
+        config_instance):
+    molecule_driver_snapshot_section_data['provisioner']['playbooks'][
+        'snapshot'] = None
+    config_instance.merge_dicts(config_instance.config,
+                                molecule_driver_snapshot_section_data)
+    c = create.Create(config_instance)
+    c.execute()
+
+    msg = 'Skipping snapshot, snapshot playbook not configured.'
+    patched_logger_warn.assert_called_once_with(msg)
+
+    assert not patched_ansible_snapshot.called
+    assert not config_instance.state.snapshotted
@@ -18,6 +18,8 @@
 #  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 #  DEALINGS IN THE SOFTWARE.
 
+import os
+
 from molecule.command import destroy
 
 
@@ -52,3 +54,61 @@ def test_execute_skips_when_manual_driver(
     patched_logger_warn.assert_called_once_with(msg)
 
     assert not patched_ansible_destroy.called
+
+
+def test_execute_restores_snapshot_when_testing(
+        mocker, patched_destroy_prune, patched_logger_info,
+        molecule_driver_snapshot_section_data, patched_ansible_destroy,
+        patched_ansible_restore, config_instance):
+    config_instance.merge_dicts(config_instance.config,
+                                molecule_driver_snapshot_section_data)
+    config_instance.state.change_state('created', True)
+    config_instance.state.change_state('converged', True)
+    config_instance.state.change_state('snapshotted', True)
+    os.makedirs(config_instance.provisioner.fact_cache_directory)
+    d = destroy.Destroy(config_instance)
+    d.execute()
+
+    x = [
+        mocker.call("Scenario: 'default'"),
+        mocker.call("Action: 'destroy'"),
+        mocker.call('Restoring instances from snapshot.'),
+    ]
+
+    assert x == patched_logger_info.mock_calls
+
+    patched_ansible_restore.assert_called_once_with()
+    assert not patched_ansible_destroy.called
+
+    assert config_instance.state.created
+    assert not os.path.exists(config_instance.provisioner.fact_cache_directory)
+    assert config_instance.state.snapshotted
+    assert not config_instance.state.converged
+
+
+def test_execute_destroys_snapshot_when_destroying(
+        patched_destroy_prune, molecule_driver_snapshot_section_data,
+        patched_ansible_destroy, patched_ansible_restore, config_instance):
+    config_instance.merge_dicts(config_instance.config,
+                                molecule_driver_snapshot_section_data)
+    config_instance.command_args = {'subcommand': 'destroy'}
+    config_instance.state.change_state('snapshotted', True)
+    d = destroy.Destroy(config_instance)
+    d.execute()
+
+    patched_ansible_destroy.assert_called_once_with()
+    assert not patched_ansible_restore.called
+
+    assert not config_instance.state.snapshotted
+
+
+def test_execute_destroys_when_not_snapshotted(
+        patched_destroy_prune, molecule_driver_snapshot_section_data,
+        patched_ansible_destroy, patched_ansible_restore, config_instance):
+    config_instance.merge_dicts(config_instance.config,
+                                molecule_driver_snapshot_section_data)
+    d = destroy.Destroy(config_instance)
+    d.execute()
+
+    patched_ansible_destroy.assert_called_once_with()
+    assert not patched_ansible_restore.called
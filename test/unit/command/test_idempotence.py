@@ -30,8 +30,13 @@ def idempotence_instance(config_instance):
     return idempotence.Idempotence(config_instance)
 
 
-def test_execute(mocker, patched_logger_info, patched_ansible_converge,
-                 patched_is_idempotent, patched_logger_success,
+@pytest.fixture
+def patched_ansible_idempotence(mocker):
+    return mocker.patch('molecule.provisioner.ansible.Ansible.idempotence')
+
+
+def test_execute(mocker, patched_logger_info, patched_ansible_idempotence,
+                 patched_ansible_events, patched_logger_success,
                  idempotence_instance):
     idempotence_instance.execute()
 
@@ -42,17 +47,73 @@ def test_execute(mocker, patched_logger_info, patched_ansible_converge,
 
     assert x == patched_logger_info.mock_calls
 
-    patched_ansible_converge.assert_called_once_with(out=None, err=None)
+    patched_ansible_idempotence.assert_called_once_with(
+        check_mode=False, start_at_task=None)
+    patched_ansible_events.assert_called_once_with()
+
+    msg = 'Idempotence completed successfully.'
+    patched_logger_success.assert_called_once_with(msg)
+
+
+def test_execute_check_mode(patched_ansible_idempotence,
+                            patched_ansible_events, patched_logger_success,
+                            idempotence_instance):
+    options = idempotence_instance._config.config['provisioner']['idempotence']
+    options['check_mode'] = True
+    idempotence_instance.execute()
+
+    patched_ansible_idempotence.assert_called_once_with(
+        check_mode=True, start_at_task=None)
 
-    patched_is_idempotent.assert_called_once_with(
-        'patched-ansible-converge-stdout')
+
+def test_execute_starts_at_first_changed_task(
+        patched_ansible_idempotence, patched_ansible_events,
+        patched_logger_warn, patched_logger_success, idempotence_instance):
+    options = idempotence_instance._config.config['provisioner']['idempotence']
+    options['start_at_changed'] = True
+    idempotence_instance._config.state.change_state('converge_changed_tasks',
+                                                    ['foo', 'bar'])
+    idempotence_instance.execute()
+
+    patched_ansible_idempotence.assert_called_once_with(
+        check_mode=False, start_at_task='foo')
+
+    msg = ("Starting idempotence at 'foo', the first task changed by the "
+           'last converge.  This is a heuristic, the facts set or registered '
+           'by the skipped tasks are not available to the later tasks.')
+    patched_logger_warn.assert_called_once_with(msg)
+
+
+def test_execute_replays_when_converge_changed_no_tasks(
+        patched_ansible_idempotence, patched_ansible_events,
+        patched_logger_warn, patched_logger_success, idempotence_instance):
+    options = idempotence_instance._config.config['provisioner']['idempotence']
+    options['start_at_changed'] = True
+    idempotence_instance._config.state.change_state('converge_changed_tasks',
+                                                    [])
+    idempotence_instance.execute()
+
+    patched_ansible_idempotence.assert_called_once_with(
+        check_mode=False, start_at_task=None)
+    assert not patched_logger_warn.called
 
     msg = 'Idempotence completed successfully.'
     patched_logger_success.assert_called_once_with(msg)
 
 
+def test_execute_replays_when_changed_tasks_unknown(
+        patched_ansible_idempotence, patched_ansible_events,
+        patched_logger_success, idempotence_instance):
+    options = idempotence_instance._config.config['provisioner']['idempotence']
+    options['start_at_changed'] = True
+    idempotence_instance.execute()
+
+    patched_ansible_idempotence.assert_called_once_with(
+        check_mode=False, start_at_task=None)
+
+
 def test_execute_raises_when_not_converged(patched_logger_critical,
-                                           patched_ansible_converge,
+                                           patched_ansible_idempotence,
                                            idempotence_instance):
     idempotence_instance._config.state.change_state('converged', False)
     with pytest.raises(SystemExit) as e:
@@ -65,74 +126,112 @@ def test_execute_raises_when_not_converged(patched_logger_critical,
 
 
 def test_execute_raises_when_fails_idempotence(
-        mocker, patched_logger_critical, patched_ansible_converge,
-        patched_is_idempotent, idempotence_instance):
-    patched_is_idempotent.return_value = False
+        mocker, patched_logger_critical, patched_ansible_idempotence,
+        patched_ansible_events, idempotence_instance):
+    patched_ansible_events.return_value = [
+        {
+            'event': 'ok',
+            'task': 'Idempotence test',
+            'host': 'instance-1',
+            'changed': True,
+        },
+        {
+            'event': 'stats',
+            'hosts': {},
+        },
+    ]
     with pytest.raises(SystemExit) as e:
         idempotence_instance.execute()
 
     assert 1 == e.value.code
 
-    msg = 'Idempotence test failed because of the following tasks:\n'
+    msg = ('Idempotence test failed because of the following tasks:\n'
+           '* [instance-1] => Idempotence test')
     patched_logger_critical.assert_called_once_with(msg)
 
 
-def test_is_idempotent(idempotence_instance):
-    output = """
-PLAY RECAP ***********************************************************
-check-command-01: ok=3    changed=0    unreachable=0    failed=0
-    """
-
-    assert idempotence_instance._is_idempotent(output)
-
+def test_execute_raises_without_stats_event(
+        patched_logger_critical, patched_ansible_idempotence,
+        patched_ansible_events, idempotence_instance):
+    patched_ansible_events.return_value = []
+    with pytest.raises(SystemExit) as e:
+        idempotence_instance.execute()
 
-def test_is_idempotent_not_idempotent(idempotence_instance):
-    output = """
-PLAY RECAP ***********************************************************
-check-command-01: ok=2    changed=1    unreachable=0    failed=0
-check-command-02: ok=2    changed=1    unreachable=0    failed=0
-    """
+    assert 1 == e.value.code
 
-    assert not idempotence_instance._is_idempotent(output)
+    msg = ('Idempotence test failed because no events were read from the '
+           '`molecule_events` callback plugin.  Please ensure the callback '
+           'plugin is not disabled.')
+    patched_logger_critical.assert_called_once_with(msg)
 
 
 def test_non_idempotent_tasks_idempotent(idempotence_instance):
-    output = """
-PLAY [all] ***********************************************************
-
-GATHERING FACTS ******************************************************
-ok: [check-command-01]
-
-TASK: [Idempotence test] *********************************************
-ok: [check-command-01]
-
-PLAY RECAP ***********************************************************
-check-command-01: ok=3    changed=0    unreachable=0    failed=0
-"""
-    result = idempotence_instance._non_idempotent_tasks(output)
+    events = [
+        {
+            'event': 'task_start',
+            'task': 'Idempotence test'
+        },
+        {
+            'event': 'ok',
+            'task': 'Idempotence test',
+            'host': 'check-command-01',
+            'changed': False,
+        },
+        {
+            'event': 'stats',
+            'hosts': {},
+        },
+    ]
+    result = idempotence_instance._non_idempotent_tasks(iter(events))
 
     assert result == []
 
 
-def test_non_idempotent_tasks_not_idempotent(idempotence_instance):
-    output = """
-PLAY [all] ***********************************************************
+def test_non_idempotent_tasks_without_stats_event(idempotence_instance):
+    events = [
+        {
+            'event': 'ok',
+            'task': 'Idempotence test',
+            'host': 'check-command-01',
+            'changed': False,
+        },
+    ]
 
-GATHERING FACTS ******************************************************
-ok: [check-command-01]
-ok: [check-command-02]
+    assert idempotence_instance._non_idempotent_tasks(iter(events)) is None
 
-TASK: [Idempotence test] *********************************************
-changed: [check-command-01]
-changed: [check-command-02]
 
-PLAY RECAP ***********************************************************
-check-command-01: ok=2    changed=1    unreachable=0    failed=0
-check-command-02: ok=2    changed=1    unreachable=0    failed=0
-"""
-    result = idempotence_instance._non_idempotent_tasks(output)
+def test_non_idempotent_tasks_not_idempotent(idempotence_instance):
+    events = [
+        {
+            'event': 'task_start',
+            'task': 'Idempotence [test]'
+        },
+        {
+            'event': 'ok',
+            'task': 'Idempotence [test]',
+            'host': 'check-command-01',
+            'changed': True,
+        },
+        {
+            'event': 'skipped',
+            'task': 'Idempotence [test]',
+            'host': 'check-command-02',
+            'changed': False,
+        },
+        {
+            'event': 'ok',
+            'task': 'Idempotence [test]',
+            'host': 'check-command-03',
+            'changed': True,
+        },
+        {
+            'event': 'stats',
+            'hosts': {},
+        },
+    ]
+    result = idempotence_instance._non_idempotent_tasks(iter(events))
 
     assert result == [
-        '* [check-command-01] => Idempotence test',
-        '* [check-command-02] => Idempotence test'
+        '* [check-command-01] => Idempotence [test]',
+        '* [check-command-03] => Idempotence [test]',
     ]
@@ -18,11 +18,28 @@
 #  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 #  DEALINGS IN THE SOFTWARE.
 
+import os
+
+import pytest
+
+from molecule import util
 from molecule.command import lint
 
 
-def test_execute(mocker, patched_logger_info, patched_yamllint, patched_flake8,
-                 patched_ansible_lint, config_instance):
+class Linter(object):
+    def __init__(self, name, code=0):
+        self.name = name
+        self._code = code
+
+    def execute(self):
+        msg = 'executed {}\n'.format(self.name)
+        os.write(1, msg.encode('utf-8'))
+        if self._code:
+            util.sysexit(self._code)
+
+
+def test_execute(mocker, patched_logger_info, config_instance):
+    m = mocker.patch('molecule.command.lint.Lint._execute_concurrently')
     l = lint.Lint(config_instance)
     l.execute()
 
@@ -33,6 +50,67 @@ def test_execute(mocker, patched_logger_info, patched_yamllint, patched_flake8,
 
     assert x == patched_logger_info.mock_calls
 
+    linters = m.call_args[0][0]
+    assert ['yamllint', 'flake8', 'ansible-lint'] == [l.name for l in linters]
+
+
+def test_execute_with_a_single_linter(mocker, patched_yamllint, patched_flake8,
+                                      patched_ansible_lint, config_instance):
+    mocker.patch(
+        'molecule.verifier.testinfra.Testinfra.lint',
+        new_callable=mocker.PropertyMock,
+        return_value=None)
+    mocker.patch(
+        'molecule.provisioner.ansible.Ansible.lint',
+        new_callable=mocker.PropertyMock,
+        return_value=None)
+    l = lint.Lint(config_instance)
+    l.execute()
+
+    patched_yamllint.assert_called_once_with()
+    assert not patched_flake8.called
+    assert not patched_ansible_lint.called
+
+
+def test_execute_serially_in_a_worker_process(
+        mocker, patched_yamllint, patched_flake8, patched_ansible_lint,
+        config_instance):
+    m = mocker.patch('multiprocessing.current_process')
+    m.return_value.daemon = True
+    patched_concurrently = mocker.patch(
+        'molecule.command.lint.Lint._execute_concurrently')
+    l = lint.Lint(config_instance)
+    l.execute()
+
+    assert not patched_concurrently.called
     patched_yamllint.assert_called_once_with()
     patched_flake8.assert_called_once_with()
     patched_ansible_lint.assert_called_once_with()
+
+
+def test_execute_concurrently(capfd, patched_logger_info,
+                              patched_logger_success, config_instance):
+    l = lint.Lint(config_instance)
+    l._execute_concurrently([Linter('foo'), Linter('bar')])
+
+    out, _ = capfd.readouterr()
+    assert '[foo] executed foo' in out
+    assert '[bar] executed bar' in out
+
+    patched_logger_info.assert_called_with('Summary')
+    msgs = [c[1][0] for c in patched_logger_success.mock_calls]
+    assert msgs[0].startswith("Linter 'foo' completed successfully in ")
+    assert msgs[1].startswith("Linter 'bar' completed successfully in ")
+
+
+def test_execute_concurrently_exits_when_a_linter_fails(
+        patched_logger_info, patched_logger_success, patched_logger_error,
+        config_instance):
+    l = lint.Lint(config_instance)
+    with pytest.raises(SystemExit) as e:
+        l._execute_concurrently([Linter('foo'), Linter('bar', 2)])
+
+    assert 1 == e.value.code
+
+    msg = patched_logger_error.mock_calls[0][1][0]
+    assert msg.startswith("Linter 'bar' failed with exit code 2 in ")
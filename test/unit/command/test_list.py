@@ -42,3 +42,11 @@ def test_execute(capsys, config_instance):
     ]
 
     assert x == l.execute()
+
+
+def test_setup_does_not_prepare_provisioner(
+        patched_write_config, patched_manage_inventory, config_instance):
+    list.List(config_instance)
+
+    assert not patched_write_config.called
+    assert not patched_manage_inventory.called
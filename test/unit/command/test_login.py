@@ -150,3 +150,11 @@ def test_get_hostname_no_host_flag_specified_on_cli_with_multiple_hosts_raises(
            'instance-1\n'
            'instance-2')
     patched_logger_critical.assert_called_once_with(msg)
+
+
+def test_setup_does_not_prepare_provisioner(
+        patched_write_config, patched_manage_inventory, config_instance):
+    login.Login(config_instance)
+
+    assert not patched_write_config.called
+    assert not patched_manage_inventory.called
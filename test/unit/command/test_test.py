@@ -17,3 +17,45 @@
 #  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
 #  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 #  DEALINGS IN THE SOFTWARE.
+
+import pytest
+
+from molecule.command import test
+
+
+@pytest.fixture
+def patched_execute_subcommand(mocker):
+    return mocker.patch('molecule.command.base.execute_subcommand')
+
+
+def test_execute_sequence(mocker, patched_execute_subcommand, config_instance):
+    test._execute_sequence(config_instance.scenario, 'never')
+
+    x = [
+        mocker.call(config_instance, term)
+        for term in config_instance.scenario.sequence
+    ]
+    assert x == patched_execute_subcommand.mock_calls
+
+
+def test_execute_sequence_destroys_when_destroy_always(
+        mocker, patched_logger_warn, patched_execute_subcommand,
+        config_instance):
+    patched_execute_subcommand.side_effect = [SystemExit(1), None]
+    with pytest.raises(SystemExit) as e:
+        test._execute_sequence(config_instance.scenario, 'always')
+
+    assert 1 == e.value.code
+
+    msg = 'An error occured during the test sequence.  Cleaning up.'
+    patched_logger_warn.assert_called_once_with(msg)
+    patched_execute_subcommand.assert_called_with(config_instance, 'destroy')
+
+
+def test_execute_sequence_raises_when_destroy_never(patched_execute_subcommand,
+                                                    config_instance):
+    patched_execute_subcommand.side_effect = SystemExit(1)
+    with pytest.raises(SystemExit):
+        test._execute_sequence(config_instance.scenario, 'never')
+
+    assert 1 == patched_execute_subcommand.call_count
@@ -0,0 +1,167 @@
+#  Copyright (c) 2015-2017 Cisco Systems, Inc.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to
+#  deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+#  sell copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+
+import os
+
+import pytest
+
+from molecule.command import watch
+
+
+@pytest.fixture
+def watch_instance(config_instance):
+    return watch.Watch(config_instance)
+
+
+@pytest.fixture
+def patched_execute_subcommand(mocker):
+    return mocker.patch('molecule.command.base.execute_subcommand')
+
+
+def test_execute(mocker, patched_logger_info, patched_logger_warn,
+                 patched_execute_subcommand, watch_instance):
+    role_file = os.path.join(watch_instance._config.project_directory, 'tasks',
+                             'main.yml')
+    m = mocker.patch('molecule.command.watch.Watch._wait_for_changes')
+    m.side_effect = [
+        (set([role_file]), {}),
+        (set([watch_instance._config.molecule_file]), {}),
+    ]
+    watch_instance.execute()
+
+    x = [
+        mocker.call(watch_instance._config, 'create'),
+        mocker.call(watch_instance._config, 'converge'),
+        mocker.call(watch_instance._config, 'converge'),
+        mocker.call(watch_instance._config, 'lint'),
+    ]
+
+    assert x == patched_execute_subcommand.mock_calls
+
+    msg = 'Reloading the scenario.'
+    patched_logger_warn.assert_called_once_with(msg)
+
+
+def test_snapshot(watch_instance):
+    project_directory = watch_instance._config.project_directory
+    for d in ['tasks', '.git', '__pycache__']:
+        os.mkdir(os.path.join(project_directory, d))
+    for f in [
+            'tasks/main.yml', 'tasks/.main.yml.swp', 'tasks/main.yml~',
+            '.git/HEAD', '__pycache__/foo.pyc'
+    ]:
+        with open(os.path.join(project_directory, f), 'w') as stream:
+            stream.write('foo')
+
+    snapshot = watch_instance._snapshot()
+    path = os.path.join(project_directory, 'tasks', 'main.yml')
+
+    assert 3 == snapshot[path][1]
+    assert watch_instance._config.molecule_file in snapshot
+    for f in [
+            'tasks/.main.yml.swp', 'tasks/main.yml~', '.git/HEAD',
+            '__pycache__/foo.pyc'
+    ]:
+        assert os.path.join(project_directory, f) not in snapshot
+
+
+def test_wait_for_changes_waits_for_changes_to_settle(mocker, watch_instance):
+    mocker.patch('time.sleep')
+    m = mocker.patch('molecule.command.watch.Watch._snapshot')
+    m.side_effect = [
+        {
+            'foo': (1, 1)
+        },
+        {
+            'foo': (2, 1),
+        },
+        {
+            'foo': (2, 1),
+            'bar': (1, 1),
+        },
+        {
+            'foo': (2, 1),
+            'bar': (1, 1),
+        },
+    ]
+    changed, snapshot = watch_instance._wait_for_changes({'foo': (1, 1)})
+
+    assert set(['foo', 'bar']) == changed
+    assert {'foo': (2, 1), 'bar': (1, 1)} == snapshot
+    assert 4 == m.call_count
+
+
+def test_wait_for_changes_detects_removed_files(mocker, watch_instance):
+    mocker.patch('time.sleep')
+    m = mocker.patch('molecule.command.watch.Watch._snapshot')
+    m.side_effect = [{}, {}]
+    changed, _ = watch_instance._wait_for_changes({'foo': (1, 1)})
+
+    assert set(['foo']) == changed
+
+
+def test_get_terms(watch_instance):
+    verifier_directory = watch_instance._config.verifier.directory
+    project_directory = watch_instance._config.project_directory
+
+    changed = [os.path.join(verifier_directory, 'test_default.py')]
+    assert ['lint', 'verify'] == watch_instance._get_terms(changed)
+
+    changed = [os.path.join(project_directory, 'templates', 'foo.j2')]
+    assert ['converge'] == watch_instance._get_terms(changed)
+
+    changed = [
+        os.path.join(project_directory, 'tasks', 'main.yml'),
+        os.path.join(verifier_directory, 'test_default.py'),
+    ]
+    assert ['converge', 'lint', 'verify'] == watch_instance._get_terms(changed)
+
+    changed = [
+        os.path.join(watch_instance._config.scenario.directory, 'foo.yml')
+    ]
+    assert ['converge', 'lint'] == watch_instance._get_terms(changed)
+
+
+def test_get_terms_ignores_changes_outside_role_and_scenario(watch_instance):
+    project_directory = watch_instance._config.project_directory
+    changed = [
+        os.path.join(project_directory, 'README.md'),
+        os.path.join(project_directory, 'docs', 'index.yml'),
+        os.path.join(project_directory, 'molecule', 'foo', 'create.yml'),
+    ]
+
+    assert [] == watch_instance._get_terms(changed)
+
+
+def test_execute_terms_stops_at_failure(mocker, patched_logger_error,
+                                        patched_execute_subcommand,
+                                        watch_instance):
+    patched_execute_subcommand.side_effect = [None, SystemExit(2)]
+    watch_instance._execute_terms(['converge', 'lint', 'verify'])
+
+    x = [
+        mocker.call(watch_instance._config, 'converge'),
+        mocker.call(watch_instance._config, 'lint'),
+    ]
+
+    assert x == patched_execute_subcommand.mock_calls
+
+    msg = "Action 'lint' failed with exit code 2."
+    patched_logger_error.assert_called_once_with(msg)
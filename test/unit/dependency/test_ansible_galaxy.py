@@ -24,6 +24,7 @@ import pytest
 import sh
 
 from molecule import config
+from molecule import util
 from molecule.dependency import ansible_galaxy
 
 
@@ -63,6 +64,37 @@ def roles_path(ansible_galaxy_instance):
         ansible_galaxy_instance._config.scenario.ephemeral_directory, 'roles')
 
 
+@pytest.fixture
+def role_cache_directory(temp_dir, monkeypatch):
+    monkeypatch.setenv('XDG_CACHE_HOME', temp_dir.strpath)
+
+    return os.path.join(temp_dir.strpath, 'molecule', 'roles')
+
+
+@pytest.fixture
+def patched_run_role_command(mocker):
+    m = mocker.patch('molecule.util.run_command')
+    m.side_effect = lambda cmd, debug: cmd
+
+    return m
+
+
+@pytest.fixture
+def patched_bake_role(mocker, patched_run_role_command):
+    def _bake_role(role, directory):
+        m = mocker.Mock()
+        m.wait.side_effect = lambda: os.makedirs(
+            os.path.join(directory, 'roles', role['src']))
+
+        return m
+
+    m = mocker.patch(
+        'molecule.dependency.ansible_galaxy.AnsibleGalaxy._bake_role')
+    m.side_effect = _bake_role
+
+    return m
+
+
 def test_config_private_member(ansible_galaxy_instance):
     assert isinstance(ansible_galaxy_instance._config, config.Config)
 
@@ -203,3 +235,139 @@ def test_setup(ansible_galaxy_instance):
 
 def test_has_requirements_file(ansible_galaxy_instance):
     assert not ansible_galaxy_instance._has_requirements_file()
+
+
+def test_role_cache_directory_property(role_cache_directory,
+                                       ansible_galaxy_instance):
+    x = role_cache_directory
+
+    assert x == ansible_galaxy_instance.role_cache_directory
+
+
+def test_execute_installs_cached_roles(mocker, patched_run_command,
+                                       patched_logger_success, role_file,
+                                       ansible_galaxy_instance):
+    m = mocker.patch(('molecule.dependency.ansible_galaxy.'
+                      'AnsibleGalaxy._install_cached_roles'))
+    util.write_file(role_file, util.safe_dump(['foo']))
+    ansible_galaxy_instance.execute()
+
+    m.assert_called_once_with([{'src': 'foo'}])
+    assert not patched_run_command.called
+
+    msg = 'Dependency completed successfully.'
+    patched_logger_success.assert_called_once_with(msg)
+
+
+def test_install_cached_roles(patched_bake_role, role_cache_directory,
+                              roles_path, ansible_galaxy_instance):
+    roles = [{'src': 'foo'}, {'src': 'bar', 'version': 'v1.0'}]
+    ansible_galaxy_instance._setup()
+    ansible_galaxy_instance._install_cached_roles(roles)
+
+    assert 2 == patched_bake_role.call_count
+    for role in roles:
+        entry = ansible_galaxy_instance._get_role_cache_entry(role)
+        link = os.path.join(roles_path, role['src'])
+        assert os.path.islink(link)
+        assert os.path.join(entry, 'roles', role['src']) == os.readlink(link)
+
+
+def test_install_cached_roles_skips_cached_roles(
+        patched_bake_role, role_cache_directory, roles_path,
+        ansible_galaxy_instance):
+    roles = [{'src': 'foo'}]
+    ansible_galaxy_instance._setup()
+    ansible_galaxy_instance._install_cached_roles(roles)
+    ansible_galaxy_instance._install_cached_roles(roles)
+
+    assert 1 == patched_bake_role.call_count
+    assert os.path.islink(os.path.join(roles_path, 'foo'))
+
+
+def test_install_cached_roles_removes_dropped_roles(
+        patched_bake_role, role_cache_directory, roles_path,
+        ansible_galaxy_instance):
+    ansible_galaxy_instance._setup()
+    os.makedirs(os.path.join(roles_path, 'baz'))
+    ansible_galaxy_instance._install_cached_roles([{
+        'src': 'foo'
+    }, {
+        'src': 'bar'
+    }])
+    ansible_galaxy_instance._install_cached_roles([{'src': 'foo'}])
+
+    assert os.path.islink(os.path.join(roles_path, 'foo'))
+    assert not os.path.lexists(os.path.join(roles_path, 'bar'))
+    assert os.path.isdir(os.path.join(roles_path, 'baz'))
+
+
+def test_install_cached_roles_raises_when_install_fails(
+        mocker, patched_run_role_command, role_cache_directory,
+        ansible_galaxy_instance):
+    m = mocker.patch(
+        'molecule.dependency.ansible_galaxy.AnsibleGalaxy._bake_role')
+    m.return_value.wait.side_effect = sh.ErrorReturnCode_1(
+        'ansible-galaxy', b'', b'')
+    ansible_galaxy_instance._setup()
+    with pytest.raises(sh.ErrorReturnCode_1):
+        ansible_galaxy_instance._install_cached_roles([{'src': 'foo'}])
+
+    assert [] == os.listdir(role_cache_directory)
+
+
+def test_bake_role(ansible_galaxy_instance, temp_dir):
+    directory = temp_dir.strpath
+    cmd = ansible_galaxy_instance._bake_role({'src': 'foo'}, directory)
+    role_file = os.path.join(directory, 'requirements.yml')
+    x = [
+        str(sh.ansible_galaxy), 'install', '--role-file={}'.format(role_file),
+        '--roles-path={}'.format(os.path.join(directory, 'roles')), '--force',
+        '--foo=bar', '-vvv'
+    ]
+
+    assert sorted(x) == sorted(str(cmd).split())
+    assert [{'src': 'foo'}] == util.safe_load_file(role_file)
+
+
+def test_get_role_cache_entry(role_cache_directory, ansible_galaxy_instance):
+    foo = ansible_galaxy_instance._get_role_cache_entry({'src': 'foo'})
+    foo_v1 = ansible_galaxy_instance._get_role_cache_entry({
+        'src': 'foo',
+        'version': 'v1.0'
+    })
+
+    assert foo.startswith(role_cache_directory)
+    assert foo != foo_v1
+
+
+@pytest.mark.parametrize('data, x', [
+    (['foo', {
+        'src': 'bar'
+    }], [{
+        'src': 'foo'
+    }, {
+        'src': 'bar'
+    }]),
+    ({
+        'roles': ['foo']
+    }, [{
+        'src': 'foo'
+    }]),
+    ({
+        'roles': ['foo'],
+        'collections': ['bar.baz']
+    }, None),
+    ([{
+        'include': 'other.yml'
+    }], None),
+    ({}, None),
+])
+def test_get_roles(data, x, role_file, ansible_galaxy_instance):
+    util.write_file(role_file, util.safe_dump(data))
+
+    assert x == ansible_galaxy_instance._get_roles()
+
+
+def test_get_roles_without_requirements_file(ansible_galaxy_instance):
+    assert ansible_galaxy_instance._get_roles() is None
@@ -72,6 +72,7 @@ def test_options_property(delegated_instance):
         },
         'login_cmd_template': 'docker exec -ti {instance} bash',
         'managed': True,
+        'snapshot': False,
     }
 
     assert x == delegated_instance.options
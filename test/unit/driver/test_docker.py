@@ -60,7 +60,7 @@ def test_name_property(docker_instance):
 
 
 def test_options_property(docker_instance):
-    x = {'managed': True}
+    x = {'managed': True, 'snapshot': False}
 
     assert x == docker_instance.options
 
@@ -93,10 +93,24 @@ def test_delegated_property(docker_instance):
     assert not docker_instance.delegated
 
 
+def test_concurrency_property(docker_instance):
+    assert 4 == docker_instance.concurrency
+
+
+def test_concurrency_property_from_options(docker_instance):
+    docker_instance._config.config['driver']['options']['concurrency'] = 2
+
+    assert 2 == docker_instance.concurrency
+
+
 def test_managed_property(docker_instance):
     assert docker_instance.managed
 
 
+def test_snapshot_property(docker_instance):
+    assert not docker_instance.snapshot
+
+
 def test_default_ssh_connection_options_property(docker_instance):
     assert [] == docker_instance.default_ssh_connection_options
 
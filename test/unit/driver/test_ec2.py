@@ -60,7 +60,7 @@ def test_name_property(ec2_instance):
 
 
 def test_options_property(ec2_instance):
-    x = {'managed': True}
+    x = {'managed': True, 'snapshot': False}
 
     assert x == ec2_instance.options
 
@@ -69,7 +69,7 @@ def test_login_cmd_template_property(ec2_instance):
     x = ('ssh {address} -l {user} -p {port} -i {identity_file} '
          '-o UserKnownHostsFile=/dev/null '
          '-o ControlMaster=auto '
-         '-o ControlPersist=60s '
+         '-o ControlPersist=600s '
          '-o IdentitiesOnly=yes '
          '-o StrictHostKeyChecking=no')
 
@@ -85,6 +85,10 @@ def test_safe_files_property(ec2_instance):
     assert x == ec2_instance.safe_files
 
 
+def test_default_concurrency_property(ec2_instance):
+    assert 8 == ec2_instance.default_concurrency
+
+
 def test_default_safe_files_property(ec2_instance):
     x = [
         os.path.join(ec2_instance._config.scenario.ephemeral_directory,
@@ -106,7 +110,7 @@ def test_default_ssh_connection_options_property(ec2_instance):
     x = [
         '-o UserKnownHostsFile=/dev/null',
         '-o ControlMaster=auto',
-        '-o ControlPersist=60s',
+        '-o ControlPersist=600s',
         '-o IdentitiesOnly=yes',
         '-o StrictHostKeyChecking=no',
     ]
@@ -168,7 +172,7 @@ def test_ansible_connection_options(mocker, ec2_instance):
         'ssh',
         'ansible_ssh_common_args': ('-o UserKnownHostsFile=/dev/null '
                                     '-o ControlMaster=auto '
-                                    '-o ControlPersist=60s '
+                                    '-o ControlPersist=600s '
                                     '-o IdentitiesOnly=yes '
                                     '-o StrictHostKeyChecking=no'),
     }
@@ -187,7 +191,7 @@ def test_ansible_connection_options_handles_missing_instance_config(
 def test_ansible_connection_options_handles_missing_results_key(
         mocker, ec2_instance):
     m = mocker.patch('molecule.util.safe_load_file')
-    m.side_effect = StopIteration
+    m.side_effect = KeyError
 
     assert {} == ec2_instance.ansible_connection_options('foo')
 
@@ -203,7 +207,7 @@ def test_ssh_connection_options_property(ec2_instance):
     x = [
         '-o UserKnownHostsFile=/dev/null',
         '-o ControlMaster=auto',
-        '-o ControlPersist=60s',
+        '-o ControlPersist=600s',
         '-o IdentitiesOnly=yes',
         '-o StrictHostKeyChecking=no',
     ]
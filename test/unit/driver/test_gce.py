@@ -60,7 +60,7 @@ def test_name_property(gce_instance):
 
 
 def test_options_property(gce_instance):
-    x = {'managed': True}
+    x = {'managed': True, 'snapshot': False}
 
     assert x == gce_instance.options
 
@@ -69,7 +69,7 @@ def test_login_cmd_template_property(gce_instance):
     x = ('ssh {address} -l {user} -p {port} -i {identity_file} '
          '-o UserKnownHostsFile=/dev/null '
          '-o ControlMaster=auto '
-         '-o ControlPersist=60s '
+         '-o ControlPersist=600s '
          '-o IdentitiesOnly=yes '
          '-o StrictHostKeyChecking=no')
 
@@ -106,7 +106,7 @@ def test_default_ssh_connection_options_property(gce_instance):
     x = [
         '-o UserKnownHostsFile=/dev/null',
         '-o ControlMaster=auto',
-        '-o ControlPersist=60s',
+        '-o ControlPersist=600s',
         '-o IdentitiesOnly=yes',
         '-o StrictHostKeyChecking=no',
     ]
@@ -168,7 +168,7 @@ def test_ansible_connection_options(mocker, gce_instance):
         'ssh',
         'ansible_ssh_common_args': ('-o UserKnownHostsFile=/dev/null '
                                     '-o ControlMaster=auto '
-                                    '-o ControlPersist=60s '
+                                    '-o ControlPersist=600s '
                                     '-o IdentitiesOnly=yes '
                                     '-o StrictHostKeyChecking=no'),
     }
@@ -187,7 +187,7 @@ def test_ansible_connection_options_handles_missing_instance_config(
 def test_ansible_connection_options_handles_missing_results_key(
         mocker, gce_instance):
     m = mocker.patch('molecule.util.safe_load_file')
-    m.side_effect = StopIteration
+    m.side_effect = KeyError
 
     assert {} == gce_instance.ansible_connection_options('foo')
 
@@ -203,7 +203,7 @@ def test_ssh_connection_options_property(gce_instance):
     x = [
         '-o UserKnownHostsFile=/dev/null',
         '-o ControlMaster=auto',
-        '-o ControlPersist=60s',
+        '-o ControlPersist=600s',
         '-o IdentitiesOnly=yes',
         '-o StrictHostKeyChecking=no',
     ]
@@ -60,7 +60,7 @@ def test_name_property(lxc_instance):
 
 
 def test_options_property(lxc_instance):
-    x = {'managed': True}
+    x = {'managed': True, 'snapshot': False}
 
     assert x == lxc_instance.options
 
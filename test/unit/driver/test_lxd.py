@@ -60,7 +60,7 @@ def test_name_property(lxd_instance):
 
 
 def test_options_property(lxd_instance):
-    x = {'managed': True}
+    x = {'managed': True, 'snapshot': False}
 
     assert x == lxd_instance.options
 
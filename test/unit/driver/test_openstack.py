@@ -61,7 +61,7 @@ def test_name_property(openstack_instance):
 
 
 def test_options_property(openstack_instance):
-    x = {'managed': True}
+    x = {'managed': True, 'snapshot': False}
 
     assert x == openstack_instance.options
 
@@ -70,7 +70,7 @@ def test_login_cmd_template_property(openstack_instance):
     x = ('ssh {address} -l {user} -p {port} -i {identity_file} '
          '-o UserKnownHostsFile=/dev/null '
          '-o ControlMaster=auto '
-         '-o ControlPersist=60s '
+         '-o ControlPersist=600s '
          '-o IdentitiesOnly=yes '
          '-o StrictHostKeyChecking=no')
 
@@ -107,7 +107,7 @@ def test_default_ssh_connection_options_property(openstack_instance):
     x = [
         '-o UserKnownHostsFile=/dev/null',
         '-o ControlMaster=auto',
-        '-o ControlPersist=60s',
+        '-o ControlPersist=600s',
         '-o IdentitiesOnly=yes',
         '-o StrictHostKeyChecking=no',
     ]
@@ -169,7 +169,7 @@ def test_ansible_connection_options(mocker, openstack_instance):
         'ssh',
         'ansible_ssh_common_args': ('-o UserKnownHostsFile=/dev/null '
                                     '-o ControlMaster=auto '
-                                    '-o ControlPersist=60s '
+                                    '-o ControlPersist=600s '
                                     '-o IdentitiesOnly=yes '
                                     '-o StrictHostKeyChecking=no'),
     }
@@ -188,7 +188,7 @@ def test_ansible_connection_options_handles_missing_instance_config(
 def test_ansible_connection_options_handles_missing_results_key(
         mocker, openstack_instance):
     m = mocker.patch('molecule.util.safe_load_file')
-    m.side_effect = StopIteration
+    m.side_effect = KeyError
 
     assert {} == openstack_instance.ansible_connection_options('foo')
 
@@ -204,7 +204,7 @@ def test_ssh_connection_options_property(openstack_instance):
     x = [
         '-o UserKnownHostsFile=/dev/null',
         '-o ControlMaster=auto',
-        '-o ControlPersist=60s',
+        '-o ControlPersist=600s',
         '-o IdentitiesOnly=yes',
         '-o StrictHostKeyChecking=no',
     ]
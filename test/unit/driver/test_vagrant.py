@@ -23,6 +23,7 @@ import os
 import pytest
 
 from molecule import config
+from molecule import util
 from molecule.driver import vagrant
 
 
@@ -65,7 +66,7 @@ def test_name_property(vagrant_instance):
 
 
 def test_options_property(vagrant_instance):
-    x = {'managed': True}
+    x = {'managed': True, 'snapshot': False}
 
     assert x == vagrant_instance.options
 
@@ -111,6 +112,10 @@ def test_delegated_property(vagrant_instance):
     assert not vagrant_instance.delegated
 
 
+def test_default_concurrency_property(vagrant_instance):
+    assert 2 == vagrant_instance.default_concurrency
+
+
 def test_managed_property(vagrant_instance):
     assert vagrant_instance.managed
 
@@ -119,7 +124,7 @@ def test_default_ssh_connection_options_property(vagrant_instance):
     x = [
         '-o UserKnownHostsFile=/dev/null',
         '-o ControlMaster=auto',
-        '-o ControlPersist=60s',
+        '-o ControlPersist=600s',
         '-o IdentitiesOnly=yes',
         '-o StrictHostKeyChecking=no',
     ]
@@ -191,7 +196,7 @@ def test_ansible_connection_options_handles_missing_instance_config(
 def test_ansible_connection_options_handles_missing_results_key(
         mocker, vagrant_instance):
     m = mocker.patch('molecule.util.safe_load_file')
-    m.side_effect = StopIteration
+    m.side_effect = KeyError
 
     assert {} == vagrant_instance.ansible_connection_options('foo')
 
@@ -217,6 +222,38 @@ def test_instance_config_property(vagrant_instance):
     assert x == vagrant_instance.instance_config
 
 
+def test_instance_configs_property(vagrant_instance):
+    util.write_file(vagrant_instance.instance_config,
+                    util.safe_dump([{
+                        'instance': 'instance-1'
+                    }]))
+    x = {'instance-1': {'instance': 'instance-1'}}
+
+    assert x == vagrant_instance.instance_configs
+
+
+def test_instance_configs_property_reparses_changed_file(vagrant_instance):
+    util.write_file(vagrant_instance.instance_config,
+                    util.safe_dump([{
+                        'instance': 'instance-1'
+                    }]))
+    vagrant_instance.instance_configs
+
+    util.write_file(vagrant_instance.instance_config,
+                    util.safe_dump([{
+                        'instance': 'instance-1'
+                    }, {
+                        'instance': 'instance-2'
+                    }]))
+
+    assert ['instance-1',
+            'instance-2'] == sorted(vagrant_instance.instance_configs.keys())
+
+
+def test_ssh_control_persist_property(vagrant_instance):
+    assert 600 == vagrant_instance.ssh_control_persist
+
+
 def test_ssh_connection_options_property(vagrant_instance):
     x = ['-o foo=bar']
 
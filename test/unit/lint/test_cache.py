@@ -0,0 +1,124 @@
+#  Copyright (c) 2015-2017 Cisco Systems, Inc.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to
+#  deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+#  sell copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+
+import os
+
+import pytest
+
+from molecule import util
+from molecule.lint import cache
+
+
+@pytest.fixture
+def lint_files(temp_dir):
+    files = [
+        os.path.join(temp_dir.strpath, 'foo.yml'),
+        os.path.join(temp_dir.strpath, 'bar.yml'),
+    ]
+    for f in files:
+        util.write_file(f, '---\n')
+
+    return files
+
+
+@pytest.fixture
+def cache_instance(config_instance):
+    return cache.Cache(config_instance, 'yamllint', options={'foo': 'bar'})
+
+
+def test_enabled_property(cache_instance):
+    assert cache_instance.enabled
+
+
+def test_enabled_property_is_false_with_no_cache(cache_instance):
+    cache_instance._config.command_args = {'cache': False}
+
+    assert not cache_instance.enabled
+
+
+def test_cache_file_property(cache_instance):
+    x = os.path.join(cache_instance._config.scenario.ephemeral_directory,
+                     'lint_yamllint_cache.json')
+
+    assert x == cache_instance.cache_file
+
+
+def test_stale_without_cache(lint_files, cache_instance):
+    assert lint_files == cache_instance.stale(lint_files)
+
+
+def test_stale_after_update(lint_files, cache_instance):
+    cache_instance.stale(lint_files)
+    cache_instance.update(lint_files)
+
+    assert [] == cache_instance.stale(lint_files)
+
+
+def test_stale_after_file_changed(lint_files, cache_instance):
+    cache_instance.stale(lint_files)
+    cache_instance.update(lint_files)
+    util.write_file(lint_files[0], '---\nfoo: bar\n')
+
+    assert [lint_files[0]] == cache_instance.stale(lint_files)
+
+
+def test_stale_after_options_changed(lint_files, cache_instance):
+    cache_instance.stale(lint_files)
+    cache_instance.update(lint_files)
+    cache_instance._options = {'foo': 'baz'}
+
+    assert lint_files == cache_instance.stale(lint_files)
+
+
+def test_stale_with_digest(lint_files, cache_instance):
+    cache_instance.stale(lint_files, lambda filename: 'foo')
+    cache_instance.update(lint_files)
+
+    assert [] == cache_instance.stale(lint_files, lambda filename: 'foo')
+    assert lint_files == cache_instance.stale(lint_files,
+                                              lambda filename: 'bar')
+
+
+def test_update_forgets_files_mentioned_in_output(lint_files, cache_instance):
+    out = cache_instance.capture(lambda line: None)
+    out('{}:1:1: [error] foo\n'.format(lint_files[1]))
+    cache_instance.stale(lint_files)
+    cache_instance.update(lint_files)
+
+    assert [lint_files[1]] == cache_instance.stale(lint_files)
+
+
+def test_capture_calls_callback(cache_instance):
+    lines = []
+    out = cache_instance.capture(lines.append)
+    out('foo\n')
+
+    assert ['foo\n'] == lines
+
+
+def test_stale_ignores_corrupt_cache_file(lint_files, patched_logger_warn,
+                                          cache_instance):
+    util.write_file(cache_instance.cache_file, '{')
+
+    assert lint_files == cache_instance.stale(lint_files)
+
+    msg = 'Ignoring the corrupt lint cache {}.'.format(
+        cache_instance.cache_file)
+    patched_logger_warn.assert_called_once_with(msg)
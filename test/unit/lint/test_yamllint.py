@@ -18,10 +18,13 @@
 #  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 #  DEALINGS IN THE SOFTWARE.
 
+import os
+
 import pytest
 import sh
 
 from molecule import config
+from molecule import util
 from molecule.lint import yamllint
 
 
@@ -61,6 +64,26 @@ def test_files_private_member(patched_get_files, yamllint_instance):
     assert x == yamllint_instance._files
 
 
+def test_get_files(yamllint_instance):
+    project_directory = yamllint_instance._config.project_directory
+    os.mkdir(os.path.join(project_directory, '.git'))
+    files = [
+        os.path.join(project_directory, 'foo.yml'),
+        os.path.join(project_directory, 'bar.yaml'),
+        os.path.join(project_directory, 'baz.txt'),
+        os.path.join(project_directory, '.git', 'qux.yml'),
+    ]
+    for f in files:
+        util.write_file(f, '')
+
+    result = yamllint_instance._get_files()
+
+    assert files[0] in result
+    assert files[1] in result
+    assert files[2] not in result
+    assert files[3] not in result
+
+
 def test_default_options_property(yamllint_instance):
     assert {} == yamllint_instance.default_options
 
@@ -135,6 +158,28 @@ def test_execute_does_not_execute(patched_get_files, patched_logger_warn,
     patched_logger_warn.assert_called_once_with(msg)
 
 
+def test_execute_does_not_execute_unchanged_files(
+        patched_get_files, patched_logger_warn, patched_logger_success,
+        patched_run_command, yamllint_instance):
+    yamllint_instance.execute()
+    yamllint_instance.execute()
+
+    assert 1 == patched_run_command.call_count
+
+    msg = 'Skipping, no files changed since the last lint.'
+    patched_logger_warn.assert_called_once_with(msg)
+
+
+def test_execute_executes_unchanged_files_with_no_cache(
+        patched_get_files, patched_logger_success, patched_run_command,
+        yamllint_instance):
+    yamllint_instance._config.command_args = {'cache': False}
+    yamllint_instance.execute()
+    yamllint_instance.execute()
+
+    assert 2 == patched_run_command.call_count
+
+
 def test_execute_bakes(patched_get_files, patched_run_command,
                        yamllint_instance):
     yamllint_instance.execute()
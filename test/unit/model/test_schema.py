@@ -53,6 +53,40 @@ def test_validate_raises_on_invalid_field(config):
     assert 'Not a valid string.' in str(e)
 
 
+def test_validate_driver_concurrency(config):
+    config['driver']['options']['concurrency'] = 2
+    data, errors = schema.validate(config)
+
+    assert {} == errors
+
+
+@pytest.mark.parametrize('concurrency', [0, -1, 'foo', True])
+def test_validate_raises_on_invalid_driver_concurrency(concurrency, config):
+    config['driver']['options']['concurrency'] = concurrency
+
+    with pytest.raises(marshmallow.ValidationError) as e:
+        schema.validate(config)
+
+    assert 'Concurrency must be a positive integer.' in str(e)
+
+
+@pytest.mark.parametrize('executor', ['sh', 'worker'])
+def test_validate_provisioner_executor(executor, config):
+    config['provisioner']['executor'] = executor
+    data, errors = schema.validate(config)
+
+    assert {} == errors
+
+
+def test_validate_raises_on_invalid_provisioner_executor(config):
+    config['provisioner']['executor'] = 'foo'
+
+    with pytest.raises(marshmallow.ValidationError) as e:
+        schema.validate(config)
+
+    assert 'Not a valid choice.' in str(e)
+
+
 #  def validate(c):
 #      if c['driver']['name'] == 'vagrant':
 #          schema = MoleculeVagrantSchema(strict=True)
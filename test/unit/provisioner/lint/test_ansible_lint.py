@@ -18,10 +18,13 @@
 #  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 #  DEALINGS IN THE SOFTWARE.
 
+import os
+
 import pytest
 import sh
 
 from molecule import config
+from molecule import util
 from molecule.provisioner.lint import ansible_lint
 
 
@@ -168,3 +171,16 @@ def test_executes_catches_and_exits_return_code(
         ansible_lint_instance.execute()
 
     assert 1 == e.value.code
+
+
+def test_get_digest_ignores_ephemeral_directories(ansible_lint_instance):
+    playbook = ansible_lint_instance._config.provisioner.playbooks.converge
+    x = ansible_lint_instance._get_digest(playbook)
+
+    ephemeral_directory = os.path.join(
+        ansible_lint_instance._config.project_directory, 'molecule', 'foo',
+        '.molecule')
+    os.makedirs(ephemeral_directory)
+    util.write_file(os.path.join(ephemeral_directory, 'state.yml'), 'foo')
+
+    assert x == ansible_lint_instance._get_digest(playbook)
@@ -18,10 +18,10 @@
 #  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 #  DEALINGS IN THE SOFTWARE.
 
-import collections
 import os
 
 import pytest
+import sh
 import six
 
 from molecule import config
@@ -52,6 +52,7 @@ def molecule_provisioner_section_data():
                 'ANSIBLE_ROLES_PATH': 'foo/bar',
                 'ANSIBLE_LIBRARY': 'foo/bar',
                 'ANSIBLE_FILTER_PLUGINS': 'foo/bar',
+                'ANSIBLE_CALLBACK_PLUGINS': 'foo/bar',
             },
             'inventory': {
                 'host_vars': {
@@ -134,6 +135,10 @@ def test_default_config_options_property(ansible_instance):
             'retry_files_enabled': False,
             'host_key_checking': False,
             'nocows': 1,
+            'forks': 5,
+            'gathering': 'smart',
+            'fact_caching': 'jsonfile',
+            'fact_caching_connection': ansible_instance.fact_cache_directory,
         },
         'ssh_connection': {
             'scp_if_ssh': True,
@@ -144,6 +149,46 @@ def test_default_config_options_property(ansible_instance):
     assert x == ansible_instance.default_config_options
 
 
+@pytest.fixture
+def patched_ssh_driver(mocker):
+    m = mocker.patch(
+        'molecule.driver.docker.Docker.default_ssh_connection_options',
+        new_callable=mocker.PropertyMock)
+    m.return_value = ['-o foo=bar']
+
+    return m
+
+
+def test_default_config_options_property_ssh_driver(mocker, patched_ssh_driver,
+                                                    ansible_instance):
+    mocker.patch('molecule.provisioner.ansible.MAX_CONTROL_PATH_DIR_LENGTH',
+                 1000)
+    x = {
+        'scp_if_ssh':
+        True,
+        'pipelining':
+        True,
+        'ssh_args':
+        '-C -o ControlMaster=auto -o ControlPersist=600s',
+        'control_path_dir':
+        os.path.join(ansible_instance._config.scenario.ephemeral_directory,
+                     'cp'),
+        'control_path':
+        '%(directory)s/%%C',
+    }
+
+    assert x == ansible_instance.default_config_options['ssh_connection']
+
+
+def test_default_config_options_property_ssh_driver_long_ephemeral_directory(
+        mocker, patched_ssh_driver, ansible_instance):
+    mocker.patch('molecule.provisioner.ansible.MAX_CONTROL_PATH_DIR_LENGTH', 0)
+    d = ansible_instance.default_config_options['ssh_connection']
+
+    assert 'control_path_dir' not in d
+    assert '%(directory)s/%%C' == d['control_path']
+
+
 def test_default_options_property(ansible_instance):
     assert {} == ansible_instance.default_options
 
@@ -160,6 +205,10 @@ def test_default_env_property(ansible_instance):
     assert 'ANSIBLE_ROLES_PATH' in ansible_instance.env
     assert 'ANSIBLE_LIBRARY' in ansible_instance.env
     assert 'ANSIBLE_FILTER_PLUGINS' in ansible_instance.env
+    assert 'ANSIBLE_CALLBACK_PLUGINS' in ansible_instance.env
+    x = ansible_instance.events_file
+
+    assert x == ansible_instance.default_env['MOLECULE_EVENTS_FILE']
 
 
 def test_name_property(ansible_instance):
@@ -204,6 +253,10 @@ def test_config_options_property(ansible_instance):
             'retry_files_enabled': False,
             'host_key_checking': False,
             'nocows': 1,
+            'forks': 5,
+            'gathering': 'smart',
+            'fact_caching': 'jsonfile',
+            'fact_caching_connection': ansible_instance.fact_cache_directory,
             'foo': 'bar'
         },
         'ssh_connection': {
@@ -277,6 +330,20 @@ def test_env_appends_env_property(ansible_instance):
     ]
     assert x == ansible_instance.env['ANSIBLE_FILTER_PLUGINS'].split(':')
 
+    x = [
+        ansible_instance._get_callback_plugin_directory(),
+        util.abs_path(
+            os.path.join(ansible_instance._config.project_directory, 'plugins',
+                         'callbacks')),
+        util.abs_path(
+            os.path.join(ansible_instance._config.scenario.ephemeral_directory,
+                         'plugins', 'callbacks')),
+        util.abs_path(
+            os.path.join(ansible_instance._config.scenario.directory, 'foo',
+                         'bar')),
+    ]
+    assert x == ansible_instance.env['ANSIBLE_CALLBACK_PLUGINS'].split(':')
+
 
 def test_host_vars_property(ansible_instance):
     x = {'instance-1': [{'foo': 'bar'}], 'localhost': [{'foo': 'baz'}]}
@@ -438,6 +505,30 @@ def test_config_file_property(ansible_instance):
     assert x == ansible_instance.config_file
 
 
+def test_executor_property(ansible_instance):
+    assert 'sh' == ansible_instance.executor
+
+
+def test_executor_property_overridden_by_command_args(ansible_instance):
+    ansible_instance._config.command_args['executor'] = 'worker'
+
+    assert 'worker' == ansible_instance.executor
+
+
+def test_fact_cache_directory_property(ansible_instance):
+    x = os.path.join(ansible_instance._config.scenario.ephemeral_directory,
+                     'facts')
+
+    assert x == ansible_instance.fact_cache_directory
+
+
+def test_events_file_property(ansible_instance):
+    x = os.path.join(ansible_instance._config.scenario.ephemeral_directory,
+                     'ansible_events.json')
+
+    assert x == ansible_instance.events_file
+
+
 def test_playbooks_create_property(ansible_instance):
     x = os.path.join(ansible_instance._config.scenario.directory, 'create.yml')
 
@@ -462,6 +553,14 @@ def test_playbooks_side_effect_property(ansible_instance):
     assert ansible_instance.playbooks.side_effect is None
 
 
+def test_playbooks_snapshot_property(ansible_instance):
+    assert ansible_instance.playbooks.snapshot is None
+
+
+def test_playbooks_restore_property(ansible_instance):
+    assert ansible_instance.playbooks.restore is None
+
+
 def test_connection_options(ansible_instance):
     x = {'ansible_connection': 'docker', 'foo': 'bar'}
 
@@ -479,6 +578,124 @@ def test_check(ansible_instance, mocker, patched_ansible_playbook):
     patched_ansible_playbook.return_value.execute.assert_called_once_with()
 
 
+def test_idempotence(ansible_instance, mocker, patched_ansible_playbook):
+    ansible_instance.idempotence()
+
+    patched_ansible_playbook.assert_called_once_with(
+        ansible_instance._config.provisioner.playbooks.converge,
+        ansible_instance._config, )
+
+    x = [
+        mocker.call('start-at-task', None),
+        mocker.call('forks', 2),
+    ]
+
+    assert x == patched_ansible_playbook.return_value.add_cli_arg.mock_calls
+    patched_ansible_playbook.return_value.execute.assert_called_once_with()
+
+
+def test_idempotence_check_mode_and_start_at_task(ansible_instance, mocker,
+                                                  patched_ansible_playbook):
+    ansible_instance.idempotence(check_mode=True, start_at_task='foo')
+
+    x = [
+        mocker.call('check', True),
+        mocker.call('diff', True),
+        mocker.call('start-at-task', 'foo'),
+        mocker.call('forks', 2),
+    ]
+
+    assert x == patched_ansible_playbook.return_value.add_cli_arg.mock_calls
+
+
+def test_idempotence_does_not_override_forks(ansible_instance, mocker,
+                                             patched_ansible_playbook):
+    ansible_instance._config.config['provisioner']['options']['forks'] = 10
+    ansible_instance.idempotence()
+
+    x = [mocker.call('start-at-task', None)]
+
+    assert x == patched_ansible_playbook.return_value.add_cli_arg.mock_calls
+
+
+def test_idempotence_shards_by_group(ansible_instance, mocker,
+                                     patched_ansible_playbook):
+    ansible_instance._config.config['provisioner']['idempotence'][
+        'shard'] = True
+    events_file = ansible_instance.events_file
+
+    def start():
+        name = patched_ansible_playbook.call_count
+        path = patched_ansible_playbook.return_value.add_env_arg.call_args[0][
+            1]
+        with open(path, 'w') as stream:
+            stream.write('{{"event": "ok", "task": "{}"}}\n'.format(name))
+
+        return mocker.Mock()
+
+    patched_ansible_playbook.return_value.start.side_effect = start
+    ansible_instance.idempotence()
+
+    assert 2 == patched_ansible_playbook.call_count
+
+    x = [
+        mocker.call('start-at-task', None),
+        mocker.call('forks', 1),
+        mocker.call('limit', 'instance-2'),
+        mocker.call('start-at-task', None),
+        mocker.call('forks', 1),
+        mocker.call('limit', 'instance-1'),
+    ]
+
+    assert x == patched_ansible_playbook.return_value.add_cli_arg.mock_calls
+
+    x = [
+        mocker.call('MOLECULE_EVENTS_FILE', events_file + '.baz'),
+        mocker.call('MOLECULE_EVENTS_FILE', events_file + '.foo'),
+    ]
+
+    assert x == patched_ansible_playbook.return_value.add_env_arg.mock_calls
+
+    x = [{'event': 'ok', 'task': '1'}, {'event': 'ok', 'task': '2'}]
+
+    assert x == list(ansible_instance.events())
+    assert not os.path.exists(events_file + '.baz')
+
+
+def test_idempotence_shards_exits_on_failure(ansible_instance, mocker,
+                                             patched_ansible_playbook,
+                                             patched_logger_critical):
+    ansible_instance._config.config['provisioner']['idempotence'][
+        'shard'] = True
+    cmd = mocker.Mock()
+    cmd.wait.side_effect = sh.ErrorReturnCode_1(sh.ansible_playbook, b'out',
+                                                b'err')
+    patched_ansible_playbook.return_value.start.return_value = cmd
+
+    with pytest.raises(SystemExit) as e:
+        ansible_instance.idempotence()
+
+    assert 1 == e.value.code
+    assert 2 == cmd.wait.call_count
+
+    msg = ("Idempotence shard(s) failed:\n"
+           "* 'baz' exited with code 1\n"
+           "* 'foo' exited with code 1")
+    patched_logger_critical.assert_called_once_with(msg)
+
+
+def test_get_forks(ansible_instance, mocker):
+    m = mocker.patch('multiprocessing.cpu_count')
+    m.return_value = 8
+
+    assert 3 == ansible_instance._get_forks(['a', 'b', 'c'])
+    assert 8 == ansible_instance._get_forks(['host'] * 20)
+
+    m.return_value = 1
+
+    assert 5 == ansible_instance._get_forks(['host'] * 20)
+
+
 def test_converge(ansible_instance, mocker, patched_ansible_playbook):
     result = ansible_instance.converge()
 
@@ -533,6 +750,24 @@ def test_create(ansible_instance, mocker, patched_ansible_playbook):
     patched_ansible_playbook.return_value.execute.assert_called_once_with()
 
 
+def test_snapshot(ansible_instance, mocker, patched_ansible_playbook):
+    ansible_instance.snapshot()
+
+    patched_ansible_playbook.assert_called_once_with(
+        ansible_instance._config.provisioner.playbooks.snapshot,
+        ansible_instance._config, )
+    patched_ansible_playbook.return_value.execute.assert_called_once_with()
+
+
+def test_restore(ansible_instance, mocker, patched_ansible_playbook):
+    ansible_instance.restore()
+
+    patched_ansible_playbook.assert_called_once_with(
+        ansible_instance._config.provisioner.playbooks.restore,
+        ansible_instance._config, )
+    patched_ansible_playbook.return_value.execute.assert_called_once_with()
+
+
 def test_syntax(ansible_instance, mocker, patched_ansible_playbook):
     ansible_instance.syntax()
 
@@ -544,6 +779,92 @@ def test_syntax(ansible_instance, mocker, patched_ansible_playbook):
     patched_ansible_playbook.return_value.execute.assert_called_once_with()
 
 
+def test_events(ansible_instance):
+    events_file = ansible_instance.events_file
+    with open(events_file, 'w') as stream:
+        stream.write('{"event": "task_start", "task": "foo"}\n')
+        stream.write('\n')
+        stream.write('{"event": "ok", "task": "foo", "changed": true}\n')
+
+    x = [
+        {
+            'event': 'task_start',
+            'task': 'foo'
+        },
+        {
+            'event': 'ok',
+            'task': 'foo',
+            'changed': True
+        },
+    ]
+
+    assert x == list(ansible_instance.events())
+
+
+def test_events_without_events_file(ansible_instance):
+    assert [] == list(ansible_instance.events())
+
+
+def test_changed_tasks(ansible_instance):
+    events_file = ansible_instance.events_file
+    with open(events_file, 'w') as stream:
+        stream.write('{"event": "task_start", "task": "foo"}\n')
+        stream.write('{"event": "ok", "task": "foo", "changed": false}\n')
+        stream.write('{"event": "task_start", "task": "bar"}\n')
+        stream.write('{"event": "ok", "task": "bar", "changed": true}\n')
+        stream.write('{"event": "ok", "task": "bar", "changed": true}\n')
+        stream.write('{"event": "task_start", "task": "baz"}\n')
+        stream.write('{"event": "ok", "task": "baz", "changed": true}\n')
+        stream.write(
+            '{"event": "task_start", "task": "qux", "handler": true}\n')
+        stream.write('{"event": "ok", "task": "qux", "changed": true}\n')
+        stream.write('{"event": "stats", "hosts": {}}\n')
+
+    assert ['bar', 'baz'] == ansible_instance.changed_tasks()
+
+
+def test_changed_tasks_without_stats_event(ansible_instance):
+    events_file = ansible_instance.events_file
+    with open(events_file, 'w') as stream:
+        stream.write('{"event": "task_start", "task": "foo"}\n')
+        stream.write('{"event": "ok", "task": "foo", "changed": true}\n')
+
+    assert ansible_instance.changed_tasks() is None
+
+
+def test_fingerprint(ansible_instance):
+    ansible_instance.write_config()
+    ansible_instance.manage_inventory()
+    x = ansible_instance.fingerprint()
+
+    assert x == ansible_instance.fingerprint()
+
+    ansible_instance._config.ansible_args = ('--tags', 'foo')
+    assert x != ansible_instance.fingerprint()
+
+
+def test_fingerprint_ignores_ephemeral_directories(ansible_instance):
+    x = ansible_instance.fingerprint()
+
+    ephemeral_directory = os.path.join(
+        ansible_instance._config.project_directory, 'molecule', 'foo',
+        '.molecule')
+    os.makedirs(ephemeral_directory)
+    util.write_file(os.path.join(ephemeral_directory, 'state.yml'), 'foo')
+
+    assert x == ansible_instance.fingerprint()
+
+
+def test_fingerprint_ignores_verifier_directory(ansible_instance):
+    x = ansible_instance.fingerprint()
+
+    verifier_directory = ansible_instance._config.verifier.directory
+    os.makedirs(verifier_directory)
+    util.write_file(os.path.join(verifier_directory, 'test_default.py'), 'foo')
+
+    assert x == ansible_instance.fingerprint()
+
+
 def test_write_config(temp_dir, ansible_instance):
     ansible_instance.write_config()
 
@@ -752,12 +1073,33 @@ def test_remove_vars(ansible_instance):
     assert os.path.isfile(group_vars_1)
     assert os.path.isfile(group_vars_2)
 
+    c = ansible_instance._config.config
+    c['provisioner']['inventory']['host_vars'] = {}
+    c['provisioner']['inventory']['group_vars'] = {}
     ansible_instance._remove_vars()
 
     assert not os.path.isdir(host_vars_directory)
     assert not os.path.isdir(group_vars_directory)
 
 
+def test_remove_vars_keeps_configured_vars(ansible_instance):
+    ephemeral_directory = ansible_instance._config.scenario.ephemeral_directory
+    host_vars_directory = os.path.join(ephemeral_directory, 'host_vars')
+    host_vars = os.path.join(host_vars_directory, 'instance-1')
+    stale_host_vars = os.path.join(host_vars_directory, 'instance-3')
+
+    ansible_instance._add_or_update_vars()
+    util.write_file(stale_host_vars, util.safe_dump({}))
+    mtime = os.path.getmtime(host_vars)
+
+    ansible_instance._remove_vars()
+    ansible_instance._add_or_update_vars()
+
+    assert os.path.isfile(host_vars)
+    assert mtime == os.path.getmtime(host_vars)
+    assert not os.path.exists(stale_host_vars)
+
+
 def test_remove_vars_symlinks(ansible_instance):
     ephemeral_directory = ansible_instance._config.scenario.ephemeral_directory
 
@@ -794,6 +1136,12 @@ def test_link_vars(ansible_instance):
     assert os.path.lexists(target_group_vars)
     assert os.path.lexists(target_host_vars)
 
+    ansible_instance._remove_vars()
+    ansible_instance._link_or_update_vars()
+
+    assert os.path.lexists(target_group_vars)
+    assert os.path.lexists(target_host_vars)
+
 
 def test_link_vars_raises_when_source_not_found(ansible_instance,
                                                 patched_logger_critical):
@@ -828,19 +1176,33 @@ def test_verify_inventory_raises_when_missing_hosts(
     patched_logger_critical.assert_called_once_with(msg)
 
 
-def test_vivify(ansible_instance):
-    d = ansible_instance._vivify()
-    d['bar']['baz'] = 'qux'
+def test_inventory_property_is_built_once(mocker, ansible_instance):
+    m = mocker.patch(
+        'molecule.provisioner.ansible.Ansible._build_inventory',
+        return_value={'all': {}})
+    ansible_instance._verify_inventory()
+    ansible_instance._write_inventory()
 
-    assert 'qux' == str(d['bar']['baz'])
+    m.assert_called_once_with()
 
 
-def test_default_to_regular(ansible_instance):
-    d = collections.defaultdict()
-    assert isinstance(d, collections.defaultdict)
+@pytest.mark.parametrize('platforms', [10, 100, 1000])
+def test_build_inventory_computes_connection_options_once_per_instance(
+        mocker, platforms, ansible_instance):
+    ansible_instance._config.config['platforms'] = [{
+        'name':
+        'instance-{}'.format(i),
+        'groups': ['foo', 'bar'],
+        'children': ['baz'],
+    } for i in range(platforms)]
+    m = mocker.patch(
+        'molecule.provisioner.ansible.Ansible.connection_options',
+        return_value={})
+    inventory = ansible_instance._build_inventory()
 
-    d = ansible_instance._default_to_regular(d)
-    assert isinstance(d, dict)
+    assert platforms == m.call_count
+    assert platforms == len(inventory['all']['hosts'])
+    assert platforms == len(inventory['foo']['children']['baz']['hosts'])
 
 
 def test_get_plugin_directory(ansible_instance):
@@ -866,6 +1228,14 @@ def test_get_filter_plugin_directory(ansible_instance):
     assert x == parts[-5:]
 
 
+def test_get_callback_plugin_directory(ansible_instance):
+    result = ansible_instance._get_callback_plugin_directory()
+    parts = pytest.helpers.os_split(result)
+    x = ('molecule', 'provisioner', 'ansible', 'plugins', 'callbacks')
+
+    assert x == parts[-5:]
+
+
 def test_ansible_config_to_dict(monkeypatch, ansible_config, ansible_instance):
     monkeypatch.setenv('ANSIBLE_CONFIG', ansible_config)
     c, p = ansible_instance._load_ansible_config_file()
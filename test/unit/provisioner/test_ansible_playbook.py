@@ -18,10 +18,13 @@
 #  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 #  DEALINGS IN THE SOFTWARE.
 
+import os
+
 import pytest
 import sh
 
 from molecule import config
+from molecule import util
 from molecule.provisioner import ansible_playbook
 
 
@@ -103,6 +106,124 @@ def test_execute_bakes_with_ansible_args(inventory_file, patched_run_command,
     patched_run_command.assert_called_once_with(cmd, debug=False)
 
 
+@pytest.fixture
+def patched_runs_under_interpreter(mocker):
+    m = mocker.patch(
+        'molecule.provisioner.ansible_worker.runs_under_interpreter')
+    m.return_value = True
+
+    return m
+
+
+def test_execute_in_worker(mocker, patched_run_command,
+                           patched_runs_under_interpreter,
+                           ansible_playbook_instance):
+    ansible_playbook_instance._config.config['provisioner'][
+        'executor'] = 'worker'
+    m = mocker.patch('molecule.provisioner.ansible_worker.get_worker')
+    m.return_value.run.return_value = 0
+    result = ansible_playbook_instance.execute()
+
+    cmd = ansible_playbook_instance._ansible_command
+    m.assert_called_once_with(
+        str(sh.ansible_playbook), ansible_playbook_instance._env,
+        ansible_playbook_instance._config.scenario.directory)
+
+    x = [arg.decode('utf-8') for arg in cmd._partial_baked_args]
+    m.return_value.run.assert_called_once_with(x)
+    assert not patched_run_command.called
+    assert '' == result
+
+
+def test_execute_in_worker_exits_return_code(mocker, patched_logger_critical,
+                                             patched_runs_under_interpreter,
+                                             ansible_playbook_instance):
+    ansible_playbook_instance._config.config['provisioner'][
+        'executor'] = 'worker'
+    m = mocker.patch('molecule.provisioner.ansible_worker.get_worker')
+    m.return_value.run.return_value = 2
+    with pytest.raises(SystemExit) as e:
+        ansible_playbook_instance.execute()
+
+    assert 2 == e.value.code
+
+    msg = '`ansible-playbook` exited with code 2.'
+    patched_logger_critical.assert_called_once_with(msg)
+
+
+def test_execute_without_worker(
+        mocker, patched_run_command, patched_logger_warn,
+        patched_runs_under_interpreter, ansible_playbook_instance):
+    ansible_playbook_instance._config.config['provisioner'][
+        'executor'] = 'worker'
+    m = mocker.patch('molecule.provisioner.ansible_worker.get_worker')
+    m.return_value = None
+    ansible_playbook_instance.execute()
+
+    msg = ('Unable to import Ansible, executing `ansible-playbook` without '
+           'the worker.')
+    patched_logger_warn.assert_called_once_with(msg)
+    assert patched_run_command.called
+
+
+def test_execute_without_worker_when_not_a_script_of_the_interpreter(
+        mocker, patched_run_command, patched_logger_warn,
+        patched_runs_under_interpreter, ansible_playbook_instance):
+    ansible_playbook_instance._config.config['provisioner'][
+        'executor'] = 'worker'
+    patched_runs_under_interpreter.return_value = False
+    m = mocker.patch('molecule.provisioner.ansible_worker.get_worker')
+    ansible_playbook_instance.execute()
+
+    msg = ('`ansible-playbook` is not a script of the Python interpreter '
+           'running Molecule, executing it without the worker.')
+    patched_logger_warn.assert_called_once_with(msg)
+    assert not m.called
+    assert patched_run_command.called
+
+
+def test_execute_without_worker_with_output_functions(
+        mocker, patched_run_command, config_instance):
+    config_instance.config['provisioner']['executor'] = 'worker'
+    m = mocker.patch('molecule.provisioner.ansible_worker.get_worker')
+    pb = ansible_playbook.AnsiblePlaybook(
+        'playbook', config_instance, out=None, err=None)
+    pb.execute()
+
+    assert not m.called
+    assert patched_run_command.called
+
+
+def test_start(inventory_file, patched_run_command, ansible_playbook_instance):
+    result = ansible_playbook_instance.start()
+
+    cmd = '{} --inventory={} playbook'.format(
+        str(sh.ansible_playbook), inventory_file)
+    patched_run_command.assert_called_once_with(cmd, debug=False)
+    assert patched_run_command.return_value == result
+
+    args = patched_run_command.call_args[0][0]._partial_call_args
+    assert args['bg']
+
+
+def test_execute_removes_events_file(patched_run_command,
+                                     ansible_playbook_instance):
+    events_file = ansible_playbook_instance._env['MOLECULE_EVENTS_FILE']
+    util.write_file(events_file, '{"event": "stats", "hosts": {}}')
+    ansible_playbook_instance.execute()
+
+    assert not os.path.exists(events_file)
+
+
+def test_start_removes_events_file(patched_run_command,
+                                   ansible_playbook_instance):
+    events_file = ansible_playbook_instance._env['MOLECULE_EVENTS_FILE']
+    util.write_file(events_file, '{"event": "stats", "hosts": {}}')
+    ansible_playbook_instance.start()
+
+    assert not os.path.exists(events_file)
+
+
 def test_executes_catches_and_exits_return_code_with_stdout(
         patched_run_command, patched_logger_critical,
         ansible_playbook_instance):
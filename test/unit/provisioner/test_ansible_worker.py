@@ -0,0 +1,167 @@
+#  Copyright (c) 2015-2017 Cisco Systems, Inc.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to
+#  deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+#  sell copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+
+import os
+import sys
+
+import pytest
+
+from molecule.provisioner import ansible_worker
+
+
+@pytest.fixture
+def executable(tmpdir):
+    path = tmpdir.join('ansible-playbook')
+    path.write("""
+import os
+import sys
+
+with open(sys.argv[1], 'w') as f:
+    f.write('{} {}'.format(os.environ.get('FOO'), os.getcwd()))
+
+sys.exit(int(sys.argv[2]))
+""")
+
+    return str(path)
+
+
+@pytest.fixture
+def env():
+    return dict(os.environ, FOO='bar')
+
+
+@pytest.fixture
+def worker_instance(executable, env, tmpdir):
+    worker = ansible_worker.get_worker(executable, env, str(tmpdir))
+    yield worker
+    ansible_worker.stop_worker()
+
+
+def test_run(worker_instance, tmpdir):
+    output = tmpdir.join('output')
+
+    assert worker_instance.ready
+    assert 0 == worker_instance.run([str(output), '0'])
+    assert 'bar {}'.format(tmpdir) == output.read()
+
+
+def test_run_returns_exit_code(worker_instance, tmpdir):
+    output = tmpdir.join('output')
+
+    assert 2 == worker_instance.run([str(output), '2'])
+    assert 0 == worker_instance.run([str(output), '0'])
+
+
+def test_serves(worker_instance, executable, env, tmpdir):
+    assert worker_instance.serves(executable, env, str(tmpdir))
+    assert not worker_instance.serves(executable, {'FOO': 'baz'}, str(tmpdir))
+    assert not worker_instance.serves(executable, env, '/')
+
+
+def test_get_worker_reuses_worker(worker_instance, executable, env, tmpdir):
+    worker = ansible_worker.get_worker(executable, env, str(tmpdir))
+
+    assert worker_instance is worker
+
+
+def test_get_worker_replaces_worker_when_environment_changes(
+        worker_instance, executable, env, tmpdir):
+    env['FOO'] = 'baz'
+    worker = ansible_worker.get_worker(executable, env, str(tmpdir))
+    output = tmpdir.join('output')
+
+    assert worker_instance is not worker
+    assert not worker_instance.ready
+    assert 0 == worker.run([str(output), '0'])
+    assert 'baz {}'.format(tmpdir) == output.read()
+
+
+def test_worker_imports_ansible_with_the_runs_environment(tmpdir):
+    import ansible.constants  # noqa
+
+    executable = tmpdir.join('ansible-playbook')
+    executable.write("""
+import sys
+
+from ansible import constants
+
+with open(sys.argv[1], 'w') as f:
+    f.write(str(constants.DEFAULT_FORKS))
+""")
+    env = dict(os.environ, ANSIBLE_FORKS='7')
+    worker = ansible_worker.get_worker(str(executable), env, str(tmpdir))
+    output = tmpdir.join('output')
+
+    try:
+        assert 0 == worker.run([str(output)])
+        assert '7' == output.read()
+    finally:
+        ansible_worker.stop_worker()
+
+
+def test_purge_ansible(mocker):
+    mocker.patch.dict(sys.modules, {
+        'ansible': None,
+        'ansible.constants': None,
+        'ansible_collections': None,
+        'ansible_foo': None,
+    })
+    ansible_worker._purge_ansible()
+
+    assert 'ansible' not in sys.modules
+    assert 'ansible.constants' not in sys.modules
+    assert 'ansible_collections' not in sys.modules
+    assert 'ansible_foo' in sys.modules
+
+
+def test_stop_worker(worker_instance):
+    ansible_worker.stop_worker()
+
+    assert not worker_instance.ready
+    assert os.getpid() not in ansible_worker._workers
+
+
+def test_runs_under_interpreter(tmpdir):
+    script = tmpdir.join('script')
+    script.write('#!{}\n'.format(sys.executable))
+
+    assert ansible_worker.runs_under_interpreter(str(script))
+
+
+def test_runs_under_interpreter_through_env(mocker, tmpdir):
+    mocker.patch.dict(os.environ, {'PATH': os.path.dirname(sys.executable)})
+    script = tmpdir.join('script')
+    script.write(
+        '#!/usr/bin/env {}\n'.format(os.path.basename(sys.executable)))
+
+    assert ansible_worker.runs_under_interpreter(str(script))
+
+
+@pytest.mark.parametrize('content', [
+    '#!/bin/sh\nexec python "$@"\n',
+    '#!/usr/bin/env molecule-missing-interpreter\n',
+    'import ansible\n',
+])
+def test_runs_under_interpreter_returns_false(content, tmpdir):
+    script = tmpdir.join('script')
+    script.write(content)
+
+    assert not ansible_worker.runs_under_interpreter(str(script))
+    assert not ansible_worker.runs_under_interpreter(str(tmpdir.join('foo')))
@@ -24,8 +24,10 @@ import pytest
 
 from molecule import config
 from molecule import platforms
+from molecule import report
 from molecule import scenario
 from molecule import state
+from molecule import util
 from molecule.dependency import ansible_galaxy
 from molecule.dependency import gilt
 from molecule.driver import delegated
@@ -276,18 +278,32 @@ def test_drivers_property(config_instance):
 
 def test_env(config_instance):
     x = {
-        'MOLECULE_DEBUG': 'False',
-        'MOLECULE_FILE': config_instance.molecule_file,
-        'MOLECULE_INVENTORY_FILE': config_instance.provisioner.inventory_file,
-        'MOLECULE_EPHEMERAL_DIRECTORY': config_instance.ephemeral_directory,
-        'MOLECULE_SCENARIO_DIRECTORY': config_instance.scenario.directory,
-        'MOLECULE_INSTANCE_CONFIG': config_instance.driver.instance_config,
-        'MOLECULE_DEPENDENCY_NAME': 'galaxy',
-        'MOLECULE_DRIVER_NAME': 'docker',
-        'MOLECULE_LINT_NAME': 'yamllint',
-        'MOLECULE_PROVISIONER_NAME': 'ansible',
-        'MOLECULE_SCENARIO_NAME': 'default',
-        'MOLECULE_VERIFIER_NAME': 'testinfra'
+        'MOLECULE_DEBUG':
+        'False',
+        'MOLECULE_FILE':
+        config_instance.molecule_file,
+        'MOLECULE_INVENTORY_FILE':
+        config_instance.provisioner.inventory_file,
+        'MOLECULE_EPHEMERAL_DIRECTORY':
+        config_instance.ephemeral_directory,
+        'MOLECULE_SCENARIO_DIRECTORY':
+        config_instance.scenario.directory,
+        'MOLECULE_INSTANCE_CONFIG':
+        config_instance.driver.instance_config,
+        'MOLECULE_FACT_CACHE_DIRECTORY':
+        config_instance.provisioner.fact_cache_directory,
+        'MOLECULE_DEPENDENCY_NAME':
+        'galaxy',
+        'MOLECULE_DRIVER_NAME':
+        'docker',
+        'MOLECULE_LINT_NAME':
+        'yamllint',
+        'MOLECULE_PROVISIONER_NAME':
+        'ansible',
+        'MOLECULE_SCENARIO_NAME':
+        'default',
+        'MOLECULE_VERIFIER_NAME':
+        'testinfra'
     }
 
     assert x == config_instance.env
@@ -353,6 +369,10 @@ def test_scenario_property(config_instance):
     assert isinstance(config_instance.scenario, scenario.Scenario)
 
 
+def test_report_property(config_instance):
+    assert isinstance(config_instance.report, report.Report)
+
+
 def test_state_property(config_instance):
     assert isinstance(config_instance.state, state.State)
 
@@ -406,6 +426,42 @@ def test_verifiers_property(config_instance):
     assert x == config_instance.verifiers
 
 
+def test_components_are_cached(config_instance):
+    assert config_instance.driver is config_instance.driver
+    assert config_instance.provisioner is config_instance.provisioner
+    assert config_instance.state is config_instance.state
+
+
+def test_invalidate_cache(config_instance):
+    driver = config_instance.driver
+    provisioner = config_instance.provisioner
+    report = config_instance.report
+    state = config_instance.state
+    config_instance.invalidate_cache(['created'])
+
+    assert driver is not config_instance.driver
+    assert provisioner is not config_instance.provisioner
+    assert report is config_instance.report
+    assert state is config_instance.state
+
+
+def test_invalidate_cache_keeps_components_independent_of_keys(
+        config_instance):
+    driver = config_instance.driver
+    provisioner = config_instance.provisioner
+    config_instance.invalidate_cache(['converged', 'converge_fingerprint'])
+
+    assert driver is config_instance.driver
+    assert provisioner is config_instance.provisioner
+
+
+def test_state_change_invalidates_cache(config_instance):
+    driver = config_instance.driver
+    config_instance.state.change_state('driver', 'docker')
+
+    assert driver is not config_instance.driver
+
+
 def test_merge_dicts_instance_proxies(config_instance):
     a = {'a': 1}
     b = {'b': 2}
@@ -462,6 +518,25 @@ def test_molecule_file():
     assert '/foo/bar/molecule.yml' == config.molecule_file('/foo/bar')
 
 
+def test_scenario_name(config_instance):
+    molecule_file = config_instance.molecule_file
+    util.write_file(molecule_file,
+                    util.safe_dump({
+                        'scenario': {
+                            'name': 'foo'
+                        }
+                    }))
+
+    assert 'foo' == config.scenario_name(molecule_file)
+
+
+def test_scenario_name_defaults(config_instance):
+    molecule_file = config_instance.molecule_file
+    util.write_file(molecule_file, util.safe_dump({}))
+
+    assert 'default' == config.scenario_name(molecule_file)
+
+
 def test_molecule_drivers():
     x = [
         'delegated',
@@ -0,0 +1,122 @@
+#  Copyright (c) 2015-2017 Cisco Systems, Inc.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to
+#  deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+#  sell copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+
+import json
+import os
+
+import pytest
+
+from molecule import report
+from molecule import util
+
+
+@pytest.fixture
+def report_instance(config_instance):
+    return report.Report(config_instance)
+
+
+def _load(filename):
+    with open(filename) as stream:
+        return json.load(stream)
+
+
+def test_report_file_property(report_instance):
+    x = os.path.join(report_instance._config.scenario.ephemeral_directory,
+                     'run_report.json')
+
+    assert x == report_instance.report_file
+
+
+def test_trace_file_property(report_instance):
+    assert report_instance.trace_file is None
+
+
+def test_action(report_instance):
+    with report_instance.action('create'):
+        pass
+
+    action = report_instance.actions[0]
+
+    assert 'create' == action['action']
+    assert 0 == action['exit_code']
+    assert action['wall_time'] >= 0
+    assert ['system', 'user'] == sorted(action['cpu_time'])
+    assert 'max_rss' in action
+
+    data = _load(report_instance.report_file)
+
+    assert 'default' == data['scenario']
+    assert 'docker' == data['driver']
+    assert report_instance.actions == data['actions']
+
+
+def test_action_records_exit_code(report_instance):
+    with pytest.raises(SystemExit):
+        with report_instance.action('converge'):
+            util.sysexit(2)
+
+    assert 2 == report_instance.actions[0]['exit_code']
+
+
+def test_action_records_exception(report_instance):
+    with pytest.raises(ValueError):
+        with report_instance.action('converge'):
+            raise ValueError
+
+    assert 1 == report_instance.actions[0]['exit_code']
+
+
+def test_action_appends_actions(report_instance):
+    with report_instance.action('create'):
+        pass
+    with report_instance.action('converge'):
+        pass
+
+    data = _load(report_instance.report_file)
+    x = ['create', 'converge']
+
+    assert x == [a['action'] for a in data['actions']]
+
+
+def test_action_writes_trace_events(temp_dir, report_instance):
+    trace_file = os.path.join(temp_dir.strpath, 'trace.json')
+    report_instance._config.args = {'trace_file': trace_file}
+    report.init_trace_file(trace_file)
+
+    with report_instance.action('create'):
+        pass
+    with report_instance.action('converge'):
+        pass
+
+    with open(trace_file) as stream:
+        events = json.loads(stream.read().rstrip(',\n') + ']')
+
+    assert ['M', 'X', 'X'] == [e['ph'] for e in events]
+    assert {'name': 'default'} == events[0]['args']
+    assert ['create', 'converge'] == [e['name'] for e in events[1:]]
+
+
+def test_init_trace_file(temp_dir):
+    trace_file = os.path.join(temp_dir.strpath, 'trace.json')
+    util.write_file(trace_file, 'stale')
+    report.init_trace_file(trace_file)
+
+    with open(trace_file) as stream:
+        assert '[\n' == stream.read()
@@ -18,11 +18,67 @@
 #  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 #  DEALINGS IN THE SOFTWARE.
 
+import os
+import subprocess
+import sys
+
 import pytest
 
+import molecule
+from molecule import shell
+
+STARTUP_SCRIPT = """
+import sys
+
 from molecule import shell
 
+sys.argv = ['molecule'] + sys.argv[1:]
+try:
+    shell.main()
+except SystemExit:
+    pass
+sys.stderr.write('\\n'.join(sys.modules))
+"""
+HEAVY_MODULES = [
+    'ansible.constants',
+    'click_completion',
+    'cookiecutter',
+    'pexpect',
+    'testinfra',
+]
+
 
 def test_shell():
     with pytest.raises(SystemExit):
         shell.main()
+
+
+def _startup_modules(args):
+    env = os.environ.copy()
+    env.pop('_MOLECULE_COMPLETE', None)
+    env['PYTHONPATH'] = os.path.dirname(os.path.dirname(molecule.__file__))
+    env['PBR_VERSION'] = molecule.__version__
+    proc = subprocess.Popen(
+        [sys.executable, '-c', STARTUP_SCRIPT] + args,
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE)
+    _, err = proc.communicate()
+
+    return err.decode('utf-8').splitlines()
+
+
+def test_help_does_not_import_heavy_modules(temp_dir):
+    modules = _startup_modules(['--help'])
+
+    assert 'molecule.shell' in modules
+    for module in HEAVY_MODULES + ['tabulate']:
+        assert module not in modules
+
+
+def test_list_does_not_import_heavy_modules(config_instance):
+    modules = _startup_modules(['list'])
+
+    assert 'tabulate' in modules
+    for module in HEAVY_MODULES:
+        assert module not in modules
@@ -43,6 +43,14 @@ def test_converged(state_instance):
     assert not state_instance.converged
 
 
+def test_converge_fingerprint(state_instance):
+    assert state_instance.converge_fingerprint is None
+
+
+def test_converge_changed_tasks(state_instance):
+    assert state_instance.converge_changed_tasks is None
+
+
 def test_created(state_instance):
     assert not state_instance.created
 
@@ -51,6 +59,10 @@ def test_driver(state_instance):
     assert not state_instance.driver
 
 
+def test_snapshotted(state_instance):
+    assert not state_instance.snapshotted
+
+
 def test_reset(state_instance):
     assert not state_instance.converged
 
@@ -74,12 +86,59 @@ def test_reset_persists(state_instance):
     assert not d.get('converged')
 
 
+@pytest.fixture
+def fact_cache_directory(state_instance):
+    path = state_instance._config.provisioner.fact_cache_directory
+    os.mkdir(path)
+    with open(os.path.join(path, 'instance-1'), 'w') as stream:
+        stream.write('{}')
+
+    return path
+
+
+def test_reset_removes_fact_cache(fact_cache_directory, state_instance):
+    state_instance.reset()
+
+    assert not os.path.exists(fact_cache_directory)
+
+
+def test_change_state_created_removes_fact_cache(fact_cache_directory,
+                                                 state_instance):
+    state_instance.change_state('created', True)
+
+    assert not os.path.exists(fact_cache_directory)
+
+
+def test_remove_fact_cache(fact_cache_directory, state_instance):
+    state_instance.remove_fact_cache()
+
+    assert not os.path.exists(fact_cache_directory)
+
+
+def test_change_state_keeps_fact_cache(fact_cache_directory, state_instance):
+    state_instance.change_state('converged', True)
+
+    assert os.path.isdir(fact_cache_directory)
+
+
 def test_change_state_converged(state_instance):
     state_instance.change_state('converged', True)
 
     assert state_instance.converged
 
 
+def test_change_state_converge_fingerprint(state_instance):
+    state_instance.change_state('converge_fingerprint', 'foo')
+
+    assert 'foo' == state_instance.converge_fingerprint
+
+
+def test_change_state_converge_changed_tasks(state_instance):
+    state_instance.change_state('converge_changed_tasks', ['foo'])
+
+    assert ['foo'] == state_instance.converge_changed_tasks
+
+
 def test_change_state_created(state_instance):
     state_instance.change_state('created', True)
 
@@ -92,6 +151,65 @@ def test_change_state_driver(state_instance):
     assert 'foo' == state_instance.driver
 
 
+def test_change_state_snapshotted(state_instance):
+    state_instance.change_state('snapshotted', True)
+
+    assert state_instance.snapshotted
+
+
+def test_change_state_persists(state_instance):
+    state_instance.change_state('created', True)
+    data = util.safe_load_file(state_instance.state_file)
+
+    assert data['created']
+
+
+def test_change_state_applies_to_latest_state(state_instance):
+    data = state_instance._default_data()
+    data['driver'] = 'docker'
+    util.write_file(state_instance.state_file, util.safe_dump(data))
+    state_instance.change_state('created', True)
+    data = util.safe_load_file(state_instance.state_file)
+
+    assert 'docker' == state_instance.driver
+    assert 'docker' == data['driver']
+    assert data['created']
+
+
+def test_batch_writes_state_file_once(mocker, state_instance):
+    m = mocker.patch('molecule.state.State._write_state_file')
+    with state_instance.batch():
+        state_instance.change_state('created', True)
+        state_instance.change_state('converged', True)
+
+    m.assert_called_once_with()
+    assert state_instance.created
+    assert state_instance.converged
+
+
+def test_batch_does_not_write_state_file_when_raising(mocker, state_instance):
+    m = mocker.patch('molecule.state.State._write_state_file')
+    with pytest.raises(state.InvalidState):
+        with state_instance.batch():
+            state_instance.change_state('created', True)
+            state_instance.change_state('invalid-state', True)
+
+    assert not m.called
+
+
+def test_write_state_file_replaces_state_file(state_instance):
+    state_instance._data['created'] = True
+    state_instance._write_state_file()
+    directory = os.path.dirname(state_instance.state_file)
+
+    assert ['state.yml'] == [
+        f for f in os.listdir(directory) if f.startswith(('state', '.state'))
+    ]
+    with open(state_instance.state_file) as stream:
+        assert stream.read().startswith('# Molecule managed\n')
+    assert util.safe_load_file(state_instance.state_file)['created']
+
+
 def test_change_state_raises(state_instance):
     with pytest.raises(state.InvalidState):
         state_instance.change_state('invalid-state', True)
@@ -116,3 +234,15 @@ def test_get_data_loads_existing_state_file(temp_dir, molecule_data):
     assert not s.converged
     assert s.created
     assert not s.driver
+
+
+def test_change_state_invalidates_dependent_components(state_instance):
+    c = state_instance._config
+    driver = c.driver
+    state_instance.change_state('converged', True)
+
+    assert driver is c.driver
+
+    state_instance.change_state('created', True)
+
+    assert driver is not c.driver
@@ -177,6 +177,48 @@ def test_os_walk(temp_dir):
     assert 3 == len(result)
 
 
+def test_fingerprint(temp_dir):
+    directory = os.path.join(temp_dir.strpath, 'foo')
+    excluded_directory = os.path.join(directory, 'excluded')
+    os.makedirs(excluded_directory)
+    foo_file = os.path.join(directory, 'foo.yml')
+    util.write_file(foo_file, 'foo')
+    excluded_file = os.path.join(excluded_directory, 'excluded.yml')
+    util.write_file(excluded_file, 'excluded')
+    missing_file = os.path.join(temp_dir.strpath, 'missing.yml')
+
+    paths = [directory, foo_file, missing_file]
+    x = util.fingerprint(paths, ['excluded'])
+
+    assert x == util.fingerprint(paths, ['excluded'])
+    assert x == util.fingerprint(paths, [excluded_directory])
+
+    util.write_file(excluded_file, 'changed')
+    assert x == util.fingerprint(paths, ['excluded'])
+    assert x != util.fingerprint(paths)
+
+    util.write_file(foo_file, 'changed')
+    assert x != util.fingerprint(paths, ['excluded'])
+
+
+def test_fingerprint_digests_symlinked_directory_targets(temp_dir):
+    directory = os.path.join(temp_dir.strpath, 'foo')
+    v1 = os.path.join(temp_dir.strpath, 'v1')
+    v2 = os.path.join(temp_dir.strpath, 'v2')
+    for d in [directory, v1, v2]:
+        os.makedirs(d)
+    link = os.path.join(directory, 'role')
+    os.symlink(v1, link)
+    x = util.fingerprint([directory])
+
+    os.remove(link)
+    os.symlink(v2, link)
+    assert x != util.fingerprint([directory])
+
+    os.remove(link)
+    assert x != util.fingerprint([directory])
+
+
 def test_render_template():
     template = "{{ foo }} = {{ bar }}"
 
@@ -194,10 +236,29 @@ def test_write_file(temp_dir):
     assert x == data
 
 
-def molecule_prepender(content):
+def test_write_file_does_not_write_unchanged_file(mocker, temp_dir):
+    dest_file = os.path.join(temp_dir.strpath, 'test_util_write_file.tmp')
+    util.write_file(dest_file, 'foo bar')
+    m = mocker.patch('molecule.util.open_file', wraps=util.open_file)
+    util.write_file(dest_file, 'foo bar')
+
+    m.assert_called_once_with(dest_file)
+
+
+def test_write_file_writes_changed_file(temp_dir):
+    dest_file = os.path.join(temp_dir.strpath, 'test_util_write_file.tmp')
+    util.write_file(dest_file, 'foo bar')
+    util.write_file(dest_file, 'foo')
+    with util.open_file(dest_file) as stream:
+        data = stream.read()
+
+    assert '# Molecule managed\n\nfoo' == data
+
+
+def test_molecule_prepender():
     x = '# Molecule managed\n\nfoo bar'
 
-    assert x == util.file_prepender('foo bar')
+    assert x == util.molecule_prepender('foo bar')
 
 
 def test_safe_dump():
@@ -100,6 +100,20 @@ def test_default_options_property_updates_sudo(
     assert x == testinfra_instance.default_options
 
 
+def test_default_options_property_updates_parallel(inventory_file,
+                                                   testinfra_instance):
+    testinfra_instance._config.config['verifier']['parallel'] = True
+    x = {
+        'connection': 'ansible',
+        'ansible-inventory': inventory_file,
+        'hosts': 'instance-1,instance-2',
+        'n': 2,
+        'junit-xml': testinfra_instance.junit_xml_file,
+    }
+
+    assert x == testinfra_instance.default_options
+
+
 def test_default_env_property(testinfra_instance):
     assert 'MOLECULE_FILE' in testinfra_instance.default_env
     assert 'MOLECULE_INVENTORY_FILE' in testinfra_instance.default_env
@@ -116,6 +130,17 @@ def test_additional_files_or_dirs_property(testinfra_instance):
     assert x == testinfra_instance.additional_files_or_dirs
 
 
+def test_parallel_property(testinfra_instance):
+    assert not testinfra_instance.parallel
+
+
+def test_junit_xml_file_property(testinfra_instance):
+    x = os.path.join(testinfra_instance._config.scenario.ephemeral_directory,
+                     'testinfra.xml')
+
+    assert x == testinfra_instance.junit_xml_file
+
+
 def test_env_property(testinfra_instance):
     assert 'bar' == testinfra_instance.env['foo']
     assert 'ANSIBLE_CONFIG' in testinfra_instance.env
@@ -269,6 +294,46 @@ def test_does_not_execute_without_tests(
     patched_logger_warn.assert_called_once_with(msg)
 
 
+def test_does_not_execute_in_parallel_without_hosts(
+        mocker, patched_run_command, patched_logger_warn,
+        patched_testinfra_get_tests, testinfra_instance):
+    testinfra_instance._config.config['verifier']['parallel'] = True
+    m = mocker.patch('molecule.verifier.testinfra.Testinfra._get_hosts')
+    m.return_value = []
+    testinfra_instance.execute()
+
+    assert not patched_run_command.called
+
+    msg = 'Skipping, no hosts found in the inventory.'
+    patched_logger_warn.assert_called_once_with(msg)
+
+
+def test_execute_in_parallel_exits_without_xdist(
+        mocker, patched_run_command, patched_logger_critical,
+        patched_testinfra_get_tests, testinfra_instance):
+    testinfra_instance._config.config['verifier']['parallel'] = True
+    mocker.patch('molecule.verifier.testinfra._has_xdist', return_value=False)
+    with pytest.raises(SystemExit) as e:
+        testinfra_instance.execute()
+
+    assert 1 == e.value.code
+    assert not patched_run_command.called
+
+    msg = ("The verifier's `parallel` option requires pytest-xdist.  Please "
+           'install it with `pip install molecule[parallel]`.')
+    patched_logger_critical.assert_called_once_with(msg)
+
+
+def test_execute_in_parallel(mocker, patched_run_command,
+                             patched_testinfra_get_tests, testinfra_instance):
+    testinfra_instance._config.config['verifier']['parallel'] = True
+    mocker.patch('molecule.verifier.testinfra._has_xdist', return_value=True)
+    testinfra_instance._testinfra_command = 'patched-command'
+    testinfra_instance.execute()
+
+    patched_run_command.assert_called_once_with('patched-command', debug=False)
+
+
 def test_execute_bakes(patched_run_command, patched_testinfra_get_tests,
                        testinfra_instance):
     testinfra_instance.execute()
@@ -286,3 +351,9 @@ def test_executes_catches_and_exits_return_code(
         testinfra_instance.execute()
 
     assert 1 == e.value.code
+
+
+def test_get_hosts(testinfra_instance):
+    x = ['instance-1', 'instance-2']
+
+    assert x == testinfra_instance._get_hosts()